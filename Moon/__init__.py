@@ -1,9 +1,6 @@
 import os
 import sys
 
-if not os.path.exists(r"Moon\dlls\PySGL.dll") or not os.path.exists(r"Moon\src\PySGL.cpp"):
-    os.system(r'python PySGL\build.py')
-
 
 if sys.platform == 'win32':
     DLL_OUTPUT_PATH = r"Moon\libs\Moon.dll"
@@ -17,5 +14,5 @@ elif sys.platform == 'linux':
     DLL_MODULE_FOUND_PATH = r"../dlls/Moon.so"
 
 if os.name != 'nt':  # Only for Windows
-    from colorama import Fore
-    print(f"[ {Fore.RED}Error{Fore.RESET} ] Moon framework is not support ({os.name}) system.")
+    from Moon.python.Log import get_logger
+    get_logger("Machine").warning("Moon framework is not fully supported on (%s) system.", os.name)
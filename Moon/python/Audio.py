@@ -31,6 +31,9 @@
   - SoundBuffer - работа с аудиоданными
   - Sound - управление воспроизведением
   - MultiSound - многоканальное звучание
+  - AudioMixer - общий пул голосов с приоритетами и вытеснением
+  - Music - потоковое воспроизведение длинных треков с точками цикла
+  - MusicPlayer - фоновая музыка с плавной сменой треков
   - SoundEventListener - обработка событий
 
 ---
@@ -70,17 +73,15 @@ Copyright (c) 2025 Pavlov Ivan
 """
 
 import ctypes
-from typing import final
+import math
+from typing import Final, final
 
 from Moon.python.Types import *
 
-from Moon.python.utils import find_library
+from Moon.python.utils import get_native_library
 
-# Загружаем DLL библиотеку
-try:
-    LIB_MOON = ctypes.CDLL(find_library())
-except Exception as e:
-    raise ImportError(f"Failed to load Moon library: {e}")
+# Общий дескриптор нативной библиотеки (загружается при первом вызове нативной функции)
+LIB_MOON = get_native_library()
 
 # Тип указателя на звуковой буфер ====== +
 SoundBufferPtr = ctypes.c_void_p         #
@@ -95,6 +96,8 @@ LIB_MOON._SoundBuffer_GetChannelsCount.argtypes = [SoundBufferPtr]
 LIB_MOON._SoundBuffer_GetChannelsCount.restype = ctypes.c_int
 LIB_MOON._SoundBuffer_GetSampleRate.argtypes = [SoundBufferPtr]
 LIB_MOON._SoundBuffer_GetSampleRate.restype = ctypes.c_int
+LIB_MOON._SoundBuffer_GetSampleCount.argtypes = [SoundBufferPtr]
+LIB_MOON._SoundBuffer_GetSampleCount.restype = ctypes.c_ulonglong
 
 @final
 class SoundBuffer:
@@ -185,6 +188,25 @@ class SoundBuffer:
         """
         return LIB_MOON._SoundBuffer_GetSampleRate(self.__ptr)
 
+    @final
+    def get_sample_count(self) -> int:
+        """
+        #### Возвращает общее количество сэмплов во всех каналах
+
+        ---
+
+        :Returns:
+        - int: Количество 16-битных сэмплов (0, если файл не загрузился)
+
+        ---
+
+        :Example:
+        ```python
+        size_in_bytes = buffer.get_sample_count() * 2
+        ```
+        """
+        return LIB_MOON._SoundBuffer_GetSampleCount(self.__ptr)
+
     @final
     def get_ptr(self) -> SoundBufferPtr | None:
         """
@@ -264,6 +286,15 @@ LIB_MOON._Sound_SetRelativeToListener.argtypes = [SoundPtr, ctypes.c_bool]
 LIB_MOON._Sound_SetRelativeToListener.restype = None
 LIB_MOON._Sound_GetStatus.argtypes = [SoundPtr]
 LIB_MOON._Sound_GetStatus.restype = ctypes.c_int
+LIB_MOON._Sound_CreateEmpty.argtypes = []
+LIB_MOON._Sound_CreateEmpty.restype = SoundPtr
+LIB_MOON._Sound_SetBuffer.argtypes = [SoundPtr, SoundBufferPtr]
+LIB_MOON._Sound_SetBuffer.restype = None
+LIB_MOON._Sound_Start.argtypes = [SoundPtr, SoundBufferPtr, ctypes.c_float, ctypes.c_float, ctypes.c_bool,
+                                  ctypes.c_bool, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+LIB_MOON._Sound_Start.restype = None
+LIB_MOON._Sound_GetStatuses.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_int, ctypes.POINTER(ctypes.c_int)]
+LIB_MOON._Sound_GetStatuses.restype = None
 
 @final
 class AudioStatus(Enum):
@@ -277,9 +308,10 @@ class AudioStatus(Enum):
     - PAUSED: Звук приостановлен
     - PLAYING: Звук воспроизводится
     """
-    STOPPED = auto()
-    PAUSED = auto()
-    PLAYING = auto()
+    # Значения совпадают с sf::SoundSource::Status
+    STOPPED = 0
+    PAUSED = 1
+    PLAYING = 2
 
 @final
 class Sound:
@@ -1243,3 +1275,825 @@ class MultiSound:
         - list[Sound]: Список всех звуков (каналов)
         """
         return self.__sounds
+
+
+# ////////////////////////////////////////////////////////////////////////////
+# Параметры пула голосов AudioMixer
+# OpenAL ограничивает число одновременных источников (обычно 256, на части
+# систем 32), поэтому пул по умолчанию заметно меньше этого предела
+# ////////////////////////////////////////////////////////////////////////////
+DEFAULT_MIXER_VOICES: Final[int] = 32
+DEFAULT_VOICE_PRIORITY: Final[int] = 0
+DEFAULT_VOICE_VOLUME: Final[float] = 100.0
+
+# Статусы sf::SoundSource в виде чисел для пакетного опроса
+_STATUS_STOPPED: Final[int] = AudioStatus.STOPPED.value
+
+
+@final
+class VoiceHandle:
+    """
+    #### Ссылка на голос, выданный AudioMixer.play()
+
+    ---
+
+    :Description:
+    - Позволяет управлять звуком, пока голос принадлежит ему
+    - Если голос был вытеснен или освобожден, методы ничего не делают,
+      а is_active() возвращает False
+
+    ---
+
+    :Example:
+    ```python
+    engine = mixer.play(engine_buffer, priority=5, loop=True)
+    ...
+    engine.set_pitch(1.0 + speed / 500)
+    ```
+    """
+
+    __slots__ = ("__mixer", "__index", "__generation")
+
+    def __init__(self, mixer: "AudioMixer", index: int, generation: int) -> None:
+        self.__mixer = mixer
+        self.__index = index
+        self.__generation = generation
+
+    def get_index(self) -> int:
+        return self.__index
+
+    def is_active(self) -> bool:
+        """
+        #### Проверяет, что голос все еще воспроизводит этот звук
+        """
+        return self.__mixer._owns(self.__index, self.__generation)
+
+    def stop(self) -> Self:
+        if self.is_active():
+            self.__mixer._release(self.__index, stop=True)
+        return self
+
+    def set_volume(self, volume: float) -> Self:
+        if self.is_active():
+            self.__mixer._set_volume(self.__index, volume)
+        return self
+
+    def set_pitch(self, pitch: float) -> Self:
+        if self.is_active():
+            LIB_MOON._Sound_SetPitch(self.__mixer._voice_ptr(self.__index), pitch)
+        return self
+
+    def set_position(self, x: float, y: float, z: float = 0.0) -> Self:
+        if self.is_active():
+            LIB_MOON._Sound_SetPosition(self.__mixer._voice_ptr(self.__index), float(x), float(y), float(z))
+        return self
+
+
+@final
+class AudioMixer:
+    """
+    #### Общий пул нативных источников звука с приоритетами
+
+    ---
+
+    :Description:
+    - Владеет ограниченным числом источников (голосов), создаваемых по мере надобности
+    - play() занимает свободный голос; если свободных нет, вытесняет голос
+      с наименьшим приоритетом, среди них - самый тихий, затем самый старый
+    - Голос с более высоким приоритетом, чем у нового звука, не вытесняется:
+      в этом случае play() возвращает None
+    - Закончившиеся голоса освобождаются автоматически: статусы всех голосов
+      читаются одним нативным вызовом, когда свободные голоса закончились
+      (или в update())
+    - Сотни одновременных выстрелов стоят фиксированное число источников
+
+    ---
+
+    :Args:
+    - max_voices (int): Максимальное число одновременно звучащих источников
+
+    ---
+
+    :Example:
+    ```python
+    mixer = get_audio_mixer()
+    shot = SoundBuffer("sounds/shot.wav")
+
+    for bullet in fired_this_frame:
+        mixer.play(shot, priority=1, position=(bullet.x, bullet.y), volume=60)
+
+    mixer.play(alarm_buffer, priority=10)  # Всегда звучит, вытесняя выстрелы
+    ```
+    """
+
+    __slots__ = ("__max_voices", "__ptrs", "__ptr_array", "__status_array", "__buffers", "__priorities",
+                 "__volumes", "__started", "__generations", "__free", "__serial",
+                 "__played_count", "__stolen_count", "__rejected_count", "__reclaimed_count")
+
+    def __init__(self, max_voices: int = DEFAULT_MIXER_VOICES) -> None:
+        if max_voices < 1:
+            raise ValueError(f"max_voices must be at least 1, got {max_voices}")
+        self.__max_voices: int = max_voices
+
+        # Голоса создаются лениво: пустой микшер не создает нативных объектов
+        self.__ptrs: list[SoundPtr] = []
+        self.__ptr_array = None
+        self.__status_array = None
+
+        # Состояние голосов (параллельные списки по индексу голоса)
+        self.__buffers: list[SoundBuffer | None] = []
+        self.__priorities: list[int] = []
+        self.__volumes: list[float] = []
+        self.__started: list[int] = []
+        self.__generations: list[int] = []
+        self.__free: list[int] = []
+
+        self.__serial: int = 0
+        self.__played_count: int = 0
+        self.__stolen_count: int = 0
+        self.__rejected_count: int = 0
+        self.__reclaimed_count: int = 0
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Воспроизведение
+    # ////////////////////////////////////////////////////////////////////////
+
+    def play(self, buffer: SoundBuffer,
+             priority: int = DEFAULT_VOICE_PRIORITY,
+             position: tuple[float, float] | tuple[float, float, float] | None = None,
+             volume: float = DEFAULT_VOICE_VOLUME,
+             pitch: float = 1.0,
+             loop: bool = False) -> VoiceHandle | None:
+        """
+        #### Воспроизводит буфер на свободном или вытесненном голосе
+
+        ---
+
+        :Args:
+        - buffer (SoundBuffer): Звуковые данные
+        - priority (int): Приоритет (больше - важнее)
+        - position (tuple | None): Позиция (x, y) или (x, y, z) в мире;
+          None - звук без позиционирования (относительно слушателя, в центре)
+        - volume (float): Громкость 0-100, также используется для выбора вытесняемого голоса
+        - pitch (float): Высота тона
+        - loop (bool): Зациклить звук (голос не освободится сам)
+
+        ---
+
+        :Returns:
+        - VoiceHandle | None: Ссылка на голос или None, если все голоса заняты
+          звуками с более высоким приоритетом
+        """
+        index = self.__acquire(priority, volume)
+        if index is None:
+            self.__rejected_count += 1
+            return None
+
+        if position is None:
+            relative, x, y, z = True, 0.0, 0.0, 0.0
+        else:
+            relative = False
+            x, y = position[0], position[1]
+            z = position[2] if len(position) > 2 else 0.0
+
+        LIB_MOON._Sound_Start(self.__ptrs[index], buffer.get_ptr(), volume, pitch, loop,
+                              relative, float(x), float(y), float(z))
+
+        self.__serial += 1
+        self.__buffers[index] = buffer
+        self.__priorities[index] = priority
+        self.__volumes[index] = volume
+        self.__started[index] = self.__serial
+        # Поколение - номер запуска: он не повторяется даже после destroy()
+        self.__generations[index] = self.__serial
+        self.__played_count += 1
+        return VoiceHandle(self, index, self.__generations[index])
+
+    def __acquire(self, priority: int, volume: float) -> int | None:
+        if self.__free:
+            return self.__free.pop()
+        if len(self.__ptrs) < self.__max_voices:
+            return self.__create_voice()
+        if self.update():
+            return self.__free.pop()
+
+        # Все голоса звучат: ищем наименее важный (приоритет, громкость, возраст)
+        victim = min(range(len(self.__ptrs)),
+                     key=lambda i: (self.__priorities[i], self.__volumes[i], self.__started[i]))
+        victim_priority = self.__priorities[victim]
+        if victim_priority > priority or (victim_priority == priority and self.__volumes[victim] > volume):
+            return None
+        self.__stolen_count += 1
+        # _Sound_Start сам останавливает голос перед сменой буфера
+        self.__buffers[victim] = None
+        return victim
+
+    def __create_voice(self) -> int:
+        ptr = LIB_MOON._Sound_CreateEmpty()
+        self.__ptrs.append(ptr)
+        self.__buffers.append(None)
+        self.__priorities.append(DEFAULT_VOICE_PRIORITY)
+        self.__volumes.append(0.0)
+        self.__started.append(0)
+        self.__generations.append(0)
+        # Массивы для пакетного опроса статусов пересобираются при росте пула
+        self.__ptr_array = None
+        return len(self.__ptrs) - 1
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Освобождение голосов
+    # ////////////////////////////////////////////////////////////////////////
+
+    def update(self) -> int:
+        """
+        #### Освобождает закончившиеся голоса
+
+        ---
+
+        :Description:
+        - Статусы всех голосов читаются одним нативным вызовом
+        - Вызывается автоматически, когда в play() не осталось свободных голосов;
+          можно вызывать раз в кадр, чтобы счетчики были актуальны
+
+        ---
+
+        :Returns:
+        - int: Число освобожденных голосов
+        """
+        count = len(self.__ptrs)
+        if not count:
+            return 0
+        if self.__ptr_array is None:
+            self.__ptr_array = (ctypes.c_void_p * count)(*self.__ptrs)
+            self.__status_array = (ctypes.c_int * count)()
+        LIB_MOON._Sound_GetStatuses(self.__ptr_array, count, self.__status_array)
+
+        reclaimed = 0
+        busy = self.__buffers
+        statuses = self.__status_array
+        for index in range(count):
+            if busy[index] is not None and statuses[index] == _STATUS_STOPPED:
+                self._release(index, stop=False)
+                reclaimed += 1
+        self.__reclaimed_count += reclaimed
+        return reclaimed
+
+    def stop_all(self) -> Self:
+        for index in range(len(self.__ptrs)):
+            if self.__buffers[index] is not None:
+                self._release(index, stop=True)
+        return self
+
+    def _release(self, index: int, stop: bool) -> None:
+        if stop:
+            LIB_MOON._Sound_Stop(self.__ptrs[index])
+        self.__buffers[index] = None
+        self.__generations[index] = 0
+        self.__free.append(index)
+
+    def _owns(self, index: int, generation: int) -> bool:
+        # После destroy() списки пусты: устаревшие VoiceHandle остаются неактивными
+        return (index < len(self.__generations) and self.__generations[index] == generation
+                and self.__buffers[index] is not None)
+
+    def _voice_ptr(self, index: int) -> SoundPtr:
+        return self.__ptrs[index]
+
+    def _set_volume(self, index: int, volume: float) -> None:
+        self.__volumes[index] = volume
+        LIB_MOON._Sound_SetVolume(self.__ptrs[index], volume)
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Настройки и счетчики
+    # ////////////////////////////////////////////////////////////////////////
+
+    def get_max_voices(self) -> int:
+        return self.__max_voices
+
+    def get_voice_count(self) -> int:
+        """
+        #### Число созданных нативных источников (не больше max_voices)
+        """
+        return len(self.__ptrs)
+
+    def get_active_count(self) -> int:
+        """
+        #### Число занятых голосов (по состоянию на последний play()/update())
+        """
+        return len(self.__ptrs) - len(self.__free)
+
+    def get_played_count(self) -> int:
+        return self.__played_count
+
+    def get_stolen_count(self) -> int:
+        """
+        #### Сколько раз звучащий голос был вытеснен новым звуком
+        """
+        return self.__stolen_count
+
+    def get_rejected_count(self) -> int:
+        """
+        #### Сколько вызовов play() не получили голос из-за более важных звуков
+        """
+        return self.__rejected_count
+
+    def get_reclaimed_count(self) -> int:
+        return self.__reclaimed_count
+
+    def destroy(self) -> None:
+        """
+        #### Останавливает и удаляет все нативные источники
+        """
+        for ptr in self.__ptrs:
+            LIB_MOON._Sound_Destroy(ptr)
+        self.__ptrs.clear()
+        self.__buffers.clear()
+        self.__priorities.clear()
+        self.__volumes.clear()
+        self.__started.clear()
+        self.__generations.clear()
+        self.__free.clear()
+        self.__ptr_array = None
+        self.__status_array = None
+
+
+# Общий микшер приложения (нативные источники создаются при первом play())
+AUDIO_MIXER: Final[AudioMixer] = AudioMixer()
+
+
+def get_audio_mixer() -> AudioMixer:
+    """
+    #### Возвращает общий микшер звуков
+    """
+    return AUDIO_MIXER
+
+
+# Тип указателя на потоковую музыку ===== +
+MusicPtr = ctypes.c_void_p                #
+# ======================================= +
+
+LIB_MOON._Music_Create.argtypes = [ctypes.c_char_p]
+LIB_MOON._Music_Create.restype = MusicPtr
+LIB_MOON._Music_Destroy.argtypes = [MusicPtr]
+LIB_MOON._Music_Destroy.restype = None
+LIB_MOON._Music_Play.argtypes = [MusicPtr]
+LIB_MOON._Music_Play.restype = None
+LIB_MOON._Music_Pause.argtypes = [MusicPtr]
+LIB_MOON._Music_Pause.restype = None
+LIB_MOON._Music_Stop.argtypes = [MusicPtr]
+LIB_MOON._Music_Stop.restype = None
+LIB_MOON._Music_SetLoop.argtypes = [MusicPtr, ctypes.c_bool]
+LIB_MOON._Music_SetLoop.restype = None
+LIB_MOON._Music_SetVolume.argtypes = [MusicPtr, ctypes.c_float]
+LIB_MOON._Music_SetVolume.restype = None
+LIB_MOON._Music_SetPitch.argtypes = [MusicPtr, ctypes.c_float]
+LIB_MOON._Music_SetPitch.restype = None
+LIB_MOON._Music_SetAttenuation.argtypes = [MusicPtr, ctypes.c_float]
+LIB_MOON._Music_SetAttenuation.restype = None
+LIB_MOON._Music_GetStatus.argtypes = [MusicPtr]
+LIB_MOON._Music_GetStatus.restype = ctypes.c_int
+LIB_MOON._Music_GetDuration.argtypes = [MusicPtr]
+LIB_MOON._Music_GetDuration.restype = ctypes.c_float
+LIB_MOON._Music_GetPlayingOffset.argtypes = [MusicPtr]
+LIB_MOON._Music_GetPlayingOffset.restype = ctypes.c_float
+LIB_MOON._Music_SetPlayingOffset.argtypes = [MusicPtr, ctypes.c_float]
+LIB_MOON._Music_SetPlayingOffset.restype = None
+LIB_MOON._Music_SetLoopPoints.argtypes = [MusicPtr, ctypes.c_float, ctypes.c_float]
+LIB_MOON._Music_SetLoopPoints.restype = None
+LIB_MOON._Music_GetLoopPoints.argtypes = [MusicPtr, ctypes.POINTER(ctypes.c_float)]
+LIB_MOON._Music_GetLoopPoints.restype = None
+LIB_MOON._Music_SetRelativeToListener.argtypes = [MusicPtr, ctypes.c_bool]
+LIB_MOON._Music_SetRelativeToListener.restype = None
+LIB_MOON._Music_GetChannelsCount.argtypes = [MusicPtr]
+LIB_MOON._Music_GetChannelsCount.restype = ctypes.c_int
+LIB_MOON._Music_GetSampleRate.argtypes = [MusicPtr]
+LIB_MOON._Music_GetSampleRate.restype = ctypes.c_int
+
+
+@final
+class Music:
+    """
+    #### Потоковое воспроизведение длинных треков
+
+    ---
+
+    :Description:
+    - В отличие от SoundBuffer файл не декодируется целиком: sf::Music читает
+      его небольшими порциями в собственном аудиопотоке
+    - Память не зависит от длины трека, воспроизведение начинается сразу
+    - Музыка по умолчанию не позиционируется (звучит относительно слушателя)
+    - Поддерживает точки цикла: после вступления повторяется только выбранный участок
+
+    ---
+
+    :Formats:
+    - WAV
+    - OGG
+    - FLAC
+    - MP3
+
+    ---
+
+    :Example:
+    ```python
+    theme = Music("music/theme.ogg")
+    theme.set_loop_points(12.5).set_loop(True).set_volume(70).play()
+    ```
+    """
+
+    __slots__ = ("__path", "__ptr", "__loop", "__volume", "__gain", "__pitch", "__loop_buffer")
+
+    def __init__(self, path: str) -> None:
+        """
+        #### Открывает поток из файла
+
+        ---
+
+        :Args:
+        - path (str): Путь к аудиофайлу
+
+        ---
+
+        :Raises:
+        - RuntimeError: Если файл не удалось открыть
+        """
+        self.__path = path
+        self.__ptr: MusicPtr | None = LIB_MOON._Music_Create(path.encode('utf-8'))
+        if not self.__ptr:
+            self.__ptr = None
+            raise RuntimeError(f"Failed to open music stream: {path}")
+
+        self.__loop:   bool = False
+        self.__volume: float = 100.0
+        self.__gain:   float = 1.0
+        self.__pitch:  float = 1.0
+        self.__loop_buffer = (ctypes.c_float * 2)()
+        LIB_MOON._Music_SetRelativeToListener(self.__ptr, True)
+
+    @final
+    def destroy(self) -> None:
+        """
+        #### Останавливает поток и освобождает нативный объект
+        """
+        if self.__ptr is not None:
+            LIB_MOON._Music_Destroy(self.__ptr)
+            self.__ptr = None
+
+    def __del__(self) -> None:
+        self.destroy()
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Воспроизведение
+    # ////////////////////////////////////////////////////////////////////////
+
+    @final
+    def play(self) -> Self:
+        LIB_MOON._Music_Play(self.__ptr)
+        return self
+
+    @final
+    def pause(self) -> Self:
+        LIB_MOON._Music_Pause(self.__ptr)
+        return self
+
+    @final
+    def stop(self) -> Self:
+        """
+        #### Останавливает воспроизведение и перематывает в начало
+        """
+        LIB_MOON._Music_Stop(self.__ptr)
+        return self
+
+    @final
+    def get_status(self) -> AudioStatus:
+        return AudioStatus(LIB_MOON._Music_GetStatus(self.__ptr))
+
+    @final
+    def is_playing(self) -> bool:
+        return LIB_MOON._Music_GetStatus(self.__ptr) == AudioStatus.PLAYING.value
+
+    @final
+    def is_paused(self) -> bool:
+        return LIB_MOON._Music_GetStatus(self.__ptr) == AudioStatus.PAUSED.value
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Время и точки цикла
+    # ////////////////////////////////////////////////////////////////////////
+
+    @final
+    def get_duration(self) -> float:
+        """
+        #### Возвращает длительность трека в секундах
+        """
+        return LIB_MOON._Music_GetDuration(self.__ptr)
+
+    @final
+    def get_playing_offset(self) -> float:
+        """
+        #### Возвращает текущую позицию воспроизведения в секундах
+        """
+        return LIB_MOON._Music_GetPlayingOffset(self.__ptr)
+
+    @final
+    def set_playing_offset(self, seconds: float) -> Self:
+        """
+        #### Перематывает поток на указанную позицию в секундах
+        """
+        LIB_MOON._Music_SetPlayingOffset(self.__ptr, max(0.0, seconds))
+        return self
+
+    @final
+    def set_loop(self, loop: bool) -> Self:
+        """
+        #### Включает повтор (участка между точками цикла, по умолчанию всего трека)
+        """
+        self.__loop = loop
+        LIB_MOON._Music_SetLoop(self.__ptr, loop)
+        return self
+
+    @final
+    def get_loop(self) -> bool:
+        return self.__loop
+
+    @final
+    def set_loop_points(self, start: float, end: float | None = None) -> Self:
+        """
+        #### Устанавливает повторяемый участок трека
+
+        ---
+
+        :Description:
+        - Трек играет с начала, а по достижении end возвращается к start
+        - Работает только при включенном set_loop(True)
+
+        ---
+
+        :Args:
+        - start (float): Начало участка в секундах
+        - end (float | None): Конец участка в секундах (None - конец трека)
+
+        ---
+
+        :Raises:
+        - ValueError: Если участок пустой
+
+        ---
+
+        :Example:
+        ```python
+        # Вступление 0-8 с звучит один раз, затем повторяется 8-64 с
+        battle.set_loop_points(8.0, 64.0).set_loop(True).play()
+        ```
+        """
+        if end is None:
+            end = self.get_duration()
+        if end <= start:
+            raise ValueError(f"Loop end ({end}) must be greater than start ({start})")
+        LIB_MOON._Music_SetLoopPoints(self.__ptr, max(0.0, start), end - max(0.0, start))
+        return self
+
+    @final
+    def get_loop_points(self) -> tuple[float, float]:
+        """
+        #### Возвращает повторяемый участок (начало, конец) в секундах
+        """
+        LIB_MOON._Music_GetLoopPoints(self.__ptr, self.__loop_buffer)
+        start, length = self.__loop_buffer
+        return start, start + length
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Громкость и высота тона
+    # ////////////////////////////////////////////////////////////////////////
+
+    @final
+    def set_volume(self, volume: float) -> Self:
+        """
+        #### Устанавливает громкость трека (0-100)
+        """
+        self.__volume = volume
+        LIB_MOON._Music_SetVolume(self.__ptr, volume * self.__gain)
+        return self
+
+    @final
+    def get_volume(self) -> float:
+        return self.__volume
+
+    @final
+    def _set_gain(self, gain: float) -> None:
+        # Множитель громкости, которым управляет MusicPlayer (затухание, общая громкость)
+        if gain != self.__gain:
+            self.__gain = gain
+            LIB_MOON._Music_SetVolume(self.__ptr, self.__volume * gain)
+
+    @final
+    def set_pitch(self, pitch: float) -> Self:
+        """
+        #### Устанавливает высоту тона (меняет и скорость воспроизведения)
+        """
+        self.__pitch = pitch
+        LIB_MOON._Music_SetPitch(self.__ptr, pitch)
+        return self
+
+    @final
+    def get_pitch(self) -> float:
+        return self.__pitch
+
+    @final
+    def set_attenuation(self, attenuation: float) -> Self:
+        LIB_MOON._Music_SetAttenuation(self.__ptr, attenuation)
+        return self
+
+    @final
+    def set_relative_to_listener(self, relative: bool) -> Self:
+        LIB_MOON._Music_SetRelativeToListener(self.__ptr, relative)
+        return self
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Свойства потока
+    # ////////////////////////////////////////////////////////////////////////
+
+    @final
+    def get_sample_rate(self) -> int:
+        return LIB_MOON._Music_GetSampleRate(self.__ptr)
+
+    @final
+    def get_channels_count(self) -> int:
+        return LIB_MOON._Music_GetChannelsCount(self.__ptr)
+
+    @final
+    def get_path(self) -> str:
+        return self.__path
+
+    @final
+    def get_ptr(self) -> MusicPtr | None:
+        """
+        #### Возвращает указатель на нативный поток (для внутреннего использования в Moon)
+        """
+        return self.__ptr
+
+
+# ////////////////////////////////////////////////////////////////////////////
+# Параметры плавной смены треков
+# ////////////////////////////////////////////////////////////////////////////
+DEFAULT_CROSSFADE_TIME: Final[float] = 1.5     # Длительность перехода между треками (секунды)
+
+
+@final
+class MusicPlayer:
+    """
+    #### Фоновая музыка с плавными переходами между треками
+
+    ---
+
+    :Description:
+    - play(track, fade) запускает новый трек с нарастанием громкости,
+      а предыдущий одновременно затухает (кроссфейд)
+    - Используется равномощная кривая (cos/sin): общая громкость
+      не проседает в середине перехода
+    - Затухший трек останавливается; его поток больше не читает файл
+    - update(dt) вызывается раз в кадр; без активного перехода он почти ничего не стоит
+    - Общая громкость музыки применяется ко всем трекам поверх их собственной
+
+    ---
+
+    :Example:
+    ```python
+    player = get_music_player()
+    player.play(Music("music/explore.ogg").set_loop(True))
+
+    # При входе в бой
+    player.play(battle_music, fade=0.75)
+
+    # В игровом цикле
+    player.update(dt)
+    ```
+    """
+
+    __slots__ = ("__current", "__fade_in", "__fading_out", "__master_volume")
+
+    def __init__(self) -> None:
+        self.__current: Music | None = None
+        # Нарастание текущего трека: [прошло, длительность]
+        self.__fade_in: list[float] = [0.0, 0.0]
+        # Затухающие треки: [трек, прошло, длительность, начальная доля громкости]
+        self.__fading_out: list[list] = []
+        self.__master_volume: float = 1.0
+
+    def play(self, music: Music, fade: float = DEFAULT_CROSSFADE_TIME, restart: bool = True) -> Self:
+        """
+        #### Переключает фоновую музыку на трек
+
+        ---
+
+        :Args:
+        - music (Music): Новый трек
+        - fade (float): Длительность кроссфейда в секундах (0 - мгновенно)
+        - restart (bool): Начать трек сначала (False - продолжить с текущей позиции)
+        """
+        if music is self.__current:
+            if not music.is_playing():
+                music.play()
+            return self
+
+        self.__fade_out_current(fade)
+        self.__fading_out = [entry for entry in self.__fading_out if entry[0] is not music]
+
+        self.__current = music
+        self.__fade_in[0] = 0.0
+        self.__fade_in[1] = max(0.0, fade)
+        if restart:
+            music.stop()
+        music._set_gain(0.0 if fade > 0.0 else self.__master_volume)
+        music.play()
+        return self
+
+    def stop(self, fade: float = DEFAULT_CROSSFADE_TIME) -> Self:
+        """
+        #### Плавно останавливает текущий трек
+        """
+        self.__fade_out_current(fade)
+        self.__current = None
+        return self
+
+    def __fade_out_current(self, fade: float) -> None:
+        current = self.__current
+        if current is None:
+            return
+        if fade <= 0.0:
+            current.stop()
+            current._set_gain(self.__master_volume)
+            return
+        # Если трек еще нарастал, затухание начинается с достигнутой громкости
+        self.__fading_out.append([current, 0.0, fade, self.__fade_in_level()])
+
+    def __fade_in_level(self) -> float:
+        elapsed, duration = self.__fade_in
+        if duration <= 0.0 or elapsed >= duration:
+            return 1.0
+        return math.sin(0.5 * math.pi * elapsed / duration)
+
+    def update(self, dt: float) -> Self:
+        """
+        #### Продвигает переходы громкости на dt секунд
+        """
+        master = self.__master_volume
+        if self.__current is not None and self.__fade_in[0] < self.__fade_in[1]:
+            self.__fade_in[0] += dt
+            self.__current._set_gain(self.__fade_in_level() * master)
+
+        if self.__fading_out:
+            remaining = []
+            for entry in self.__fading_out:
+                music, elapsed, duration, start_level = entry
+                elapsed += dt
+                if elapsed >= duration:
+                    music.stop()
+                    music._set_gain(master)
+                    continue
+                entry[1] = elapsed
+                music._set_gain(start_level * math.cos(0.5 * math.pi * elapsed / duration) * master)
+                remaining.append(entry)
+            self.__fading_out = remaining
+        return self
+
+    def pause(self) -> Self:
+        if self.__current is not None:
+            self.__current.pause()
+        return self
+
+    def resume(self) -> Self:
+        if self.__current is not None and not self.__current.is_playing():
+            self.__current.play()
+        return self
+
+    def set_master_volume(self, volume: float) -> Self:
+        """
+        #### Общая громкость музыки (0.0-1.0), умножается на громкость трека
+        """
+        self.__master_volume = max(0.0, min(1.0, volume))
+        if self.__current is not None:
+            self.__current._set_gain(self.__fade_in_level() * self.__master_volume)
+        return self
+
+    def get_master_volume(self) -> float:
+        return self.__master_volume
+
+    def get_current(self) -> Music | None:
+        return self.__current
+
+    def is_fading(self) -> bool:
+        """
+        #### Идет ли сейчас переход громкости
+        """
+        return bool(self.__fading_out) or (self.__current is not None and self.__fade_in[0] < self.__fade_in[1])
+
+
+# Общий проигрыватель фоновой музыки
+MUSIC_PLAYER: Final[MusicPlayer] = MusicPlayer()
+
+
+def get_music_player() -> MusicPlayer:
+    """
+    #### Возвращает общий проигрыватель фоновой музыки
+    """
+    return MUSIC_PLAYER
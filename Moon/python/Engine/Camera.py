@@ -35,6 +35,10 @@
   - Поддержка различных разрешений
   - Оптимизированная производительность
 
+✓ Отсечение невидимого:
+  - Видимая область мира с учетом масштаба, тряски и поворота (AABB)
+  - cull() - векторная фильтрация объектов и массивов прямоугольников (NumPy)
+
 ---
 
 :Requires:
@@ -66,12 +70,62 @@ Copyright (c) 2025 Pavlov Ivan
 ПРОГРАММНОЕ ОБЕСПЕЧЕНИЕ ПРЕДОСТАВЛЯЕТСЯ «КАК ЕСТЬ», БЕЗ КАКИХ-ЛИБО ГАРАНТИЙ.
 """
 
+import math
 from random import randint, uniform
-from typing import Self, final
+from typing import Any, Final, Self, final
 from Moon.python.Views import *
 from Moon.python.Vectors import *
 from Moon.python.Window import Window
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# ////////////////////////////////////////////////////////////////////////////
+# Порог "досрочного прибытия" интерполяции
+# Когда до цели остается меньше порога, значение приравнивается к цели.
+# Без этого экспоненциальное сглаживание меняет центр, масштаб и тряску
+# в младших разрядах еще сотни кадров, и неподвижная камера продолжала бы
+# передавать преобразование в View каждый кадр
+# ////////////////////////////////////////////////////////////////////////////
+CAMERA_SNAP_DISTANCE: Final[float] = 1e-3   # Пиксели (центр и тряска)
+CAMERA_SNAP_ZOOM: Final[float] = 1e-6       # Доля масштаба
+CAMERA_SNAP_ANGLE: Final[float] = 1e-4      # Градусы
+
+
+def get_object_bounds(obj: Any) -> tuple[float, float, float, float]:
+    """
+    #### Прямоугольник объекта (left, top, width, height) для отсечения
+
+    ---
+
+    :Description:
+    - Используется Camera2D.cull() и SplitScreenRenderer, когда bounds не переданы
+    - Берется из get_global_bounds(), затем из get_local_bound(); кортеж из четырех
+      чисел или FloatRect возвращается как есть
+
+    ---
+
+    :Raises:
+    - TypeError: Если объект не дает своих границ и сам не является прямоугольником
+    """
+    if hasattr(obj, "get_global_bounds"):
+        position, size = obj.get_global_bounds()
+        return (position.x, position.y, size.x, size.y)
+    if hasattr(obj, "get_local_bound"):
+        # Вершины VertexList заданы в мировых координатах
+        position, size = obj.get_local_bound()
+        return (position.x, position.y, size.x, size.y)
+    if isinstance(obj, FloatRect):
+        return obj.as_tuple()
+    if isinstance(obj, (tuple, list)) and len(obj) == 4:
+        return tuple(obj)
+    raise TypeError(f"Cannot get bounds of {type(obj).__name__}: it has no get_global_bounds() or "
+                    f"get_local_bound(); pass its rectangle in bounds")
+
+
 class Camera2D:
     """
     #### Класс для создания и управления 2D камерой
@@ -91,6 +145,8 @@ class Camera2D:
     - Система тряски камеры с настраиваемыми параметрами
     - Следование за одним или двумя объектами
     - Автоматическое масштабирование для удержания объектов в кадре
+    - Состояние хранится в Python; в View передается только итоговое
+      преобразование одним вызовом и только когда оно изменилось
     """
 
     @final
@@ -131,7 +187,8 @@ class Camera2D:
         # Система позиционирования
         # =============================================
         self.__target_center: Vec2f = Vec2f(0, 0)    # Целевая позиция центра камеры
-        self.__current_center: Vec2f = Vec2f(0, 0)   # Текущая позиция центра камеры
+        self.__current_center: Vec2f = Vec2f(width / 2, height / 2)   # Текущая позиция центра камеры (без тряски)
+        self.__pair_center: Vec2f = Vec2f(0, 0)      # Точка между двумя целями (обновляется на месте)
         self.__lerp_movement: float = 0.1                  # Скорость интерполяции движения (0-1)
 
         # =============================================
@@ -183,6 +240,12 @@ class Camera2D:
         # =============================================
         self.__window: Window | None = None     # Ссылка на окно для автоадаптации
 
+        # =============================================
+        # Последнее переданное в View преобразование
+        # =============================================
+        # (center_x, center_y, width, height, angle); None - передать при следующем обновлении
+        self.__pushed_transform: tuple[float, float, float, float, float] | None = None
+
     @final
     def set_zoom(self, zoom: float = 1) -> Self:
         self.__zoom = zoom
@@ -1070,9 +1133,9 @@ class Camera2D:
         if width <= 0 or height <= 0:
             raise ValueError("Camera dimensions must be positive")
 
-        self.__view.set_size(width, height)
         self.__width = width
         self.__height = height
+        self.__push_transform()
         return self
 
     @final
@@ -1100,7 +1163,8 @@ class Camera2D:
         print(f"Камера находится в ({center.x}, {center.y})")
         ```
         """
-        return Vec2f(*self.__view.get_center())
+        return Vec2f(self.__current_center.x + self.__current_shake.x,
+                     self.__current_center.y + self.__current_shake.y)
 
     @final
     def get_size(self) -> Vec2f:
@@ -1153,11 +1217,11 @@ class Camera2D:
         pos = camera.get_position()
         ```
         """
-        return self.__current_center
+        return self.__current_center.copy()
 
     def set_center(self, position: Vec2f):
-        self.__current_center = position
-        self.__view.set_center(*position.as_tuple())
+        self.__current_center.set(position.x, position.y)
+        self.__push_transform()
 
     @final
     def update(self, delta: float = 1) -> None:
@@ -1199,34 +1263,33 @@ class Camera2D:
         # Адаптация к изменению размера окна
         # =============================================
         if self.__window and self.__window.get_resized():
-            self.__width = self.__window.get_size().x
-            self.__height = self.__window.get_size().y
-            self.__view.set_size(self.__width, self.__height)
+            size = self.__window.get_size()
+            self.__width = size.x
+            self.__height = size.y
 
         # =============================================
         # Обработка режима двойного слежения
         # =============================================
         if self.__use_two_target and self.__first_target and self.__second_target:
             # Вычисляем позицию между двумя объектами
-            pos_1 = self.__first_target.as_tuple()
-            pos_2 = self.__second_target.as_tuple()
-            normal = Vec2f(pos_1[0] - pos_2[0], pos_1[1] - pos_2[1])
-            self.__target_center = self.__second_target + normal * self.__two_target_factor
+            first, second = self.__first_target, self.__second_target
+            self.__target_center = self.__pair_center.set(second.x, second.y).lerp_to(first, self.__two_target_factor)
 
         # =============================================
         # Интерполяция позиции камеры
         # =============================================
-        self.__current_center = Vec2f(*self.__view.get_center())
-        self.__current_center += (self.__target_center - self.__current_center) * self.__lerp_movement * delta
-        self.__view.set_center(*self.__current_center.xy)
+        center = self.__current_center
+        target = self.__target_center
+        center.lerp_to(target, self.__lerp_movement * delta)
+        if abs(target.x - center.x) < CAMERA_SNAP_DISTANCE and abs(target.y - center.y) < CAMERA_SNAP_DISTANCE:
+            center.set(target.x, target.y)
 
         # =============================================
         # Автоматическое масштабирование для двух объектов
         # =============================================
         if self.__use_two_target and self.__first_target and self.__second_target:
-            vector_delta = (self.__first_target - self.__second_target)
-            distance_x = abs(vector_delta.x)
-            distance_y = abs(vector_delta.y)
+            distance_x = abs(self.__first_target.x - self.__second_target.x)
+            distance_y = abs(self.__first_target.y - self.__second_target.y)
 
             k = 0.5 / max(self.__two_target_factor, 1 - self.__two_target_factor)
 
@@ -1244,25 +1307,27 @@ class Camera2D:
         # Интерполяция масштабирования
         # =============================================
         self.__zoom += (self.__target_zoom - self.__zoom) * self.__lerp_zoom * delta
-        self.__view.set_size(self.__width * self.__zoom, self.__height * self.__zoom)
+        if abs(self.__target_zoom - self.__zoom) < CAMERA_SNAP_ZOOM:
+            self.__zoom = self.__target_zoom
 
         # =============================================
         # Обработка эффектов тряски
         # =============================================
-        self.__target_shake *= self.__shake_lerp ** delta
+        shake = self.__target_shake
+        shake.x *= self.__shake_lerp.x ** delta
+        shake.y *= self.__shake_lerp.y ** delta
+        if abs(shake.x) < CAMERA_SNAP_DISTANCE and abs(shake.y) < CAMERA_SNAP_DISTANCE:
+            shake.set(0, 0)
 
         # Генерация случайного направления тряски
-        if not self.__shake_only_x and not self.__shake_only_y:
-            self.__current_shake = self.__target_shake.rotate(randint(0, 360))
+        if shake.x == 0 and shake.y == 0:
+            self.__current_shake.set(0, 0)
+        elif not self.__shake_only_x and not self.__shake_only_y:
+            self.__current_shake.set(shake.x, shake.y).rotate_at(randint(0, 360))
         elif self.__shake_only_x:
-            self.__current_shake.x = self.__target_shake.x * uniform(-1, 1)
-            self.__current_shake.y = 0
+            self.__current_shake.set(shake.x * uniform(-1, 1), 0)
         elif self.__shake_only_y:
-            self.__current_shake.x = 0
-            self.__current_shake.y = self.__target_shake.y * uniform(-1, 1)
-
-        # Применение тряски к позиции камеры
-        self.__view.move(self.__current_shake.x, self.__current_shake.y)
+            self.__current_shake.set(0, shake.y * uniform(-1, 1))
 
         # =============================================
         # Интерполяция поворота камеры
@@ -1275,10 +1340,218 @@ class Camera2D:
         elif angle_diff < -180:
             angle_diff += 360
 
-        self.__angle += angle_diff * self.__angle_lerp * delta
-        self.__angle = self.__angle % 360
+        if abs(angle_diff) < CAMERA_SNAP_ANGLE:
+            self.__angle = self.__target_angle % 360
+        else:
+            self.__angle += angle_diff * self.__angle_lerp * delta
+            self.__angle = self.__angle % 360
+
+        # =============================================
+        # Передача итогового преобразования в View
+        # =============================================
+        self.__push_transform()
+
+    @final
+    def __push_transform(self) -> None:
+        """
+        #### Передает итоговое преобразование в View, если оно изменилось
+
+        ---
+
+        :Description:
+        - Центр = текущий центр + смещение тряски, размер = размер области * масштаб
+        - Один нативный вызов View.set_transform() вместо set_center/set_size/move/set_angle
+        - Неподвижная камера не выполняет ни одного нативного вызова
+        """
+        transform = (
+            self.__current_center.x + self.__current_shake.x,
+            self.__current_center.y + self.__current_shake.y,
+            self.__width * self.__zoom,
+            self.__height * self.__zoom,
+            self.__angle,
+        )
+        if transform != self.__pushed_transform:
+            self.__view.set_transform(*transform)
+            self.__pushed_transform = transform
+
+    @final
+    def invalidate_transform(self) -> Self:
+        """
+        #### Принудительно передает преобразование в View при следующем обновлении
+
+        ---
+
+        :Description:
+        - Нужен, если View камеры изменялся напрямую через get_view()
+        """
+        self.__pushed_transform = None
+        return self
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Видимая область и отсечение невидимых объектов
+    # ////////////////////////////////////////////////////////////////////////
+
+    @final
+    def get_visible_bounds(self, margin: float = 0.0) -> tuple[float, float, float, float]:
+        """
+        #### Возвращает видимую область мира как (left, top, width, height)
+
+        ---
+
+        :Description:
+        - Учитывает масштаб, тряску и поворот камеры
+        - При повороте возвращается описанный вокруг повернутой области
+          прямоугольник, выровненный по осям (AABB)
+        - Не создает нативных объектов - подходит для вызова каждый кадр
+
+        ---
+
+        :Args:
+        - margin (float): Расширение области с каждой стороны в мировых единицах
+
+        ---
+
+        :Returns:
+        - tuple[float, float, float, float]: Левый край, верхний край, ширина, высота
+        """
+        half_w = self.__width * self.__zoom * 0.5
+        half_h = self.__height * self.__zoom * 0.5
+        if self.__angle:
+            angle = math.radians(self.__angle)
+            cos = abs(math.cos(angle))
+            sin = abs(math.sin(angle))
+            half_w, half_h = half_w * cos + half_h * sin, half_w * sin + half_h * cos
+        half_w += margin
+        half_h += margin
+        center_x = self.__current_center.x + self.__current_shake.x
+        center_y = self.__current_center.y + self.__current_shake.y
+        return (center_x - half_w, center_y - half_h, half_w * 2, half_h * 2)
+
+    @final
+    def get_visible_rect(self, margin: float = 0.0) -> FloatRect:
+        """
+        #### Возвращает видимую область мира как FloatRect
+
+        ---
+
+        :Args:
+        - margin (float): Расширение области с каждой стороны в мировых единицах
+
+        ---
+
+        :Returns:
+        - FloatRect: Область, попадающая на экран (AABB при повороте камеры)
+
+        ---
+
+        :Example:
+        ```python
+        rect = camera.get_visible_rect()
+        x, y = rect.get_position()
+        w, h = rect.get_size()
+        ```
+        """
+        return FloatRect(*self.get_visible_bounds(margin))
+
+    @final
+    def is_rect_visible(self, left: float, top: float, width: float, height: float, margin: float = 0.0) -> bool:
+        """
+        #### Проверяет, пересекается ли прямоугольник с видимой областью
+        """
+        v_left, v_top, v_width, v_height = self.get_visible_bounds(margin)
+        return (left < v_left + v_width and left + width > v_left and
+                top < v_top + v_height and top + height > v_top)
+
+    @final
+    def get_visible_mask(self, bounds, margin: float = 0.0):
+        """
+        #### Векторная проверка видимости для массива прямоугольников
+
+        ---
+
+        :Args:
+        - bounds: Массив (N, 4) или последовательность (left, top, width, height)
+        - margin (float): Расширение видимой области
+
+        ---
+
+        :Returns:
+        - numpy.ndarray: Булева маска (N,), True - объект на экране
+
+        ---
+
+        :Raises:
+        - ImportError: Если NumPy не установлен
+        """
+        if np is None:
+            raise ImportError("NumPy is required for Camera2D.get_visible_mask: pip install numpy")
+        bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 4)
+        v_left, v_top, v_width, v_height = self.get_visible_bounds(margin)
+        left = bounds[:, 0]
+        top = bounds[:, 1]
+        return ((left < v_left + v_width) & (left + bounds[:, 2] > v_left) &
+                (top < v_top + v_height) & (top + bounds[:, 3] > v_top))
+
+    @final
+    def cull(self, objects, bounds=None, margin: float = 0.0) -> list:
+        """
+        #### Оставляет только объекты, попадающие в кадр
+
+        ---
+
+        :Description:
+        - objects - массив NumPy (N, 4) с прямоугольниками: возвращаются видимые строки
+        - objects - последовательность объектов: возвращается список видимых объектов
+        - Прямоугольники объектов берутся из bounds (массив (N, 4) или последовательность,
+          в том же порядке), иначе из get_global_bounds() / get_local_bound() объекта,
+          иначе сам объект должен быть прямоугольником (кортеж (left, top, width, height) или FloatRect)
+        - Для объектов без границ (например, фигур Shape) передайте bounds
+        - С NumPy проверка выполняется одной векторной операцией, без него - циклом
+
+        ---
+
+        :Args:
+        - objects: Объекты сцены или массив прямоугольников
+        - bounds: Прямоугольники объектов (необязательно)
+        - margin (float): Расширение видимой области (для объектов с тенями, свечением)
+
+        ---
+
+        :Returns:
+        - list | numpy.ndarray: Видимые объекты (или строки массива)
+
+        ---
+
+        :Raises:
+        - TypeError: Если bounds не передан, а объект не дает своих границ
+
+        ---
+
+        :Example:
+        ```python
+        # Прямоугольники врагов хранятся в массиве (N, 4) и обновляются векторно
+        for enemy in camera.cull(enemies, enemy_bounds):
+            window.draw(enemy.sprite)
+
+        # Объекты с get_global_bounds()
+        for sprite in camera.cull(sprites, margin=32):
+            window.draw(sprite)
+        ```
+        """
+        if np is not None and isinstance(objects, np.ndarray) and bounds is None:
+            return objects[self.get_visible_mask(objects, margin)]
+
+        if bounds is None:
+            bounds = [get_object_bounds(obj) for obj in objects]
+        if np is not None and len(objects):
+            mask = self.get_visible_mask(bounds, margin)
+            return [objects[index] for index in np.flatnonzero(mask)]
 
-        self.__view.set_angle(self.__angle)
+        v_left, v_top, v_width, v_height = self.get_visible_bounds(margin)
+        v_right = v_left + v_width
+        v_bottom = v_top + v_height
+        return [obj for obj, (left, top, width, height) in zip(objects, bounds)
+                if left < v_right and left + width > v_left and top < v_bottom and top + height > v_top]
 
     @final
     def apply(self, window: Window) -> None:
@@ -1419,7 +1692,8 @@ class CameraMachine2D(Camera2D):
         if keyboard.is_pressed('d'): camera.move(5, 0)
         ```
         """
-        self.__manual_position += Vec2f(x, y)
+        self.__manual_position.x += x
+        self.__manual_position.y += y
         return self
 
     @final
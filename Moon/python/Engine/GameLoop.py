@@ -0,0 +1,391 @@
+"""
+#### *Модуль игрового цикла с фиксированным шагом для Moon*
+
+---
+
+##### Версия: 1.0.0
+
+*Автор: Павлов Иван (Pavlov Ivan)*
+
+*Лицензия: MIT*
+##### Реализованно на 100%
+
+---
+
+✓ Фиксированный шаг симуляции:
+  - Логика всегда получает одинаковый dt (по умолчанию 1/60 с)
+  - Поведение не зависит от частоты кадров
+  - Накопитель времени переносит остаток между кадрами
+
+✓ Интерполяция рендера:
+  - render(alpha) получает долю шага, прошедшую после последнего обновления
+  - Позволяет рисовать плавно при любом FPS: prev + (curr - prev) * alpha
+
+✓ Защита от "спирали смерти":
+  - Время кадра ограничивается сверху (зависания, перетаскивание окна)
+  - Число шагов за кадр ограничено, лишние шаги отбрасываются
+
+✓ Счетчики:
+  - Шаги за последний кадр, гистограмма шагов по кадрам, отброшенные шаги
+
+---
+
+:Requires:
+
+• Python 3.12+
+
+• Moon.Window (оконная система)
+
+---
+
+== Лицензия MIT ==================================================
+
+[MIT License]
+Copyright (c) 2025 Pavlov Ivan
+
+Данная лицензия разрешает лицам, получившим копию данного программного обеспечения
+и сопутствующей документации (в дальнейшем именуемыми «Программное Обеспечение»),
+безвозмездно использовать Программное Обеспечение без ограничений, включая неограниченное
+право на использование, копирование, изменение, слияние, публикацию, распространение,
+сублицензирование и/или продажу копий Программного Обеспечения.
+
+[ Уведомление об авторском праве и данные условия должны быть включены во все копии ]
+[                 или значительные части Программного Обеспечения.                  ]
+
+ПРОГРАММНОЕ ОБЕСПЕЧЕНИЕ ПРЕДОСТАВЛЯЕТСЯ «КАК ЕСТЬ», БЕЗ КАКИХ-ЛИБО ГАРАНТИЙ.
+"""
+
+from time import perf_counter
+from typing import Any, Callable, Final, Self
+
+from Moon.python.Window import Window, WindowEvents
+
+
+# ////////////////////////////////////////////////////////////////////////////
+# Параметры цикла по умолчанию
+# ////////////////////////////////////////////////////////////////////////////
+DEFAULT_FIXED_DT: Final[float] = 1.0 / 60.0      # Шаг симуляции (секунды)
+DEFAULT_MAX_SUBSTEPS: Final[int] = 5             # Максимум шагов симуляции за один кадр
+DEFAULT_MAX_FRAME_TIME: Final[float] = 0.25      # Верхняя граница времени кадра (секунды)
+
+
+type UpdateCallback = Callable[[float], Any]
+type RenderCallback = Callable[[float], Any]
+
+
+class GameLoop:
+    """
+    #### Игровой цикл с фиксированным шагом симуляции и интерполяцией рендера
+
+    ---
+
+    :Description:
+    - Каждый кадр: window.update() -> N раз update(fixed_dt) -> window.clear() ->
+      render(alpha) -> window.view_info() -> window.display()
+    - N определяется накопителем: реальное время кадра добавляется в него,
+      каждый шаг симуляции вычитает fixed_dt
+    - alpha = остаток накопителя / fixed_dt, в диапазоне [0, 1)
+    - Логику можно передать колбэками или переопределить fixed_update()/render() в наследнике
+
+    ---
+
+    :Args:
+    - window (Window): Окно, которым управляет цикл
+    - update (UpdateCallback | None): Шаг симуляции, получает fixed_dt в секундах
+    - render (RenderCallback | None): Отрисовка кадра, получает alpha
+    - fixed_dt (float): Шаг симуляции в секундах
+    - max_substeps (int): Максимум шагов за кадр (защита от спирали смерти)
+    - max_frame_time (float): Время кадра обрезается до этого значения
+    - events (WindowEvents | None): Объект событий (по умолчанию создается новый)
+
+    ---
+
+    :Example:
+    ```python
+    def update(dt: float):
+        player.prev_pos.set(player.pos.x, player.pos.y)
+        player.pos += player.speed * dt
+
+    def render(alpha: float):
+        window.draw(player.sprite.set_position(GameLoop.interpolate(player.prev_pos, player.pos, alpha)))
+
+    GameLoop(window, update, render, fixed_dt=1 / 120).run()
+    ```
+    """
+
+    __slots__ = ('__window', '__events', '__update', '__render', '__fixed_dt', '__max_substeps',
+                 '__max_frame_time', '__accumulator', '__alpha', '__last_time', '__running', '__paused',
+                 '__time_scale', '__substeps', '__substep_histogram', '__frames', '__total_steps',
+                 '__dropped_steps', '__clamped_frames', '__simulation_time')
+
+    def __init__(self, window: Window,
+                 update: UpdateCallback | None = None,
+                 render: RenderCallback | None = None,
+                 fixed_dt: float = DEFAULT_FIXED_DT,
+                 max_substeps: int = DEFAULT_MAX_SUBSTEPS,
+                 max_frame_time: float = DEFAULT_MAX_FRAME_TIME,
+                 events: WindowEvents | None = None):
+        self.__window = window
+        self.__events = events if events is not None else WindowEvents()
+        self.__update = update
+        self.__render = render
+
+        self.__fixed_dt: float = DEFAULT_FIXED_DT
+        self.__max_substeps: int = DEFAULT_MAX_SUBSTEPS
+        self.__max_frame_time: float = max_frame_time
+        self.set_fixed_dt(fixed_dt)
+        self.set_max_substeps(max_substeps)
+
+        self.__accumulator: float = 0.0
+        self.__alpha: float = 0.0
+        self.__last_time: float | None = None
+        self.__running: bool = False
+        self.__paused: bool = False
+        self.__time_scale: float = 1.0
+        self.__simulation_time: float = 0.0
+
+        self.__substeps: int = 0
+        self.__substep_histogram: list[int] = [0] * (self.__max_substeps + 1)
+        self.__frames: int = 0
+        self.__total_steps: int = 0
+        self.__dropped_steps: int = 0
+        self.__clamped_frames: int = 0
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Точки расширения
+    # ////////////////////////////////////////////////////////////////////////
+
+    def fixed_update(self, dt: float) -> None:
+        """
+        #### Один шаг симуляции (по умолчанию вызывает колбэк update)
+        """
+        if self.__update is not None:
+            self.__update(dt)
+
+    def render(self, alpha: float) -> None:
+        """
+        #### Отрисовка кадра (по умолчанию вызывает колбэк render)
+        """
+        if self.__render is not None:
+            self.__render(alpha)
+
+    @staticmethod
+    def interpolate(previous: Any, current: Any, alpha: float) -> Any:
+        """
+        #### Линейная интерполяция между двумя состояниями симуляции
+
+        ---
+
+        :Args:
+        - previous: Состояние до последнего шага (число или Vec2f)
+        - current: Состояние после последнего шага
+        - alpha (float): Доля шага из render(alpha)
+
+        :Returns:
+        - Интерполированное значение того же типа
+        """
+        return previous + (current - previous) * alpha
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Управление циклом
+    # ////////////////////////////////////////////////////////////////////////
+
+    def run(self) -> None:
+        """
+        #### Запускает цикл до закрытия окна или вызова stop()
+        """
+        self.__running = True
+        self.__last_time = None
+        while self.__running and self.step():
+            pass
+        self.__running = False
+
+    def stop(self) -> None:
+        """
+        #### Останавливает run() после текущего кадра
+        """
+        self.__running = False
+
+    def is_running(self) -> bool:
+        return self.__running
+
+    def step(self) -> bool:
+        """
+        #### Выполняет один кадр цикла
+
+        ---
+
+        :Description:
+        - Можно вызывать вручную вместо run() из собственного цикла
+
+        :Returns:
+        - bool: False, если окно закрылось
+        """
+        if not self.__window.update(self.__events):
+            return False
+
+        now = perf_counter()
+        frame_time = 0.0 if self.__last_time is None else now - self.__last_time
+        self.__last_time = now
+        if frame_time > self.__max_frame_time:
+            frame_time = self.__max_frame_time
+            self.__clamped_frames += 1
+
+        self.__advance(frame_time)
+
+        self.__window.clear()
+        self.render(self.__alpha)
+        self.__window.view_info()
+        self.__window.display()
+        return True
+
+    def __advance(self, frame_time: float) -> None:
+        fixed_dt = self.__fixed_dt
+        substeps = 0
+        if not self.__paused:
+            self.__accumulator += frame_time * self.__time_scale
+            while self.__accumulator >= fixed_dt and substeps < self.__max_substeps:
+                self.fixed_update(fixed_dt)
+                self.__accumulator -= fixed_dt
+                self.__simulation_time += fixed_dt
+                substeps += 1
+
+            # Спираль смерти: симуляция не успевает за реальным временем.
+            # Невыполненные шаги отбрасываются, остается только дробная часть
+            if self.__accumulator >= fixed_dt:
+                dropped = int(self.__accumulator // fixed_dt)
+                self.__dropped_steps += dropped
+                self.__accumulator -= dropped * fixed_dt
+
+        self.__substeps = substeps
+        self.__substep_histogram[substeps] += 1
+        self.__total_steps += substeps
+        self.__frames += 1
+        self.__alpha = self.__accumulator / fixed_dt
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Настройки
+    # ////////////////////////////////////////////////////////////////////////
+
+    def set_update(self, update: UpdateCallback | None) -> Self:
+        self.__update = update
+        return self
+
+    def set_render(self, render: RenderCallback | None) -> Self:
+        self.__render = render
+        return self
+
+    def set_fixed_dt(self, fixed_dt: float) -> Self:
+        """
+        #### Устанавливает шаг симуляции в секундах (например, 1 / 120)
+        """
+        if fixed_dt <= 0:
+            raise ValueError(f"fixed_dt must be positive, got {fixed_dt}")
+        self.__fixed_dt = fixed_dt
+        return self
+
+    def get_fixed_dt(self) -> float:
+        return self.__fixed_dt
+
+    def set_max_substeps(self, max_substeps: int) -> Self:
+        """
+        #### Устанавливает максимум шагов симуляции за кадр (сбрасывает гистограмму)
+        """
+        if max_substeps < 1:
+            raise ValueError(f"max_substeps must be at least 1, got {max_substeps}")
+        self.__max_substeps = max_substeps
+        self.__substep_histogram = [0] * (max_substeps + 1)
+        return self
+
+    def get_max_substeps(self) -> int:
+        return self.__max_substeps
+
+    def set_max_frame_time(self, seconds: float) -> Self:
+        self.__max_frame_time = seconds
+        return self
+
+    def get_max_frame_time(self) -> float:
+        return self.__max_frame_time
+
+    def set_time_scale(self, scale: float) -> Self:
+        """
+        #### Масштаб времени симуляции (0.5 - замедление, 2 - ускорение); шаг остается фиксированным
+        """
+        self.__time_scale = max(0.0, scale)
+        return self
+
+    def get_time_scale(self) -> float:
+        return self.__time_scale
+
+    def set_paused(self, paused: bool) -> Self:
+        """
+        #### Пауза симуляции: рендер продолжается, шаги не выполняются
+        """
+        self.__paused = paused
+        return self
+
+    def is_paused(self) -> bool:
+        return self.__paused
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Состояние и счетчики
+    # ////////////////////////////////////////////////////////////////////////
+
+    def get_window(self) -> Window:
+        return self.__window
+
+    def get_events(self) -> WindowEvents:
+        return self.__events
+
+    def get_alpha(self) -> float:
+        """
+        #### Доля шага, переданная в последний render(alpha)
+        """
+        return self.__alpha
+
+    def get_simulation_time(self) -> float:
+        """
+        #### Суммарное время симуляции в секундах (число шагов × fixed_dt)
+        """
+        return self.__simulation_time
+
+    def get_substeps(self) -> int:
+        """
+        #### Количество шагов симуляции в последнем кадре
+        """
+        return self.__substeps
+
+    def get_substep_histogram(self) -> list[int]:
+        """
+        #### Гистограмма шагов за кадр: элемент i - число кадров с i шагами
+        """
+        return list(self.__substep_histogram)
+
+    def get_average_substeps(self) -> float:
+        return self.__total_steps / self.__frames if self.__frames else 0.0
+
+    def get_frame_count(self) -> int:
+        return self.__frames
+
+    def get_total_steps(self) -> int:
+        return self.__total_steps
+
+    def get_dropped_steps(self) -> int:
+        """
+        #### Число шагов, отброшенных защитой от спирали смерти
+        """
+        return self.__dropped_steps
+
+    def get_clamped_frames(self) -> int:
+        """
+        #### Число кадров, время которых было обрезано до max_frame_time
+        """
+        return self.__clamped_frames
+
+    def reset_stats(self) -> Self:
+        self.__substep_histogram = [0] * (self.__max_substeps + 1)
+        self.__frames = 0
+        self.__total_steps = 0
+        self.__dropped_steps = 0
+        self.__clamped_frames = 0
+        return self
@@ -99,7 +99,6 @@ class ParticleTextureAtlas:
         return self.__poses
     
     def get_render_texture(self) -> RenderTexture2D:
-        print(self.__texture.get_size())
         return self.__texture
     
       
@@ -216,9 +215,24 @@ class CPU_ParticleSystem:
         self.circle_coords = poses['circle']
         self.rect_coords = poses['rect']
         self.light_coords = poses['light_circle']
+        # Текстурные координаты углов квада для каждой формы (не меняются между кадрами)
+        self.tex_corners = {
+            ParticleShapes.Circle: self._quad_tex_corners(self.circle_coords),
+            ParticleShapes.LightCircle: self._quad_tex_corners(self.light_coords),
+            ParticleShapes.Rectangle: self._quad_tex_corners(self.rect_coords),
+        }
 
         self.lightning = False
     
+    @staticmethod
+    def _quad_tex_corners(coords) -> tuple[Vec2f, Vec2f, Vec2f, Vec2f]:
+        return (
+            Vec2f(coords[0], coords[1]),
+            Vec2f(coords[0] + coords[2], coords[1]),
+            Vec2f(coords[0] + coords[2], coords[1] + coords[3]),
+            Vec2f(coords[0], coords[1] + coords[3])
+        )
+
     def _construct_particle(self, particle: CPU_Particle, emitter: CPU_ParticleEmitters) -> CPU_Particle:
         p = particle.copy()
         if isinstance(emitter, CPU_ParticleEmitters.Point):
@@ -245,15 +259,15 @@ class CPU_ParticleSystem:
         alive_particles = []
         
         for p in self.particles:
+            # Все изменения скорости и позиции выполняются на месте
             p.speed *= (p.resistance ** render_time)
             p.rotation += p.rotation_speed * render_time
             
             # Вращаем вектор скорости
             if p.velocity_rotation_speed != 0:
-                current_angle = p.speed.get_angle()
-                p.speed.set_angle(current_angle + p.velocity_rotation_speed * render_time)
+                p.speed.rotate_at(p.velocity_rotation_speed * render_time)
             
-            p.position += p.speed * render_time
+            p.position.add_scaled(p.speed, render_time)
             p.size += p.resize * render_time
             
             if p.size <= 0:
@@ -264,13 +278,8 @@ class CPU_ParticleSystem:
             x, y = p.position.x, p.position.y
             half = p.size * 0.5
             
-            # Используем кэшированные координаты
-            if p.shape == ParticleShapes.Circle:
-                coords = self.circle_coords
-            elif p.shape == ParticleShapes.LightCircle:
-                coords = self.light_coords
-            elif p.shape == ParticleShapes.Rectangle:
-                coords = self.rect_coords
+            # Используем кэшированные координаты текстуры
+            tex_coords = self.tex_corners[p.shape]
             
             # Вычисляем повернутые вершины
             
@@ -278,7 +287,7 @@ class CPU_ParticleSystem:
             sin_r = math.sin(math.radians(p.rotation))
             
             # Координаты вершин относительно центра
-            vertices_local = [(-half, -half), (half, -half), (half, half), (-half, half)]
+            vertices_local = ((-half, -half), (half, -half), (half, half), (-half, half))
             
             for i, (lx, ly) in enumerate(vertices_local):
                 # Поворачиваем вершину
@@ -289,14 +298,6 @@ class CPU_ParticleSystem:
                 world_x = x + rx
                 world_y = y + ry
                 
-                # Координаты текстуры
-                tex_coords = [
-                    Vec2f(coords[0], coords[1]),
-                    Vec2f(coords[0] + coords[2], coords[1]),
-                    Vec2f(coords[0] + coords[2], coords[1] + coords[3]),
-                    Vec2f(coords[0], coords[1] + coords[3])
-                ]
-                
                 self.vertices.append(Vertex(Vec2f(world_x, world_y), p.color, tex_coords[i]))
         
         self.particles = alive_particles
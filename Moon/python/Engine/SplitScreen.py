@@ -0,0 +1,344 @@
+"""
+#### *Модуль разделенного экрана (split-screen) для Moon*
+
+---
+
+##### Версия: 1.0.0
+
+*Автор: Павлов Иван (Pavlov Ivan)*
+
+*Лицензия: MIT*
+##### Реализованно на 100%
+
+---
+
+✓ Несколько камер в одном окне:
+  - Каждая камера рисуется в свою область окна (View.set_viewport)
+  - Раскладка сеткой: 2 игрока рядом, 4 игрока квадратом и т.д.
+
+✓ Сцена передается один раз за кадр:
+  - Статическая геометрия (заранее собранные VertexList, спрайты фона)
+    регистрируется один раз и переиспользуется всеми областями
+  - Динамические объекты передаются через submit() один раз за кадр
+  - Прямоугольники объектов хранятся в массиве (N, 4)
+
+✓ Отсечение для каждой камеры:
+  - Видимость считается одной векторной операцией по массиву прямоугольников
+  - На каждую область остаются только смена View и вызовы отрисовки
+
+---
+
+:Requires:
+
+• Python 3.12+
+
+• Moon.Engine.Camera (Camera2D)
+
+• NumPy (необязательно, без него отсечение выполняется циклом)
+
+---
+
+== Лицензия MIT ==================================================
+
+[MIT License]
+Copyright (c) 2025 Pavlov Ivan
+
+Данная лицензия разрешает лицам, получившим копию данного программного обеспечения
+и сопутствующей документации (в дальнейшем именуемыми «Программное Обеспечение»),
+безвозмездно использовать Программное Обеспечение без ограничений, включая неограниченное
+право на использование, копирование, изменение, слияние, публикацию, распространение,
+сублицензирование и/или продажу копий Программного Обеспечения.
+
+[ Уведомление об авторском праве и данные условия должны быть включены во все копии ]
+[                 или значительные части Программного Обеспечения.                  ]
+
+ПРОГРАММНОЕ ОБЕСПЕЧЕНИЕ ПРЕДОСТАВЛЯЕТСЯ «КАК ЕСТЬ», БЕЗ КАКИХ-ЛИБО ГАРАНТИЙ.
+"""
+
+from typing import Any, Callable, Final, Self
+
+from Moon.python.Views import FloatRect
+from Moon.python.Window import Window
+from Moon.python.Engine.Camera import Camera2D, get_object_bounds
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# ////////////////////////////////////////////////////////////////////////////
+# Область окна по умолчанию (нормализованные координаты: left, top, width, height)
+# ////////////////////////////////////////////////////////////////////////////
+FULL_VIEWPORT: Final[tuple[float, float, float, float]] = (0.0, 0.0, 1.0, 1.0)
+
+
+type Bounds = tuple[float, float, float, float]
+type ViewportRect = tuple[float, float, float, float]
+type ViewOverlay = Callable[[int, Camera2D], Any]
+
+
+class SplitScreenRenderer:
+    """
+    #### Отрисовка одной сцены несколькими камерами в разные области окна
+
+    ---
+
+    :Description:
+    - Сцена состоит из статических элементов (add_static) и элементов кадра (submit)
+    - Каждый элемент - объект для window.draw() и его прямоугольник в мире
+    - render() для каждой камеры: window.set_view() -> отсечение по видимой
+      области камеры -> window.draw() только видимых элементов
+    - Геометрия не перестраивается для каждой области: одни и те же
+      VertexList и спрайты рисуются всеми камерами
+
+    ---
+
+    :Example:
+    ```python
+    left, right = Camera2D(640, 720), Camera2D(640, 720)
+    screen = SplitScreenRenderer().add_view(left).add_view(right).layout_grid(2, 1, window)
+
+    for chunk in tilemap_chunks:             # VertexList, собраны один раз
+        screen.add_static(chunk, states=tiles_states)
+
+    while window.update(events):
+        left.follow(player_1.position); left.update(window.get_delta())
+        right.follow(player_2.position); right.update(window.get_delta())
+
+        for enemy in enemies:
+            screen.submit(enemy.sprite, enemy.bounds)
+
+        window.clear()
+        screen.render(window)
+        window.display()
+    ```
+    """
+
+    __slots__ = ('__cameras', '__viewports', '__static_items', '__static_states', '__static_bounds',
+                 '__static_array', '__frame_items', '__frame_states', '__frame_bounds', '__margin',
+                 '__draw_calls', '__visible_counts')
+
+    def __init__(self, margin: float = 0.0):
+        self.__cameras: list[Camera2D] = []
+        self.__viewports: list[ViewportRect] = []
+
+        self.__static_items: list[Any] = []
+        self.__static_states: list[Any] = []
+        self.__static_bounds: list[Bounds] = []
+        self.__static_array = None          # Массив (N, 4), собирается при первом render()
+
+        self.__frame_items: list[Any] = []
+        self.__frame_states: list[Any] = []
+        self.__frame_bounds: list[Bounds] = []
+
+        self.__margin: float = margin
+        self.__draw_calls: int = 0
+        self.__visible_counts: list[int] = []
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Камеры и области окна
+    # ////////////////////////////////////////////////////////////////////////
+
+    def add_view(self, camera: Camera2D, viewport: ViewportRect = FULL_VIEWPORT) -> Self:
+        """
+        #### Добавляет камеру и область окна, в которую она рисует
+
+        ---
+
+        :Args:
+        - camera (Camera2D): Камера игрока
+        - viewport (ViewportRect): (left, top, width, height) в долях окна (0..1)
+        """
+        self.__cameras.append(camera)
+        self.__viewports.append(FULL_VIEWPORT)
+        self.set_viewport(len(self.__cameras) - 1, viewport)
+        return self
+
+    def remove_view(self, camera: Camera2D) -> Self:
+        index = self.__cameras.index(camera)
+        del self.__cameras[index]
+        del self.__viewports[index]
+        return self
+
+    def set_viewport(self, index: int, viewport: ViewportRect) -> Self:
+        """
+        #### Меняет область окна камеры с индексом index
+        """
+        self.__viewports[index] = tuple(viewport)
+        self.__cameras[index].get_view().set_viewport(FloatRect(*viewport))
+        return self
+
+    def get_viewport(self, index: int) -> ViewportRect:
+        return self.__viewports[index]
+
+    def get_cameras(self) -> list[Camera2D]:
+        return list(self.__cameras)
+
+    def get_view_count(self) -> int:
+        return len(self.__cameras)
+
+    def layout_grid(self, columns: int, rows: int = 1, window: Window | None = None) -> Self:
+        """
+        #### Раскладывает камеры сеткой columns × rows (слева направо, сверху вниз)
+
+        ---
+
+        :Description:
+        - Если передано окно, размер каждой камеры подгоняется под пиксельный
+          размер ее области, чтобы изображение не растягивалось
+
+        ---
+
+        :Args:
+        - columns (int): Число столбцов
+        - rows (int): Число строк
+        - window (Window | None): Окно для подгонки размеров камер
+        """
+        if columns < 1 or rows < 1:
+            raise ValueError(f"Grid must have at least one cell, got {columns}x{rows}")
+        if len(self.__cameras) > columns * rows:
+            raise ValueError(f"{len(self.__cameras)} views do not fit into a {columns}x{rows} grid")
+
+        width, height = 1.0 / columns, 1.0 / rows
+        for index, camera in enumerate(self.__cameras):
+            row, column = divmod(index, columns)
+            self.set_viewport(index, (column * width, row * height, width, height))
+            if window is not None:
+                size = window.get_size()
+                camera.set_size(max(1, int(size.x * width)), max(1, int(size.y * height)))
+        return self
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Сцена
+    # ////////////////////////////////////////////////////////////////////////
+
+    def add_static(self, drawable: Any, bounds: Bounds | None = None, states: Any = None) -> int:
+        """
+        #### Регистрирует неизменяемый элемент сцены (фон, чанк тайловой карты)
+
+        ---
+
+        :Args:
+        - drawable: Объект для window.draw() (обычно заранее собранный VertexList)
+        - bounds (Bounds | None): Прямоугольник в мире; по умолчанию берется у объекта
+        - states: RenderStates или Shader для отрисовки
+
+        :Returns:
+        - int: Индекс элемента
+        """
+        self.__static_items.append(drawable)
+        self.__static_states.append(states)
+        self.__static_bounds.append(tuple(bounds) if bounds is not None else get_object_bounds(drawable))
+        self.__static_array = None
+        return len(self.__static_items) - 1
+
+    def set_static_bounds(self, index: int, bounds: Bounds) -> Self:
+        """
+        #### Обновляет прямоугольник статического элемента (если геометрия была пересобрана)
+        """
+        self.__static_bounds[index] = tuple(bounds)
+        self.__static_array = None
+        return self
+
+    def clear_static(self) -> Self:
+        self.__static_items.clear()
+        self.__static_states.clear()
+        self.__static_bounds.clear()
+        self.__static_array = None
+        return self
+
+    def get_static_count(self) -> int:
+        return len(self.__static_items)
+
+    def submit(self, drawable: Any, bounds: Bounds | None = None, states: Any = None) -> Self:
+        """
+        #### Добавляет элемент только в текущий кадр (персонажи, снаряды, эффекты)
+
+        ---
+
+        :Description:
+        - Элементы кадра очищаются после render()
+        - Каждый элемент передается один раз, независимо от числа камер
+        """
+        self.__frame_items.append(drawable)
+        self.__frame_states.append(states)
+        self.__frame_bounds.append(bounds if bounds is not None else get_object_bounds(drawable))
+        return self
+
+    def set_margin(self, margin: float) -> Self:
+        """
+        #### Расширение видимой области при отсечении (для теней, свечения)
+        """
+        self.__margin = margin
+        return self
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Отрисовка
+    # ////////////////////////////////////////////////////////////////////////
+
+    def render(self, window: Window, overlay: ViewOverlay | None = None) -> None:
+        """
+        #### Рисует сцену всеми камерами и очищает элементы кадра
+
+        ---
+
+        :Args:
+        - window (Window): Окно
+        - overlay (ViewOverlay | None): Вызывается после сцены в каждой области
+          как overlay(index, camera) - например, для рамки или маркеров игрока
+
+        ---
+
+        :Note:
+        - После отрисовки окну возвращается стандартный View
+        """
+        if self.__static_array is None and np is not None and self.__static_bounds:
+            self.__static_array = np.asarray(self.__static_bounds, dtype=np.float64).reshape(-1, 4)
+        static_bounds = self.__static_array if self.__static_array is not None else self.__static_bounds
+        frame_bounds = self.__frame_bounds
+        if np is not None and frame_bounds:
+            frame_bounds = np.asarray(frame_bounds, dtype=np.float64).reshape(-1, 4)
+
+        self.__draw_calls = 0
+        self.__visible_counts = []
+        for index, camera in enumerate(self.__cameras):
+            window.set_view(camera.get_view())
+            visible = self.__draw_visible(window, camera, self.__static_items, self.__static_states, static_bounds)
+            visible += self.__draw_visible(window, camera, self.__frame_items, self.__frame_states, frame_bounds)
+            self.__visible_counts.append(visible)
+            if overlay is not None:
+                overlay(index, camera)
+
+        window.set_view(window.get_default_view())
+        self.__frame_items.clear()
+        self.__frame_states.clear()
+        self.__frame_bounds.clear()
+
+    def __draw_visible(self, window: Window, camera: Camera2D, items: list, states: list, bounds) -> int:
+        if not items:
+            return 0
+        if np is not None:
+            indices = np.flatnonzero(camera.get_visible_mask(bounds, self.__margin)).tolist()
+        else:
+            indices = [i for i, rect in enumerate(bounds) if camera.is_rect_visible(*rect, margin=self.__margin)]
+        for i in indices:
+            window.draw(items[i], states[i])
+        self.__draw_calls += len(indices)
+        return len(indices)
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Счетчики последнего кадра
+    # ////////////////////////////////////////////////////////////////////////
+
+    def get_draw_calls(self) -> int:
+        """
+        #### Число вызовов window.draw() за последний render() по всем областям
+        """
+        return self.__draw_calls
+
+    def get_visible_counts(self) -> list[int]:
+        """
+        #### Число видимых элементов для каждой камеры в последнем render()
+        """
+        return list(self.__visible_counts)
@@ -90,7 +90,7 @@ from typing import Any, Literal, Final, final, Optional, Union, Set, Dict
 
 from Moon.python.Types import AutoIdentifier, Self
 from Moon.python.Vectors import Vec2f, Vec2i, Vec2T  # Векторные операции для позиций
-from Moon.python.utils import find_library, LibraryLoadError
+from Moon.python.utils import get_native_library, LibraryLoadError
 
 
 
@@ -105,11 +105,8 @@ class InvalidInputError(InputError):
     pass
 
 
-# Загрузка библиотеки
-try:
-    _lib = ctypes.CDLL(find_library())
-except Exception as e:
-    raise LibraryLoadError(f"Failed to load Moon library: {e}")
+# Общий дескриптор нативной библиотеки (загружается при первом вызове нативной функции)
+_lib = get_native_library()
 
 # Проверка наличия обязательных функций
 REQUIRED_FUNCTIONS = [
@@ -119,9 +116,8 @@ REQUIRED_FUNCTIONS = [
     '_Mouse_SetPosition', '_Mouse_SetPositionWindow'
 ]
 
-for func in REQUIRED_FUNCTIONS:
-    if not hasattr(_lib, func):
-        raise LibraryLoadError(f"Required function {func} not found in library")
+# Проверяется при загрузке библиотеки (первом вызове нативной функции)
+_lib.require(*REQUIRED_FUNCTIONS)
 
 
 class KeyboardLayout:
@@ -717,7 +713,9 @@ class Mouse:
             "right": False, # Состояние правой кнопки
             "middle": False # Состояние средней кнопки
         }
-        self._last_position = get_mouse_position()  # Позиция в предыдущем кадре
+        # Позиция в предыдущем кадре (None - еще не запрашивалась; не читаем ее при импорте,
+        # чтобы не загружать нативную библиотеку раньше первого использования)
+        self._last_position: Vec2i | None = None
 
     @classmethod
     def get_press(cls, button: Union[Literal["left", "right", "middle"], MouseButtons]) -> bool:
@@ -859,6 +857,8 @@ class Mouse:
         """
         try:
             current_pos = get_mouse_position()
+            if self._last_position is None:
+                self._last_position = current_pos
             speed = current_pos - self._last_position
             self._last_position = current_pos
             return speed
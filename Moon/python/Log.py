@@ -0,0 +1,292 @@
+"""
+#### *Модуль логирования Moon*
+
+---
+
+##### Версия: 1.0.0
+
+*Автор: Павлов Иван (Pavlov Ivan)*
+
+*Лицензия: MIT*
+##### Реализованно на 100%
+
+---
+
+✓ Единый логгер `Moon` на основе стандартного `logging`:
+  - Дочерние логгеры подсистем: Moon.Machine, Moon.WindowAPI, Moon.FontLoader,
+    Moon.ShaderLoader, Moon.LibLoader и т.д.
+  - Уровни DEBUG / INFO / WARNING / ERROR
+
+✓ По умолчанию логирование выключено:
+  - Сообщения не форматируются и не пишутся в консоль
+  - Аргументы передаются в стиле `logger.info("... %s", value)` и подставляются
+    только если уровень включен
+
+✓ Включение:
+  - Переменная окружения MOON_LOG_LEVEL (DEBUG, INFO, WARNING, ERROR, OFF)
+  - `enable_logging(level)` - цветной вывод в консоль в привычном формате Moon
+  - `set_log_level(level)` - только уровень; сообщения уходят в обработчики приложения
+
+---
+
+:Requires:
+
+• Python 3.12+
+
+• colorama
+
+---
+
+== Лицензия MIT ==================================================
+
+[MIT License]
+Copyright (c) 2025 Pavlov Ivan
+
+Данная лицензия разрешает лицам, получившим копию данного программного обеспечения
+и сопутствующей документации (в дальнейшем именуемыми «Программное Обеспечение»),
+безвозмездно использовать Программное Обеспечение без ограничений, включая неограниченное
+право на использование, копирование, изменение, слияние, публикацию, распространение,
+сублицензирование и/или продажу копий Программного Обеспечения, а также лицам, которым
+предоставляется данное Программное Обеспечение, при соблюдении следующих условий:
+
+[ Уведомление об авторском праве и данные условия должны быть включены во все копии ]
+[                 или значительные части Программного Обеспечения.                  ]
+
+ПРОГРАММНОЕ ОБЕСПЕЧЕНИЕ ПРЕДОСТАВЛЯЕТСЯ «КАК ЕСТЬ», БЕЗ КАКИХ-ЛИБО ГАРАНТИЙ, ЯВНО
+ВЫРАЖЕННЫХ ИЛИ ПОДРАЗУМЕВАЕМЫХ, ВКЛЮЧАЯ, НО НЕ ОГРАНИЧИВАЯСЬ ГАРАНТИЯМИ ТОВАРНОЙ
+ПРИГОДНОСТИ, СООТВЕТСТВИЯ ПО ЕГО КОНКРЕТНОМУ НАЗНАЧЕНИЮ И ОТСУТСТВИЯ НАРУШЕНИЙ ПРАВ.
+НИ В КАКОМ СЛУЧАЕ АВТОРЫ ИЛИ ПРАВООБЛАДАТЕЛИ НЕ НЕСУТ ОТВЕТСТВЕННОСТИ ПО ИСКАМ О
+ВОЗМЕЩЕНИИ УЩЕРБА, УБЫТКОВ ИЛИ ДРУГИХ ТРЕБОВАНИЙ ПО ДЕЙСТВУЮЩЕМУ ПРАВУ ИЛИ ИНОМУ,
+ВОЗНИКШИМ ИЗ, ИМЕЮЩИМ ПРИЧИНОЙ ИЛИ СВЯЗАННЫМ С ПРОГРАММНЫМ ОБЕСПЕЧЕНИЕМ ИЛИ
+ИСПОЛЬЗОВАНИЕМ ПРОГРАММНОГО ОБЕСПЕЧЕНИЯ ИЛИ ИНЫМИ ДЕЙСТВИЯМИ С ПРОГРАММНЫМ ОБЕСПЕЧЕНИЕМ.
+"""
+
+import logging
+import os
+import sys
+from typing import Final, TextIO
+
+from colorama import Fore
+
+
+# ////////////////////////////////////////////////////////////////////////////
+# Имя корневого логгера и переменная окружения с уровнем
+# ////////////////////////////////////////////////////////////////////////////
+LOGGER_NAME: Final[str] = "Moon"
+LOG_LEVEL_ENV: Final[str] = "MOON_LOG_LEVEL"
+
+# ////////////////////////////////////////////////////////////////////////////
+# Уровни логирования
+# LOG_OFF выше любого стандартного уровня: isEnabledFor() всегда возвращает False
+# ////////////////////////////////////////////////////////////////////////////
+LOG_DEBUG: Final[int] = logging.DEBUG
+LOG_INFO: Final[int] = logging.INFO
+LOG_WARNING: Final[int] = logging.WARNING
+LOG_ERROR: Final[int] = logging.ERROR
+LOG_OFF: Final[int] = logging.CRITICAL + 10
+
+LOG_LEVEL_NAMES: Final[dict[str, int]] = {
+    "DEBUG": LOG_DEBUG,
+    "INFO": LOG_INFO,
+    "WARNING": LOG_WARNING,
+    "WARN": LOG_WARNING,
+    "ERROR": LOG_ERROR,
+    "OFF": LOG_OFF,
+}
+
+# Цвета уровней и подсистем в консольном выводе
+_LEVEL_STYLES: Final[dict[int, tuple[str, str]]] = {
+    logging.DEBUG: (Fore.GREEN, "debug"),
+    logging.INFO: (Fore.BLUE, "info"),
+    logging.WARNING: (Fore.YELLOW, "warn"),
+    logging.ERROR: (Fore.RED, "error"),
+    logging.CRITICAL: (Fore.RED, "critical"),
+}
+_DEFAULT_TAG_COLOR: Final[str] = Fore.CYAN
+_TAG_COLORS: Final[dict[str, str]] = {
+    "Machine": Fore.LIGHTCYAN_EX,
+    "FontLoader": Fore.MAGENTA,
+    "ShaderLoader": Fore.LIGHTBLUE_EX,
+    "Resources": Fore.MAGENTA,
+}
+
+
+class MoonLogFormatter(logging.Formatter):
+    """
+    #### Форматирует записи в привычном для Moon виде: `[ Tag ] [ level ] message`
+
+    ---
+
+    :Args:
+        colored (bool): Раскрашивать подсистему и уровень цветами colorama
+    """
+
+    def __init__(self, colored: bool = True):
+        super().__init__()
+        self.__colored = colored
+
+    def format(self, record: logging.LogRecord) -> str:
+        tag = record.name[len(LOGGER_NAME) + 1:] if record.name.startswith(LOGGER_NAME + ".") else record.name
+        level_color, level_name = _LEVEL_STYLES.get(record.levelno, (Fore.RESET, record.levelname.lower()))
+        message = record.getMessage()
+        if self.__colored:
+            tag_color = _TAG_COLORS.get(tag, _DEFAULT_TAG_COLOR)
+            line = f"[ {tag_color}{tag}{Fore.RESET} ] [ {level_color}{level_name}{Fore.RESET} ] {message}"
+        else:
+            line = f"[ {tag} ] [ {level_name} ] {message}"
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+# ////////////////////////////////////////////////////////////////////////////
+# Корневой логгер Moon (выключен по умолчанию)
+# ////////////////////////////////////////////////////////////////////////////
+MOON_LOGGER: Final[logging.Logger] = logging.getLogger(LOGGER_NAME)
+MOON_LOGGER.addHandler(logging.NullHandler())
+MOON_LOGGER.setLevel(LOG_OFF)
+
+# Консольный обработчик, установленный enable_logging()
+_console_handler: logging.Handler | None = None
+
+
+def get_logger(name: str | None = None) -> logging.Logger:
+    """
+    #### Возвращает логгер Moon или дочерний логгер подсистемы
+
+    ---
+
+    :Args:
+        name (str | None): Имя подсистемы (например, "FontLoader")
+
+    :Returns:
+        logging.Logger: `Moon` или `Moon.<name>`
+
+    ---
+
+    :Example:
+    ```python
+    LOGGER = get_logger("FontLoader")
+    LOGGER.debug("Scanning: %s", directory)  # Строка собирается только при включенном DEBUG
+    ```
+    """
+    if name is None:
+        return MOON_LOGGER
+    return MOON_LOGGER.getChild(name)
+
+
+def parse_log_level(level: int | str) -> int:
+    """
+    #### Преобразует уровень из строки ("debug", "OFF") или числа в числовой уровень
+
+    ---
+
+    :Raises:
+        ValueError: Неизвестное имя уровня
+    """
+    if isinstance(level, int):
+        return level
+    try:
+        return LOG_LEVEL_NAMES[level.strip().upper()]
+    except KeyError:
+        raise ValueError(f"Unknown Moon log level: '{level}' (expected one of {', '.join(LOG_LEVEL_NAMES)})") from None
+
+
+def set_log_level(level: int | str) -> None:
+    """
+    #### Устанавливает уровень логгера Moon
+
+    ---
+
+    :Description:
+    - Обработчики не добавляются: если приложение настроило `logging` само,
+      сообщения Moon уйдут в его обработчики
+    - `LOG_OFF` полностью отключает логирование
+
+    ---
+
+    :Args:
+        level (int | str): Уровень (LOG_DEBUG, "info", "OFF", ...)
+    """
+    MOON_LOGGER.setLevel(parse_log_level(level))
+
+
+def get_log_level() -> int:
+    """
+    #### Возвращает текущий уровень логгера Moon
+    """
+    return MOON_LOGGER.level
+
+
+def is_logging_enabled(level: int = LOG_INFO) -> bool:
+    """
+    #### Проверяет, будут ли выводиться сообщения указанного уровня
+    """
+    return MOON_LOGGER.isEnabledFor(level)
+
+
+def enable_logging(level: int | str = LOG_INFO, colored: bool = True, stream: TextIO | None = None) -> None:
+    """
+    #### Включает вывод сообщений Moon в консоль
+
+    ---
+
+    :Description:
+    - Добавляет один обработчик с форматом `[ Tag ] [ level ] message`
+    - Повторный вызов заменяет обработчик (можно сменить поток или цвет)
+    - Сообщения больше не передаются корневому логгеру, чтобы не дублироваться
+
+    ---
+
+    :Args:
+        level (int | str): Минимальный уровень сообщений
+        colored (bool): Цветной вывод через colorama
+        stream (TextIO | None): Поток вывода (по умолчанию sys.stdout)
+
+    ---
+
+    :Example:
+    ```python
+    from Moon.python.Log import enable_logging, LOG_DEBUG
+
+    enable_logging(LOG_DEBUG)  # Подробный вывод при разработке
+    ```
+    """
+    global _console_handler
+    if _console_handler is not None:
+        MOON_LOGGER.removeHandler(_console_handler)
+    _console_handler = logging.StreamHandler(stream if stream is not None else sys.stdout)
+    _console_handler.setFormatter(MoonLogFormatter(colored))
+    MOON_LOGGER.addHandler(_console_handler)
+    MOON_LOGGER.propagate = False
+    set_log_level(level)
+
+
+def disable_logging() -> None:
+    """
+    #### Отключает логирование Moon и убирает консольный обработчик
+    """
+    global _console_handler
+    if _console_handler is not None:
+        MOON_LOGGER.removeHandler(_console_handler)
+        _console_handler = None
+    MOON_LOGGER.propagate = True
+    MOON_LOGGER.setLevel(LOG_OFF)
+
+
+def _configure_from_environment() -> None:
+    value = os.environ.get(LOG_LEVEL_ENV)
+    if not value:
+        return
+    try:
+        level = parse_log_level(value)
+    except ValueError:
+        sys.stderr.write(f"[ Moon ] Ignoring invalid {LOG_LEVEL_ENV}='{value}'\n")
+        return
+    if level >= LOG_OFF:
+        disable_logging()
+    else:
+        enable_logging(level)
+
+
+_configure_from_environment()
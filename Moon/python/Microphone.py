@@ -4,6 +4,11 @@ import numpy as np
 from scipy import signal
 from scipy.fft import fft, fftfreq
 
+from Moon.python.Log import get_logger
+
+# Логгер анализа звука с микрофона
+LOGGER = get_logger("Microphone")
+
 class SimpleMicrophone:
     def __init__(self, samplerate=44100, chunk_duration=0.1):
         self.samplerate = samplerate
@@ -58,7 +63,7 @@ class SimpleMicrophone:
             return 0.0
             
         except Exception as e:
-            print(f"Ошибка при вычислении высоты звука: {e}")
+            LOGGER.error("Pitch calculation failed: %s", e)
             return 0.0
     
     def _calculate_pitch_fft(self, audio_data, min_freq=80, max_freq=1000):
@@ -94,7 +99,7 @@ class SimpleMicrophone:
             return 0.0
             
         except Exception as e:
-            print(f"Ошибка при вычислении высоты звука (FFT): {e}")
+            LOGGER.error("Pitch calculation failed (FFT): %s", e)
             return 0.0
     
     def start(self):
@@ -0,0 +1,454 @@
+"""
+#### *Модуль асинхронной загрузки текстур в Moon*
+
+---
+
+##### Версия: 1.0.0
+
+*Автор: Павлов Иван (Pavlov Ivan)*
+
+*Лицензия: MIT*
+##### Реализованно на 90%
+
+---
+
+✓ Фоновое декодирование:
+  - PNG/JPG/BMP/TGA декодируются в оперативную память (Image) рабочими потоками Threader
+  - Нативное декодирование отпускает GIL, поэтому потоки работают параллельно
+
+✓ Загрузка в видеопамять в потоке рендеринга:
+  - Готовые изображения загружаются в GPU между кадрами
+  - Бюджет времени на кадр: окно не "замерзает" при загрузке сотен файлов
+
+✓ Будущие текстуры (TextureFuture):
+  - Объект Texture2D выдается сразу и становится валидным после загрузки
+  - Текстура-заглушка на время загрузки и колбэки готовности
+
+---
+
+:Requires:
+
+• Python 3.12+
+
+• Moon.python.Threader (Worker)
+
+• Moon.python.Rendering.Sprites (Texture2D, Image)
+
+---
+
+== Лицензия MIT ==================================================
+
+[MIT License]
+Copyright (c) 2025 Pavlov Ivan
+
+Данная лицензия разрешает лицам, получившим копию данного программного обеспечения
+и сопутствующей документации (в дальнейшем именуемыми «Программное Обеспечение»),
+безвозмездно использовать Программное Обеспечение без ограничений, включая неограниченное
+право на использование, копирование, изменение, слияние, публикацию, распространение,
+сублицензирование и/или продажу копий Программного Обеспечения, а также лицам, которым
+предоставляется данное Программное Обеспечение, при соблюдении следующих условий:
+
+[ Уведомление об авторском праве и данные условия должны быть включены во все копии ]
+[                 или значительные части Программного Обеспечения.                  ]
+
+ПРОГРАММНОЕ ОБЕСПЕЧЕНИЕ ПРЕДОСТАВЛЯЕТСЯ «КАК ЕСТЬ», БЕЗ КАКИХ-ЛИБО ГАРАНТИЙ, ЯВНО
+ВЫРАЖЕННЫХ ИЛИ ПОДРАЗУМЕВАЕМЫХ, ВКЛЮЧАЯ, НО НЕ ОГРАНИЧИВАЯСЬ ГАРАНТИЯМИ ТОВАРНОЙ
+ПРИГОДНОСТИ, СООТВЕТСТВИЯ ПО ЕГО КОНКРЕТНОМУ НАЗНАЧЕНИЮ И ОТСУТСТВИЯ НАРУШЕНИЙ ПРАВ.
+НИ В КАКОМ СЛУЧАЕ АВТОРЫ ИЛИ ПРАВООБЛАДАТЕЛИ НЕ НЕСУТ ОТВЕТСТВЕННОСТИ ПО ИСКАМ О
+ВОЗМЕЩЕНИИ УЩЕРБА, УБЫТКОВ ИЛИ ДРУГИХ ТРЕБОВАНИЙ ПО ДЕЙСТВУЮЩЕМУ ПРАВУ ИЛИ ИНОМУ,
+ВОЗНИКШИМ ИЗ, ИМЕЮЩИМ ПРИЧИНОЙ ИЛИ СВЯЗАННЫМ С ПРОГРАММНЫМ ОБЕСПЕЧЕНИЕМ ИЛИ
+ИСПОЛЬЗОВАНИЕМ ПРОГРАММНОГО ОБЕСПЕЧЕНИЯ ИЛИ ИНЫМИ ДЕЙСТВИЯМИ С ПРОГРАММНЫМ ОБЕСПЕЧЕНИЕМ.
+"""
+
+import os
+import time
+import queue
+from collections import deque
+from typing import Any, Callable, Final, Self
+
+from Moon.python.Log import get_logger
+from Moon.python.Threader import Worker
+from Moon.python.Rendering.Sprites import Texture2D, Image
+
+# Логгер фоновой загрузки текстур
+LOGGER = get_logger("AsyncTextures")
+
+
+# ////////////////////////////////////////////////////////////////////////////
+# Состояния загрузки текстуры
+# ////////////////////////////////////////////////////////////////////////////
+TEXTURE_LOAD_PENDING: Final[int] = 0   # Файл в очереди или декодируется
+TEXTURE_LOAD_READY: Final[int] = 1     # Текстура загружена в видеопамять
+TEXTURE_LOAD_FAILED: Final[int] = 2    # Файл не удалось прочитать или загрузить
+
+# ////////////////////////////////////////////////////////////////////////////
+# Параметры загрузчика по умолчанию
+# ////////////////////////////////////////////////////////////////////////////
+DEFAULT_DECODE_WORKERS: Final[int] = 2          # Количество потоков декодирования
+DEFAULT_UPLOAD_BUDGET: Final[float] = 0.004     # Время на загрузку в GPU за кадр (секунды)
+
+
+type TextureFutureCallback = Callable[["TextureFuture"], Any]
+
+
+class TextureFuture:
+    """
+    #### Текстура, загружаемая в фоне
+
+    ---
+
+    :Description:
+    - Объект Texture2D создается сразу и остается тем же после загрузки,
+      поэтому ссылки на него можно раздавать заранее
+    - До загрузки `get()` возвращает текстуру-заглушку (если задана)
+    - Колбэки `on_ready` вызываются в потоке рендеринга после завершения загрузки
+      (в том числе неудачной - проверяйте `is_failed()`)
+
+    ---
+
+    :Note:
+    - Спрайт, связанный с пустой текстурой, получает нулевой texture rect.
+      Связывайте спрайт в колбэке `on_ready` или обновляйте rect вручную
+    """
+
+    __slots__ = ('__path', '__texture', '__placeholder', '__state', '__callbacks')
+
+    def __init__(self, path: str, placeholder: Texture2D | None = None):
+        """
+        #### Создает будущую текстуру для указанного файла
+
+        ---
+
+        :Args:
+        - path (str): Путь к файлу изображения
+        - placeholder (Texture2D | None): Текстура, возвращаемая до завершения загрузки
+        """
+        self.__path: str = path
+        self.__texture: Texture2D = Texture2D()
+        self.__placeholder: Texture2D | None = placeholder
+        self.__state: int = TEXTURE_LOAD_PENDING
+        self.__callbacks: list[TextureFutureCallback] = []
+
+    def get_path(self) -> str:
+        """
+        #### Возвращает путь к загружаемому файлу
+        """
+        return self.__path
+
+    def get_state(self) -> int:
+        """
+        #### Возвращает состояние загрузки (TEXTURE_LOAD_*)
+        """
+        return self.__state
+
+    def is_ready(self) -> bool:
+        """
+        #### Проверяет, загружена ли текстура в видеопамять
+        """
+        return self.__state == TEXTURE_LOAD_READY
+
+    def is_failed(self) -> bool:
+        """
+        #### Проверяет, завершилась ли загрузка ошибкой
+        """
+        return self.__state == TEXTURE_LOAD_FAILED
+
+    def is_done(self) -> bool:
+        """
+        #### Проверяет, завершена ли загрузка (успешно или с ошибкой)
+        """
+        return self.__state != TEXTURE_LOAD_PENDING
+
+    def get_texture(self) -> Texture2D:
+        """
+        #### Возвращает целевую текстуру
+
+        ---
+
+        :Returns:
+            Texture2D: Текстура, которая станет валидной после загрузки
+        """
+        return self.__texture
+
+    def get_placeholder(self) -> Texture2D | None:
+        """
+        #### Возвращает текстуру-заглушку
+        """
+        return self.__placeholder
+
+    def set_placeholder(self, placeholder: Texture2D | None) -> Self:
+        """
+        #### Устанавливает текстуру-заглушку
+        """
+        self.__placeholder = placeholder
+        return self
+
+    def get(self) -> Texture2D:
+        """
+        #### Возвращает текстуру, пригодную для отрисовки прямо сейчас
+
+        ---
+
+        :Returns:
+            Texture2D: Загруженная текстура, а до загрузки (или при ошибке) - заглушка,
+            если она задана, иначе пустая целевая текстура
+        """
+        if self.__state == TEXTURE_LOAD_READY or self.__placeholder is None:
+            return self.__texture
+        return self.__placeholder
+
+    def on_ready(self, callback: TextureFutureCallback) -> Self:
+        """
+        #### Добавляет колбэк завершения загрузки
+
+        ---
+
+        :Description:
+        - Если загрузка уже завершена, колбэк вызывается сразу
+
+        ---
+
+        :Args:
+        - callback (Callable[[TextureFuture], Any]): Функция, получающая этот объект
+        """
+        if self.__state != TEXTURE_LOAD_PENDING:
+            callback(self)
+        else:
+            self.__callbacks.append(callback)
+        return self
+
+    def _complete(self, image: Image | None) -> bool:
+        """
+        #### Загружает декодированное изображение в видеопамять (только поток рендеринга)
+
+        ---
+
+        :Args:
+        - image (Image | None): Декодированное изображение или None при ошибке чтения
+
+        :Returns:
+            bool: True, если текстура успешно загружена
+        """
+        if image is not None and self.__texture.load_from_image(image):
+            self.__state = TEXTURE_LOAD_READY
+        else:
+            self.__state = TEXTURE_LOAD_FAILED
+
+        callbacks = self.__callbacks
+        self.__callbacks = []
+        for callback in callbacks:
+            callback(self)
+        return self.__state == TEXTURE_LOAD_READY
+
+
+class AsyncTextureLoader:
+    """
+    #### Асинхронный загрузчик текстур
+
+    ---
+
+    :Description:
+    - Файлы декодируются в Image рабочими потоками (Threader.Worker)
+    - Загрузка в видеопамять выполняется в потоке рендеринга методом `upload()`
+      с ограничением по времени на кадр; окно вызывает его автоматически в `update()`
+    - Повторный запрос файла, который еще загружается, возвращает тот же TextureFuture
+    - Потоки создаются при первом запросе загрузки
+
+    ---
+
+    :Example:
+    ```python
+    loader = get_texture_loader()
+    futures = loader.load_many(glob.glob("assets/level_1/*.png"))
+
+    while window.update(events):   # окно загружает готовые текстуры каждый кадр
+        progress = 1 - loader.get_pending_count() / len(futures)
+        ...
+    ```
+    """
+
+    __slots__ = ('__workers_count', '__workers', '__jobs', '__decoded', '__in_flight', '__upload_budget')
+
+    def __init__(self, workers: int = DEFAULT_DECODE_WORKERS, upload_budget: float = DEFAULT_UPLOAD_BUDGET):
+        """
+        #### Создает загрузчик
+
+        ---
+
+        :Args:
+        - workers (int): Количество потоков декодирования
+        - upload_budget (float): Время на загрузку в GPU за один вызов `upload()` (секунды)
+        """
+        self.__workers_count: int = max(1, int(workers))
+        self.__workers: list[Worker] = []
+
+        # Очередь файлов на декодирование (главный поток -> рабочие)
+        self.__jobs: queue.SimpleQueue[TextureFuture | None] = queue.SimpleQueue()
+        # Декодированные изображения (рабочие -> главный поток); append/popleft потокобезопасны
+        self.__decoded: deque[tuple[TextureFuture, Image | None]] = deque()
+
+        # Незавершенные загрузки по пути (используется только в потоке рендеринга)
+        self.__in_flight: dict[str, TextureFuture] = {}
+        self.__upload_budget: float = upload_budget
+
+    def __decode_loop(self, worker: Worker) -> None:
+        # Цикл рабочего потока: декодирует файлы до получения None
+        while True:
+            future = self.__jobs.get()
+            if future is None:
+                break
+            # Ошибка одного файла не должна останавливать поток: будущая текстура
+            # получает статус FAILED, а поток продолжает работу
+            try:
+                image = Image()
+                if not image.load_from_file(future.get_path()):
+                    image = None
+            except Exception:
+                LOGGER.exception("Failed to decode texture: '%s'", future.get_path())
+                image = None
+            self.__decoded.append((future, image))
+
+    def __ensure_workers(self) -> None:
+        # Завершившиеся потоки заменяются новыми
+        self.__workers = [worker for worker in self.__workers if worker.worked()]
+        for _ in range(self.__workers_count - len(self.__workers)):
+            worker = Worker().set_daemon(True)
+            worker.start(self.__decode_loop)
+            self.__workers.append(worker)
+
+    def load(self, path: str | os.PathLike, placeholder: Texture2D | None = None) -> TextureFuture:
+        """
+        #### Ставит файл в очередь фоновой загрузки
+
+        ---
+
+        :Args:
+        - path (str | os.PathLike): Путь к файлу изображения
+        - placeholder (Texture2D | None): Текстура-заглушка на время загрузки
+
+        :Returns:
+            TextureFuture: Будущая текстура
+        """
+        path = os.fspath(path)
+        future = self.__in_flight.get(path)
+        if future is not None:
+            if placeholder is not None:
+                future.set_placeholder(placeholder)
+            return future
+
+        self.__ensure_workers()
+        future = TextureFuture(path, placeholder)
+        self.__in_flight[path] = future
+        self.__jobs.put(future)
+        return future
+
+    def load_many(self, paths: list[str | os.PathLike], placeholder: Texture2D | None = None) -> list[TextureFuture]:
+        """
+        #### Ставит несколько файлов в очередь фоновой загрузки
+
+        ---
+
+        :Returns:
+            list[TextureFuture]: Будущие текстуры в порядке путей
+        """
+        return [self.load(path, placeholder) for path in paths]
+
+    def has_pending_uploads(self) -> bool:
+        """
+        #### Проверяет, есть ли декодированные изображения, ожидающие загрузки в GPU
+        """
+        return bool(self.__decoded)
+
+    def get_pending_count(self) -> int:
+        """
+        #### Возвращает количество незавершенных загрузок (в очереди, декодируются или ждут GPU)
+        """
+        return len(self.__in_flight)
+
+    def is_idle(self) -> bool:
+        """
+        #### Проверяет, завершены ли все запрошенные загрузки
+        """
+        return not self.__in_flight
+
+    def set_upload_budget(self, seconds: float) -> Self:
+        """
+        #### Устанавливает время на загрузку в GPU за кадр
+
+        ---
+
+        :Args:
+        - seconds (float): Бюджет в секундах. За вызов `upload()` всегда загружается
+          хотя бы одна текстура, чтобы загрузка не остановилась при малом бюджете
+        """
+        self.__upload_budget = max(0.0, seconds)
+        return self
+
+    def get_upload_budget(self) -> float:
+        """
+        #### Возвращает время на загрузку в GPU за кадр (секунды)
+        """
+        return self.__upload_budget
+
+    def upload(self, budget: float | None = None) -> int:
+        """
+        #### Загружает декодированные изображения в видеопамять (только поток рендеринга)
+
+        ---
+
+        :Args:
+        - budget (float | None): Ограничение по времени в секундах (None - бюджет загрузчика)
+
+        :Returns:
+            int: Количество обработанных текстур
+        """
+        decoded = self.__decoded
+        if not decoded:
+            return 0
+
+        deadline = time.perf_counter() + (self.__upload_budget if budget is None else budget)
+        processed = 0
+        while decoded:
+            if processed and time.perf_counter() >= deadline:
+                break
+            future, image = decoded.popleft()
+            self.__in_flight.pop(future.get_path(), None)
+            future._complete(image)
+            processed += 1
+        return processed
+
+    def finish(self) -> int:
+        """
+        #### Блокирующе дожидается и загружает все запрошенные текстуры
+
+        ---
+
+        :Returns:
+            int: Количество обработанных текстур
+        """
+        processed = 0
+        while self.__in_flight:
+            if self.__decoded:
+                processed += self.upload(float('inf'))
+            else:
+                time.sleep(0.001)
+        return processed
+
+    def shutdown(self) -> None:
+        """
+        #### Останавливает рабочие потоки после обработки уже поставленных файлов
+        """
+        for _ in self.__workers:
+            self.__jobs.put(None)
+        self.__workers = []
+
+
+# Глобальный загрузчик, обслуживаемый окном в Window.update()
+TEXTURE_LOADER: Final[AsyncTextureLoader] = AsyncTextureLoader()
+
+
+def get_texture_loader() -> AsyncTextureLoader:
+    """
+    #### Возвращает глобальный асинхронный загрузчик текстур
+    """
+    return TEXTURE_LOADER
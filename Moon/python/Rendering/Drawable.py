@@ -1,5 +1,6 @@
 from typing import TypeVar
 from Moon.python.Rendering.Text import Text, BaseText
+from Moon.python.Rendering.RichText import RichText
 from Moon.python.Rendering.Shapes import *
 from Moon.python.Rendering.Shapes.Rectangle import *
 from Moon.python.Rendering.Shapes.Circle import *
@@ -9,9 +10,9 @@ from Moon.python.Rendering.Vertexes import VertexList
 Sprite2D = TypeVar('Sprite2D')
 AnimatedSprite2D = TypeVar('AnimatedSprite2D')
 
-type Drawable = CircleShape | RectangleShape | Text | BaseText | VertexList | PolylineShape | LineShape
+type Drawable = CircleShape | RectangleShape | Text | BaseText | RichText | VertexList | PolylineShape | LineShape
              #LineShape | BaseLineShape | PolygoneShape | LineThinShape | LinesThinShape
 
-DrawableTuple = (CircleShape | RectangleShape | Text | BaseText | VertexList | PolylineShape | LineShape | \
+DrawableTuple = (CircleShape | RectangleShape | Text | BaseText | RichText | VertexList | PolylineShape | LineShape | \
             #LineShape | BaseLineShape | PolygoneShape | LineThinShape | LinesThinShape | \
              Sprite2D | AnimatedSprite2D)
@@ -3,13 +3,10 @@ from typing import Self
 from Moon.python.Rendering.Shaders import *
 from enum import Enum
 
-from Moon.python.utils import find_library
+from Moon.python.utils import get_native_library
 
-# Загружаем DLL библиотеку
-try:
-    LIB_MOON = ctypes.CDLL(find_library())
-except Exception as e:
-    raise ImportError(f"Failed to load PySGL library: {e}")
+# Общий дескриптор нативной библиотеки (загружается при первом вызове нативной функции)
+LIB_MOON = get_native_library()
 
 
 LIB_MOON._BlendMode_CreateFull.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int,
@@ -0,0 +1,801 @@
+"""
+#### *Модуль многострочного форматированного текста в Moon*
+
+---
+
+##### Версия: 1.0.0
+
+*Автор: Павлов Иван (Pavlov Ivan)*
+
+*Лицензия: MIT*
+##### Реализованно на 90%
+
+---
+
+✓ Разметка многострочного текста:
+  - Перенос слов по заданной ширине
+  - Встроенные цвета и стили для отдельных фрагментов
+  - Явные переводы строк и абзацы
+
+✓ Кэширование:
+  - Ширина слов измеряется один раз и хранится в кэше
+  - Разбиение на строки пересчитывается только для изменённых абзацев
+  - Добавление текста в конец (чат, лог) не трогает уже размеченные строки
+
+✓ Виртуализация отрисовки:
+  - Рисуются только строки, попадающие в видимую область
+  - Нативные текстовые объекты переиспользуются из пула
+  - Повторная установка строки/цвета/стиля пропускается, если они не изменились
+
+✓ Готовые интерфейсы:
+  - TextSpan - фрагмент текста с цветом и стилем
+  - GlyphRun - размеченный отрезок строки
+  - LayoutLine - строка после переноса
+  - RichText - компонент разметки и отрисовки
+
+---
+
+:Requires:
+
+• Python 3.12+
+
+• Moon.python.Rendering.Text (Font, BaseText)
+
+---
+
+== Лицензия MIT ==================================================
+
+[MIT License]
+Copyright (c) 2025 Pavlov Ivan
+
+Данная лицензия разрешает лицам, получившим копию данного программного обеспечения
+и сопутствующей документации (в дальнейшем именуемыми «Программное Обеспечение»),
+безвозмездно использовать Программное Обеспечение без ограничений, включая неограниченное
+право на использование, копирование, изменение, слияние, публикацию, распространение,
+сублицензирование и/или продажу копий Программного Обеспечения, а также лицам, которым
+предоставляется данное Программное Обеспечение, при соблюдении следующих условий:
+
+[ Уведомление об авторском праве и данные условия должны быть включены во все копии ]
+[                 или значительные части Программного Обеспечения.                  ]
+
+ПРОГРАММНОЕ ОБЕСПЕЧЕНИЕ ПРЕДОСТАВЛЯЕТСЯ «КАК ЕСТЬ», БЕЗ КАКИХ-ЛИБО ГАРАНТИЙ, ЯВНО
+ВЫРАЖЕННЫХ ИЛИ ПОДРАЗУМЕВАЕМЫХ, ВКЛЮЧАЯ, НО НЕ ОГРАНИЧИВАЯСЬ ГАРАНТИЯМИ ТОВАРНОЙ
+ПРИГОДНОСТИ, СООТВЕТСТВИЯ ПО ЕГО КОНКРЕТНОМУ НАЗНАЧЕНИЮ И ОТСУТСТВИЯ НАРУШЕНИЙ ПРАВ.
+НИ В КАКОМ СЛУЧАЕ АВТОРЫ ИЛИ ПРАВООБЛАДАТЕЛИ НЕ НЕСУТ ОТВЕТСТВЕННОСТИ ПО ИСКАМ О
+ВОЗМЕЩЕНИИ УЩЕРБА, УБЫТКОВ ИЛИ ДРУГИХ ТРЕБОВАНИЙ ПО ДЕЙСТВУЮЩЕМУ ПРАВУ ИЛИ ИНОМУ,
+ВОЗНИКШИМ ИЗ, ИМЕЮЩИМ ПРИЧИНОЙ ИЛИ СВЯЗАННЫМ С ПРОГРАММНЫМ ОБЕСПЕЧЕНИЕМ ИЛИ
+ИСПОЛЬЗОВАНИЕМ ПРОГРАММНОГО ОБЕСПЕЧЕНИЯ ИЛИ ИНЫМИ ДЕЙСТВИЯМИ С ПРОГРАММНЫМ ОБЕСПЕЧЕНИЕМ.
+"""
+
+import re
+import math
+from typing import Self, Final
+
+from Moon.python.Colors import *
+from Moon.python.Vectors import Vec2f
+from Moon.python.Rendering.Text import Font, BaseText, TextStyle
+
+
+# Регулярное выражение разбиения фрагмента на слова и пробелы ========= +
+TOKEN_PATTERN: Final[re.Pattern] = re.compile(r"\S+|\s+")              #
+# ==================================================================== +
+
+# Максимум слов в кэше ширины (при переполнении кэш очищается) ======= +
+WIDTH_CACHE_LIMIT: Final[int] = 4096                                   #
+# ==================================================================== +
+
+
+class TextSpan:
+    """
+    #### Фрагмент текста с единым цветом и стилем
+
+    ---
+
+    :Description:
+    - Минимальная единица разметки RichText
+    - Не содержит переводов строк (они разбивают текст на абзацы)
+    """
+
+    __slots__ = ('text', 'color', 'style')
+
+    def __init__(self, text: str, color: Color | None = None, style: TextStyle = TextStyle.REGULAR):
+        """
+        #### Инициализация фрагмента
+
+        ---
+
+        :Args:
+        - text (str): Текст фрагмента
+        - color (Color | None): Цвет фрагмента (None = цвет по умолчанию RichText)
+        - style (TextStyle): Стиль фрагмента
+        """
+        self.text: str = text
+        self.color: Color | None = color
+        self.style: TextStyle = style
+
+    def is_bold(self) -> bool:
+        return bool(self.style.value & TextStyle.BOLD.value)
+
+    def __repr__(self) -> str:
+        return f"TextSpan({self.text!r}, {self.color}, {self.style.name})"
+
+
+class GlyphRun:
+    """
+    #### Размеченный отрезок строки
+
+    ---
+
+    :Description:
+    - Непрерывная последовательность символов одного фрагмента внутри строки
+    - Хранит готовое смещение по X, поэтому при отрисовке ничего не измеряется
+    """
+
+    __slots__ = ('text', 'span', 'x', 'width')
+
+    def __init__(self, text: str, span: TextSpan, x: float, width: float):
+        self.text: str = text
+        self.span: TextSpan = span
+        self.x: float = x
+        self.width: float = width
+
+    def __repr__(self) -> str:
+        return f"GlyphRun({self.text!r}, x={self.x}, width={self.width})"
+
+
+class LayoutLine:
+    """
+    #### Строка после переноса
+
+    ---
+
+    :Description:
+    - Набор отрезков GlyphRun и итоговая ширина строки
+    """
+
+    __slots__ = ('runs', 'width')
+
+    def __init__(self):
+        self.runs: list[GlyphRun] = []
+        self.width: float = 0
+
+    def __repr__(self) -> str:
+        return f"LayoutLine(runs={len(self.runs)}, width={self.width})"
+
+
+class RichText:
+    """
+    #### Компонент многострочного форматированного текста
+
+    ---
+
+    :Description:
+    - Переносит текст по ширине, поддерживает цвета и стили отдельных фрагментов
+    - Кэширует ширину слов и разбиение абзацев на строки
+    - При изменении текста заново размечаются только изменённые абзацы
+    - Отрисовывает только видимые строки, переиспользуя пул BaseText
+
+    ---
+
+    :Features:
+    - Прокрутка содержимого (чат, лог, диалоговое окно)
+    - Ограничение количества хранимых абзацев
+    - Работает через стандартный `window.draw(rich_text)`
+
+    ---
+
+    :Example:
+    ```python
+    chat = RichText(font, size=18).set_wrap_width(400).set_viewport_height(300)
+    chat.append("Игрок: ", COLOR_YELLOW, TextStyle.BOLD).append("привет всем!\\n")
+    chat.scroll_to_end()
+    window.draw(chat)
+    ```
+    """
+
+    __slots__ = ('__font', '__size', '__letter_spacing', '__line_spacing_factor', '__default_color',
+                 '__wrap_width', '__viewport_height', '__scroll', '__position', '__max_paragraphs',
+                 '__paragraphs', '__lines', '__paragraph_line_start', '__dirty_from',
+                 '__width_cache', '__text_pool', '__text_pool_state')
+
+    def __init__(self, font: Font, size: int = 16):
+        """
+        #### Инициализация компонента
+
+        ---
+
+        :Args:
+        - font (Font): Шрифт для всего текста
+        - size (int): Размер шрифта в пикселях
+        """
+        self.__font: Font = font
+        self.__size: int = int(size)
+        self.__letter_spacing: float = 1.0
+        self.__line_spacing_factor: float = 1.0
+        self.__default_color: Color = COLOR_BLACK
+
+        self.__wrap_width: float = 0            # 0 = без переноса
+        self.__viewport_height: float = 0       # 0 = рисовать все строки
+        self.__scroll: float = 0
+        self.__position: Vec2f = Vec2f(0, 0)
+        self.__max_paragraphs: int = 0          # 0 = без ограничения
+
+        # Исходные данные: абзацы из фрагментов
+        self.__paragraphs: list[list[TextSpan]] = [[]]
+
+        # Результат разметки и индекс первой строки каждого абзаца
+        self.__lines: list[LayoutLine] = []
+        self.__paragraph_line_start: list[int] = []
+        self.__dirty_from: int | None = 0
+
+        # Кэш ширины слов: (слово, жирный) -> ширина
+        self.__width_cache: dict[tuple[str, bool], float] = {}
+
+        # Пул нативных текстов и последнее установленное в них состояние
+        self.__text_pool: list[BaseText] = []
+        self.__text_pool_state: list[tuple | None] = []
+
+    # ==================================================================
+    # Изменение содержимого
+    # ==================================================================
+
+    def append(self, text: str, color: Color | None = None, style: TextStyle = TextStyle.REGULAR) -> Self:
+        """
+        #### Добавляет текст в конец
+
+        ---
+
+        :Description:
+        - Символ `\\n` начинает новый абзац
+        - Размечается заново только последний абзац и новые абзацы
+
+        ---
+
+        :Args:
+        - text (str): Добавляемый текст
+        - color (Color | None): Цвет фрагмента (None = цвет по умолчанию)
+        - style (TextStyle): Стиль фрагмента
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+        """
+        self.__mark_dirty(len(self.__paragraphs) - 1)
+        parts = text.split('\n')
+        for i, part in enumerate(parts):
+            if i > 0:
+                self.__paragraphs.append([])
+            if part:
+                self.__paragraphs[-1].append(TextSpan(part, color, style))
+        self.__trim_paragraphs()
+        return self
+
+    def append_line(self, text: str, color: Color | None = None, style: TextStyle = TextStyle.REGULAR) -> Self:
+        """
+        #### Добавляет текст отдельным абзацем
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+        """
+        if self.__paragraphs[-1]:
+            self.append('\n')
+        return self.append(text, color, style)
+
+    def set_text(self, text: str, color: Color | None = None, style: TextStyle = TextStyle.REGULAR) -> Self:
+        """
+        #### Заменяет всё содержимое одним фрагментом
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+        """
+        self.clear()
+        return self.append(text, color, style)
+
+    def set_spans(self, spans: list[TextSpan]) -> Self:
+        """
+        #### Заменяет всё содержимое списком фрагментов
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+        """
+        self.clear()
+        for span in spans:
+            self.append(span.text, span.color, span.style)
+        return self
+
+    def clear(self) -> Self:
+        """
+        #### Удаляет весь текст
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+        """
+        self.__paragraphs = [[]]
+        self.__scroll = 0
+        self.__mark_dirty(0)
+        return self
+
+    def set_max_paragraphs(self, count: int) -> Self:
+        """
+        #### Ограничивает число хранимых абзацев
+
+        ---
+
+        :Description:
+        - Самые старые абзацы удаляются при переполнении (удобно для логов)
+
+        ---
+
+        :Args:
+        - count (int): Максимум абзацев (0 = без ограничения)
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+        """
+        self.__max_paragraphs = max(0, int(count))
+        self.__trim_paragraphs()
+        return self
+
+    # ==================================================================
+    # Параметры разметки
+    # ==================================================================
+
+    def set_wrap_width(self, width: float) -> Self:
+        """
+        #### Устанавливает ширину переноса строк
+
+        ---
+
+        :Args:
+        - width (float): Ширина в пикселях (0 = без переноса)
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+        """
+        width = max(0.0, float(width))
+        if width != self.__wrap_width:
+            self.__wrap_width = width
+            self.__mark_dirty(0)
+        return self
+
+    def get_wrap_width(self) -> float:
+        return self.__wrap_width
+
+    def set_size(self, size: int) -> Self:
+        """
+        #### Устанавливает размер шрифта
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+        """
+        size = int(size)
+        if size != self.__size:
+            self.__size = size
+            self.__width_cache.clear()
+            self.__text_pool_state = [None] * len(self.__text_pool)
+            for text in self.__text_pool:
+                text.set_size(size)
+            self.__mark_dirty(0)
+        return self
+
+    def get_size(self) -> int:
+        return self.__size
+
+    def set_letter_spacing(self, spacing: float) -> Self:
+        """
+        #### Устанавливает коэффициент межбуквенного интервала
+
+        ---
+
+        :Args:
+        - spacing (float): Коэффициент (1.0 = обычный интервал)
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+        """
+        if spacing != self.__letter_spacing:
+            self.__letter_spacing = spacing
+            self.__width_cache.clear()
+            for text in self.__text_pool:
+                text.set_letter_spacing(spacing)
+            self.__mark_dirty(0)
+        return self
+
+    def set_line_spacing(self, factor: float) -> Self:
+        """
+        #### Устанавливает множитель межстрочного интервала
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+        """
+        self.__line_spacing_factor = factor
+        return self
+
+    def set_default_color(self, color: Color) -> Self:
+        """
+        #### Устанавливает цвет фрагментов без собственного цвета
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+        """
+        self.__default_color = color
+        return self
+
+    def set_position(self, x: float, y: float) -> Self:
+        """
+        #### Устанавливает позицию левого верхнего угла области текста
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+        """
+        self.__position.x = x
+        self.__position.y = y
+        return self
+
+    def get_position(self) -> Vec2f:
+        return self.__position
+
+    # ==================================================================
+    # Прокрутка и видимая область
+    # ==================================================================
+
+    def set_viewport_height(self, height: float) -> Self:
+        """
+        #### Устанавливает высоту видимой области
+
+        ---
+
+        :Description:
+        - Строки вне области [scroll, scroll + height] не отрисовываются
+
+        ---
+
+        :Args:
+        - height (float): Высота в пикселях (0 = рисовать все строки)
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+        """
+        self.__viewport_height = max(0.0, float(height))
+        return self
+
+    def set_scroll(self, offset: float) -> Self:
+        """
+        #### Устанавливает вертикальную прокрутку
+
+        ---
+
+        :Args:
+        - offset (float): Смещение содержимого вверх в пикселях
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+        """
+        self.__scroll = min(max(0.0, float(offset)), self.get_max_scroll())
+        return self
+
+    def scroll(self, delta: float) -> Self:
+        """
+        #### Прокручивает содержимое на delta пикселей
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+        """
+        return self.set_scroll(self.__scroll + delta)
+
+    def scroll_to_end(self) -> Self:
+        """
+        #### Прокручивает содержимое к последней строке
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+        """
+        self.__scroll = self.get_max_scroll()
+        return self
+
+    def get_scroll(self) -> float:
+        return self.__scroll
+
+    def get_max_scroll(self) -> float:
+        """
+        #### Возвращает максимальное значение прокрутки
+
+        ---
+
+        :Returns:
+        - float: 0, если весь текст помещается в видимую область
+        """
+        if self.__viewport_height <= 0:
+            return 0.0
+        return max(0.0, self.get_content_height() - self.__viewport_height)
+
+    # ==================================================================
+    # Результат разметки
+    # ==================================================================
+
+    def get_line_height(self) -> float:
+        """
+        #### Возвращает высоту одной строки в пикселях
+        """
+        return self.__font.get_line_spacing(self.__size) * self.__line_spacing_factor
+
+    def get_lines(self) -> list[LayoutLine]:
+        """
+        #### Возвращает размеченные строки
+
+        ---
+
+        :Returns:
+        - list[LayoutLine]: Строки после переноса (не изменяйте их)
+        """
+        self.__relayout()
+        return self.__lines
+
+    def get_line_count(self) -> int:
+        self.__relayout()
+        return len(self.__lines)
+
+    def get_content_height(self) -> float:
+        """
+        #### Возвращает полную высоту размеченного текста в пикселях
+        """
+        return self.get_line_count() * self.get_line_height()
+
+    def get_content_width(self) -> float:
+        """
+        #### Возвращает ширину самой длинной строки в пикселях
+        """
+        self.__relayout()
+        return max((line.width for line in self.__lines), default=0.0)
+
+    def get_ptr(self) -> Self:
+        """
+        #### Возвращает сам объект
+
+        ---
+
+        :Description:
+        - RichText не имеет собственного нативного объекта,
+          окно вызывает `special_draw` для его отрисовки
+        """
+        return self
+
+    # ==================================================================
+    # Внутренняя разметка
+    # ==================================================================
+
+    def __mark_dirty(self, paragraph_index: int) -> None:
+        if self.__dirty_from is None or paragraph_index < self.__dirty_from:
+            self.__dirty_from = max(0, paragraph_index)
+
+    def __trim_paragraphs(self) -> None:
+        if self.__max_paragraphs <= 0:
+            return
+        overflow = len(self.__paragraphs) - self.__max_paragraphs
+        if overflow <= 0:
+            return
+        del self.__paragraphs[:overflow]
+
+        # Абзацы, разметка которых еще актуальна
+        valid = len(self.__paragraph_line_start)
+        if self.__dirty_from is not None:
+            valid = min(valid, self.__dirty_from)
+
+        if overflow < valid:
+            # Удаляем строки старых абзацев и сдвигаем индексы: остальные абзацы
+            # не размечаются заново
+            removed_lines = self.__paragraph_line_start[overflow]
+            del self.__lines[:removed_lines]
+            del self.__paragraph_line_start[:overflow]
+            starts = self.__paragraph_line_start
+            for i in range(len(starts)):
+                starts[i] -= removed_lines
+            if self.__dirty_from is not None:
+                self.__dirty_from -= overflow
+        else:
+            self.__lines.clear()
+            self.__paragraph_line_start.clear()
+            self.__dirty_from = 0
+
+    def __measure(self, text: str, bold: bool) -> float:
+        key = (text, bold)
+        width = self.__width_cache.get(key)
+        if width is None:
+            if len(self.__width_cache) >= WIDTH_CACHE_LIMIT:
+                self.__width_cache.clear()
+            width = self.__font.measure_text(text, self.__size, bold, self.__letter_spacing)
+            self.__width_cache[key] = width
+        return width
+
+    def __relayout(self) -> None:
+        start = self.__dirty_from
+        if start is None:
+            return
+
+        if start < len(self.__paragraph_line_start):
+            del self.__lines[self.__paragraph_line_start[start]:]
+            del self.__paragraph_line_start[start:]
+        else:
+            start = len(self.__paragraph_line_start)
+
+        for paragraph in self.__paragraphs[start:]:
+            self.__paragraph_line_start.append(len(self.__lines))
+            self.__lines.extend(self.__break_paragraph(paragraph))
+
+        self.__dirty_from = None
+
+    def __break_paragraph(self, paragraph: list[TextSpan]) -> list[LayoutLine]:
+        wrap = self.__wrap_width
+        lines: list[LayoutLine] = []
+        line = LayoutLine()
+        x = 0.0
+
+        for span in paragraph:
+            bold = span.is_bold()
+            run: GlyphRun | None = None
+
+            for token in TOKEN_PATTERN.findall(span.text):
+                is_space = token[0].isspace()
+                width = self.__measure(token, bold)
+
+                if wrap > 0 and x + width > wrap and line.runs and x > 0:
+                    if is_space:
+                        # Пробелы в месте переноса не переносятся на новую строку
+                        continue
+                    line.width = x
+                    lines.append(line)
+                    line = LayoutLine()
+                    x = 0.0
+                    run = None
+
+                if is_space and x == 0 and lines:
+                    continue
+
+                if wrap > 0 and width > wrap and not is_space:
+                    # Слово длиннее строки разбивается по символам
+                    for chunk, chunk_width in self.__split_long_word(token, bold, wrap - x):
+                        if x > 0 and x + chunk_width > wrap:
+                            line.width = x
+                            lines.append(line)
+                            line = LayoutLine()
+                            x = 0.0
+                            run = None
+                        if run is None:
+                            run = GlyphRun(chunk, span, x, chunk_width)
+                            line.runs.append(run)
+                        else:
+                            run.text += chunk
+                            run.width += chunk_width
+                        x += chunk_width
+                    continue
+
+                if run is None:
+                    run = GlyphRun(token, span, x, width)
+                    line.runs.append(run)
+                else:
+                    run.text += token
+                    run.width += width
+                x += width
+
+        line.width = x
+        lines.append(line)
+        return lines
+
+    def __split_long_word(self, word: str, bold: bool, first_width: float) -> list[tuple[str, float]]:
+        # Метрики всех символов берутся одним вызовом, ширины подстрок - суммами
+        advances, kernings = self.__font.measure_glyphs(word, self.__size, bold, self.__letter_spacing)
+        count = min(len(word), len(advances))
+        chunks: list[tuple[str, float]] = []
+        limit = first_width if first_width > 0 else self.__wrap_width
+        begin = 0
+        width = 0.0
+        for index in range(count):
+            glyph = advances[index] + (kernings[index] if index > begin else 0.0)
+            if width + glyph > limit and index > begin:
+                chunks.append((word[begin:index], width))
+                begin = index
+                width = advances[index]
+                limit = self.__wrap_width
+            else:
+                width += glyph
+        chunks.append((word[begin:], width))
+        return chunks
+
+    # ==================================================================
+    # Отрисовка
+    # ==================================================================
+
+    def __get_pooled_text(self, index: int) -> BaseText:
+        while index >= len(self.__text_pool):
+            text = BaseText(self.__font)
+            text.set_size(self.__size)
+            text.set_letter_spacing(self.__letter_spacing)
+            self.__text_pool.append(text)
+            self.__text_pool_state.append(None)
+        return self.__text_pool[index]
+
+    def get_visible_range(self) -> tuple[int, int]:
+        """
+        #### Возвращает диапазон видимых строк
+
+        ---
+
+        :Returns:
+        - tuple[int, int]: Индекс первой видимой строки и индекс после последней
+        """
+        self.__relayout()
+        count = len(self.__lines)
+        if self.__viewport_height <= 0:
+            return 0, count
+        line_height = self.get_line_height()
+        if line_height <= 0:
+            return 0, count
+        first = max(0, int(self.__scroll // line_height))
+        last = min(count, int(math.ceil((self.__scroll + self.__viewport_height) / line_height)))
+        return first, last
+
+    def special_draw(self, window, arg = None) -> None:
+        """
+        #### Отрисовывает видимые строки в окно
+
+        ---
+
+        :Description:
+        - Вызывается окном из `window.draw(rich_text)`
+        - Для каждой видимой строки использует BaseText из пула;
+          строка, цвет и стиль передаются в нативную библиотеку только при изменении
+        """
+        first, last = self.get_visible_range()
+        line_height = self.get_line_height()
+        origin_x = self.__position.x
+        origin_y = self.__position.y - self.__scroll
+
+        pool_index = 0
+        for line_index in range(first, last):
+            y = origin_y + line_index * line_height
+            for run in self.__lines[line_index].runs:
+                if run.text.isspace():
+                    continue
+                text = self.__get_pooled_text(pool_index)
+                span = run.span
+                color = span.color if span.color is not None else self.__default_color
+                state = (run.text, color.r, color.g, color.b, color.a, span.style)
+                if self.__text_pool_state[pool_index] != state:
+                    text.set_text(run.text)
+                    text.set_color(color)
+                    text.set_style(span.style)
+                    self.__text_pool_state[pool_index] = state
+                text.set_position(origin_x + run.x, y)
+                window.draw(text, arg)
+                pool_index += 1
@@ -73,13 +73,18 @@ Copyright (c) 2025 Pavlov Ivan
 import ctypes
 from enum import Enum
 import os
-from typing import Any
-from colorama import Fore
+import time
+import hashlib
+from typing import Any, Final
 
 from Moon.python.Vectors import Vec2f, Vec2i
 from Moon.python.Colors import Color
 
-from Moon.python.utils import find_library
+from Moon.python.utils import get_native_library
+from Moon.python.Log import get_logger
+
+# Логгер загрузки и компиляции шейдеров
+LOGGER = get_logger("ShaderLoader")
 
 ##################################################################
 #                   `C / C++` Bindings                           #
@@ -87,11 +92,8 @@ from Moon.python.utils import find_library
 #   из нативной DLL библиотеки PySGL, используемых через ctypes. #
 ##################################################################
 
-# Загружаем DLL библиотеку
-try:
-        LIB_MOON = ctypes.CDLL(find_library())
-except Exception as e:
-        raise ImportError(f"Failed to load PySGL library: {e}")
+# Общий дескриптор нативной библиотеки (загружается при первом вызове нативной функции)
+LIB_MOON = get_native_library()
 
 # Определения сигнатур функций из библиотеки PySGL
 LIB_MOON._Shader_Create.argtypes = []
@@ -114,6 +116,21 @@ LIB_MOON._Shader_SetUniformTexture.argtypes = [ctypes.c_void_p, ctypes.c_char_p,
 LIB_MOON._Shader_SetUniformIntVector.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_int]
 LIB_MOON._Shader_SetUniformFloatVector.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_float, ctypes.c_float]
 LIB_MOON._Shader_SetUniformColor.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int]
+LIB_MOON._Shader_SetUniformTexturePtr.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
+LIB_MOON._Shader_SetUniformTexturePtr.restype = None
+LIB_MOON._Shader_SetUniformRenderTexture.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
+LIB_MOON._Shader_SetUniformRenderTexture.restype = None
+LIB_MOON._Shader_SetUniformCurrentTexture.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+LIB_MOON._Shader_SetUniformCurrentTexture.restype = None
+LIB_MOON._Shader_SetUniformFloatArray.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_float), ctypes.c_size_t]
+LIB_MOON._Shader_SetUniformFloatArray.restype = None
+
+LIB_MOON._Shader_GetUniformLocation.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+LIB_MOON._Shader_GetUniformLocation.restype = ctypes.c_int
+LIB_MOON._Shader_SetUniformAt.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+LIB_MOON._Shader_SetUniformAt.restype = None
+LIB_MOON._Shader_SetUniformsAt.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_float), ctypes.c_size_t]
+LIB_MOON._Shader_SetUniformsAt.restype = None
 
 
 
@@ -170,6 +187,245 @@ void main()
 }
 """
 
+# Типы значений uniform для прямой установки по location ====== +
+# (должны совпадать с MoonUniformKind в BUILDED_Shaders.cpp)      #
+UNIFORM_KIND_FLOAT: Final[int] = 0                               #
+UNIFORM_KIND_INT: Final[int] = 1                                 #
+UNIFORM_KIND_BOOL: Final[int] = 2                                #
+UNIFORM_KIND_VEC2: Final[int] = 3                                #
+UNIFORM_KIND_IVEC2: Final[int] = 4                               #
+UNIFORM_KIND_COLOR: Final[int] = 5                               #
+# ============================================================== +
+
+# Специальные значения location ================================ +
+UNIFORM_LOCATION_NOT_FOUND: Final[int] = -1                      #
+UNIFORM_LOCATION_UNSUPPORTED: Final[int] = -2                    #
+# ============================================================== +
+
+
+class Uniform:
+    """
+    #### Хендл uniform-переменной шейдера
+
+    ---
+
+    :Description:
+    - Хранит заранее закодированное имя и кэшированный location
+    - Location запрашивается один раз и обновляется только после перекомпиляции шейдера
+    - Типизированные сеттеры не выполняют проверок типов
+    - Если прямой доступ к OpenGL недоступен, используется установка по имени
+
+    ---
+
+    :Example:
+    ```python
+    u_time = shader.uniform("u_time")
+    while window.is_open():
+        u_time.set_float(window.get_global_timer())
+    ```
+    """
+
+    __slots__ = ('__shader', '__name', '__name_bytes', '__location', '__generation')
+
+    def __init__(self, shader: "Shader", name: str):
+        """
+        #### Инициализация хендла
+
+        ---
+
+        :Args:
+        - shader (Shader): Шейдер, которому принадлежит uniform
+        - name (str): Имя uniform-переменной
+        """
+        self.__shader = shader
+        self.__name = name
+        self.__name_bytes = name.encode('utf-8')
+        self.__location = UNIFORM_LOCATION_UNSUPPORTED
+        self.__generation = -1
+
+    def get_name(self) -> str:
+        """
+        #### Возвращает имя uniform-переменной
+        """
+        return self.__name
+
+    def get_name_bytes(self) -> bytes:
+        """
+        #### Возвращает имя uniform-переменной в кодировке UTF-8
+        """
+        return self.__name_bytes
+
+    def get_location(self) -> int:
+        """
+        #### Возвращает кэшированный location uniform-переменной
+
+        ---
+
+        :Returns:
+        - int: location, -1 если переменная не найдена (например, удалена компилятором),
+          -2 если прямой доступ недоступен
+        """
+        generation = self.__shader.get_generation()
+        if self.__generation != generation:
+            self.__location = LIB_MOON._Shader_GetUniformLocation(self.__shader.get_ptr(), self.__name_bytes)
+            self.__generation = generation
+        return self.__location
+
+    def set_float(self, value: float) -> None:
+        location = self.get_location()
+        if location >= 0:
+            LIB_MOON._Shader_SetUniformAt(self.__shader.get_ptr(), location, UNIFORM_KIND_FLOAT, value, 0, 0, 0)
+        elif location == UNIFORM_LOCATION_UNSUPPORTED:
+            LIB_MOON._Shader_SetUniformFloat(self.__shader.get_ptr(), self.__name_bytes, value)
+
+    def set_int(self, value: int) -> None:
+        location = self.get_location()
+        if location >= 0:
+            LIB_MOON._Shader_SetUniformAt(self.__shader.get_ptr(), location, UNIFORM_KIND_INT, value, 0, 0, 0)
+        elif location == UNIFORM_LOCATION_UNSUPPORTED:
+            LIB_MOON._Shader_SetUniformInt(self.__shader.get_ptr(), self.__name_bytes, value)
+
+    def set_bool(self, value: bool) -> None:
+        location = self.get_location()
+        if location >= 0:
+            LIB_MOON._Shader_SetUniformAt(self.__shader.get_ptr(), location, UNIFORM_KIND_BOOL, 1.0 if value else 0.0, 0, 0, 0)
+        elif location == UNIFORM_LOCATION_UNSUPPORTED:
+            LIB_MOON._Shader_SetUniformBool(self.__shader.get_ptr(), self.__name_bytes, value)
+
+    def set_vec2(self, x: float, y: float) -> None:
+        location = self.get_location()
+        if location >= 0:
+            LIB_MOON._Shader_SetUniformAt(self.__shader.get_ptr(), location, UNIFORM_KIND_VEC2, x, y, 0, 0)
+        elif location == UNIFORM_LOCATION_UNSUPPORTED:
+            LIB_MOON._Shader_SetUniformFloatVector(self.__shader.get_ptr(), self.__name_bytes, x, y)
+
+    def set_ivec2(self, x: int, y: int) -> None:
+        location = self.get_location()
+        if location >= 0:
+            LIB_MOON._Shader_SetUniformAt(self.__shader.get_ptr(), location, UNIFORM_KIND_IVEC2, x, y, 0, 0)
+        elif location == UNIFORM_LOCATION_UNSUPPORTED:
+            LIB_MOON._Shader_SetUniformIntVector(self.__shader.get_ptr(), self.__name_bytes, int(x), int(y))
+
+    def set_color(self, color: Color) -> None:
+        location = self.get_location()
+        if location >= 0:
+            LIB_MOON._Shader_SetUniformAt(self.__shader.get_ptr(), location, UNIFORM_KIND_COLOR,
+                                          color.r / 255, color.g / 255, color.b / 255, color.a / 255)
+        elif location == UNIFORM_LOCATION_UNSUPPORTED:
+            LIB_MOON._Shader_SetUniformColor(self.__shader.get_ptr(), self.__name_bytes, color.r, color.g, color.b, color.a)
+
+    def set_texture(self, texture: Any) -> None:
+        """
+        #### Устанавливает текстуру (Texture2D)
+
+        ---
+
+        :Note:
+        - Текстуры всегда устанавливаются по имени: SFML сам распределяет текстурные блоки
+        """
+        LIB_MOON._Shader_SetUniformTexturePtr(self.__shader.get_ptr(), self.__name_bytes, texture.get_ptr())
+
+    def set_render_texture(self, texture: Any) -> None:
+        """
+        #### Устанавливает текстуру RenderTexture2D без копирования
+        """
+        LIB_MOON._Shader_SetUniformRenderTexture(self.__shader.get_ptr(), self.__name_bytes, texture.get_ptr())
+
+    def set_float_array(self, values: "list[float] | tuple[float, ...]") -> None:
+        """
+        #### Устанавливает массив float (uniform float name[N])
+
+        ---
+
+        :Args:
+        - values (list[float] | tuple[float, ...]): Значения элементов массива
+        """
+        array = (ctypes.c_float * len(values))(*values)
+        LIB_MOON._Shader_SetUniformFloatArray(self.__shader.get_ptr(), self.__name_bytes, array, len(values))
+
+    def set_current_texture(self) -> None:
+        """
+        #### Привязывает uniform к текстуре рисуемого объекта
+
+        ---
+
+        :Description:
+        - Аналог `sf::Shader::CurrentTexture`: при отрисовке спрайта или
+          рендер-текстуры в uniform попадет ее собственная текстура
+        """
+        LIB_MOON._Shader_SetUniformCurrentTexture(self.__shader.get_ptr(), self.__name_bytes)
+
+    def set(self, value: Any) -> None:
+        """
+        #### Устанавливает значение любого поддерживаемого типа
+
+        ---
+
+        :Description:
+        - Сеттер выбирается по типу значения через словарь, без цепочки isinstance
+        - Поддерживаемые типы такие же, как у `Shader.set_uniform`
+
+        ---
+
+        :Raises:
+        - TypeError: Если тип значения не поддерживается
+        """
+        setter = _UNIFORM_SETTERS.get(type(value))
+        if setter is None:
+            setter = _resolve_uniform_setter(type(value))
+        setter(self, value)
+
+    def __repr__(self) -> str:
+        return f"Uniform({self.__name!r}, location={self.__location})"
+
+
+# Сеттеры по типу значения (int и bool передаются как float, как и раньше в set_uniform)
+_UNIFORM_SETTERS: dict[type, Any] = {
+    int:   lambda uniform, value: uniform.set_float(float(value)),
+    bool:  lambda uniform, value: uniform.set_float(float(value)),
+    float: Uniform.set_float,
+    Vec2f: lambda uniform, value: uniform.set_vec2(value.x, value.y),
+    Vec2i: lambda uniform, value: uniform.set_vec2(value.x, value.y),
+    Color: Uniform.set_color,
+}
+
+# Упаковщики значений для пакетной установки: значение -> (тип, x, y, z, w)
+_UNIFORM_PACKERS: dict[type, Any] = {
+    int:   lambda value: (UNIFORM_KIND_FLOAT, float(value), 0.0, 0.0, 0.0),
+    bool:  lambda value: (UNIFORM_KIND_FLOAT, float(value), 0.0, 0.0, 0.0),
+    float: lambda value: (UNIFORM_KIND_FLOAT, value, 0.0, 0.0, 0.0),
+    Vec2f: lambda value: (UNIFORM_KIND_VEC2, value.x, value.y, 0.0, 0.0),
+    Vec2i: lambda value: (UNIFORM_KIND_VEC2, value.x, value.y, 0.0, 0.0),
+    Color: lambda value: (UNIFORM_KIND_COLOR, value.r / 255, value.g / 255, value.b / 255, value.a / 255),
+}
+
+
+def _resolve_uniform_setter(value_type: type) -> Any:
+    """
+    #### Определяет сеттер для типа, отсутствующего в таблице
+
+    ---
+
+    :Description:
+    - Классы текстур определяются по имени, так как модуль Sprites импортирует этот модуль
+    - Найденный сеттер запоминается, поэтому проверка выполняется один раз на тип
+    """
+    for base in value_type.__mro__:
+        if base.__name__ == 'Texture2D':
+            setter = Uniform.set_texture
+            break
+        if base.__name__ == 'RenderTexture2D':
+            setter = Uniform.set_render_texture
+            break
+        if base in _UNIFORM_SETTERS:
+            setter = _UNIFORM_SETTERS[base]
+            break
+    else:
+        raise TypeError(f'Unsupported uniform type: {value_type}')
+    _UNIFORM_SETTERS[value_type] = setter
+    return setter
+
+
 class Shader:
     """
     #### Обёртка для работы с шейдерами через PySGL.dll
@@ -225,10 +481,10 @@ class Shader:
             shader._set_source(Shader.SOURCE_TYPE.FRAGMENT, fragment)
             result = shader._load_from_source()
             if result:
-                print(f'[ {Fore.LIGHTBLUE_EX}ShaderLoader{Fore.RESET} ] [ {Fore.GREEN}succes{Fore.RESET} ] Shader from sources loaded')
+                LOGGER.debug("Shader from sources loaded")
                 return shader
             else:
-                print(f'[ {Fore.LIGHTBLUE_EX}ShaderLoader{Fore.RESET} ] [ {Fore.RED}error{Fore.RESET} ] Shader from sources not loaded')
+                LOGGER.error("Shader from sources not loaded")
                 return None
 
     @classmethod
@@ -255,25 +511,26 @@ class Shader:
         ```
         """
         shader = Shader()
-        print(f'[ {Fore.LIGHTBLUE_EX}ShaderLoader{Fore.RESET} ] [ {Fore.YELLOW}info{Fore.RESET} ] Loading shader from source files...')
+        LOGGER.info("Loading shader from source files...")
         if os.path.exists(vertex_path):
-            print(f'  {Fore.GREEN}+{Fore.RESET} Vertex Path: {Fore.LIGHTMAGENTA_EX}{vertex_path}{Fore.RESET}')
+            LOGGER.debug("Vertex path: %s", vertex_path)
         else:
-            print(f'  {Fore.RED}-{Fore.RESET} Vertex Path not found: {Fore.LIGHTMAGENTA_EX}{vertex_path}{Fore.RESET}')
+            LOGGER.error("Vertex path not found: %s", vertex_path)
 
         if os.path.exists(fragment_path):
-            print(f'  {Fore.GREEN}+{Fore.RESET} Fragment Path: {Fore.LIGHTMAGENTA_EX}{fragment_path}{Fore.RESET}')
+            LOGGER.debug("Fragment path: %s", fragment_path)
         else:
-            print(f'  {Fore.RED}-{Fore.RESET} Fragment Path not found: {Fore.LIGHTMAGENTA_EX}{fragment_path}{Fore.RESET}')
+            LOGGER.error("Fragment path not found: %s", fragment_path)
 
-        print(f'[ {Fore.LIGHTBLUE_EX}ShaderLoader{Fore.RESET} ] [ {Fore.YELLOW}info{Fore.RESET} ] Compiling shader...')
+        LOGGER.debug("Compiling shader...")
 
         result = LIB_MOON._Shader_LoadFromFile(shader.get_ptr(), vertex_path.encode('utf-8'), fragment_path.encode('utf-8'))
         if result:
-            print(f'[ {Fore.LIGHTBLUE_EX}ShaderLoader{Fore.RESET} ] [ {Fore.GREEN}succes{Fore.RESET} ] Shader compiled successfully')
+            shader._mark_recompiled()
+            LOGGER.info("Shader compiled successfully")
             return shader
         else:
-            print(f'[ {Fore.LIGHTBLUE_EX}ShaderLoader{Fore.RESET} ] [ {Fore.RED}error{Fore.RESET} ] Shader compilation failed')
+            LOGGER.error("Shader compilation failed")
             exit(-1)
             return None
 
@@ -302,12 +559,12 @@ class Shader:
         sh = Shader.LoadFragmentFromFile("fragment.glsl")
         ```
         """
-        print(f'[ {Fore.LIGHTBLUE_EX}ShaderLoader{Fore.RESET} ] [ {Fore.YELLOW}info{Fore.RESET} ] Loading shader from source files...')
-        print(f'  {Fore.GREEN}+{Fore.RESET} Fragment Path: {Fore.BLACK}used STANDART_VERTEX_SOURCE{Fore.RESET}')
+        LOGGER.info("Loading shader from source files...")
+        LOGGER.debug("Vertex path: used STANDART_VERTEX_SOURCE")
         if os.path.exists(path):
-            print(f'  {Fore.GREEN}+{Fore.RESET} Fragment Path: {Fore.LIGHTMAGENTA_EX}{path}{Fore.RESET}')
+            LOGGER.debug("Fragment path: %s", path)
         else:
-            print(f'  {Fore.RED}-{Fore.RESET} Fragment Path not found: {Fore.LIGHTMAGENTA_EX}{path}{Fore.RESET}')
+            LOGGER.error("Fragment path not found: %s", path)
             exit(-1)
         fragment_source = open(path, 'r', encoding='utf-8').read()
         shader = Shader().LoadFromSources(BASE_VERTEX_SOURCE, fragment_source)
@@ -338,6 +595,16 @@ class Shader:
         self.__vertex_source = ""
         self.__fragment_source = ""
 
+        # Номер успешной компиляции: при его изменении хендлы заново запрашивают location
+        self.__generation = 0
+        self.__uniforms: dict[str, Uniform] = {}
+
+        # Буферы пакетной установки uniform (переиспользуются между кадрами)
+        self.__batch_capacity = 0
+        self.__batch_locations = None
+        self.__batch_kinds = None
+        self.__batch_values = None
+
     def _set_source(self, source_type: SOURCE_TYPE, source: str):
         """
         #### Устанавливает исходный код для указанного типа шейдера
@@ -386,8 +653,23 @@ class Shader:
         success = shader._load_from_source()
         ```
         """
-        return LIB_MOON._Shader_LoadFromStrings(self.__ptr, self.__vertex_source.encode('utf-8'),
-                                                            self.__fragment_source.encode('utf-8'))
+        result = LIB_MOON._Shader_LoadFromStrings(self.__ptr, self.__vertex_source.encode('utf-8'),
+                                                              self.__fragment_source.encode('utf-8'))
+        if result:
+            self.__generation += 1
+        return result
+
+    def get_generation(self) -> int:
+        """
+        #### Возвращает номер последней успешной компиляции шейдера
+
+        ---
+
+        :Description:
+        - Увеличивается после каждой успешной загрузки исходников
+        - Используется хендлами Uniform для сброса кэшированного location
+        """
+        return self.__generation
 
     def get_ptr(self) -> ShaderPtr:
         """
@@ -461,21 +743,389 @@ class Shader:
         shader.set_uniform("u_color", Color(255,0,0))
         ```
         """
-        if isinstance(arg, int):
-            LIB_MOON._Shader_SetUniformInt(self.__ptr, name.encode('utf-8'), float(arg))
-        elif isinstance(arg, float):
-            LIB_MOON._Shader_SetUniformFloat(self.__ptr, name.encode('utf-8'), arg)
-        elif isinstance(arg, bool):
-            LIB_MOON._Shader_SetUniformBool(self.__ptr, name.encode('utf-8'), arg)
-        elif arg.__class__.__name__ == 'Texture2D':
-            LIB_MOON._Shader_SetUniformTexture(self.__ptr, name.encode('utf-8'), arg.get_ptr())
-        elif arg.__class__.__name__ == 'RenderTexture2D':
-            LIB_MOON._Shader_SetUniformTexture(self.__ptr, name.encode('utf-8'), arg.get_ptr())
-        elif isinstance(arg, Vec2f):
-            LIB_MOON._Shader_SetUniformFloatVector(self.__ptr, name.encode('utf-8'), arg.x, arg.y)
-        elif isinstance(arg, Vec2i):
-            LIB_MOON._Shader_SetUniformFloatVector(self.__ptr, name.encode('utf-8'), arg.x, arg.y)
-        elif isinstance(arg, Color):
-            LIB_MOON._Shader_SetUniformColor(self.__ptr, name.encode('utf-8'), arg.r, arg.g, arg.b, arg.a)
-        else:
-            raise TypeError(f'Unsupported uniform type: {type(arg)}')
+        uniform = self.__uniforms.get(name)
+        if uniform is None:
+            uniform = self.uniform(name)
+        uniform.set(arg)
+
+    def _mark_recompiled(self) -> None:
+        """
+        #### Отмечает успешную перекомпиляцию (сбрасывает кэш location у хендлов)
+        """
+        self.__generation += 1
+
+    def uniform(self, name: str) -> Uniform:
+        """
+        #### Возвращает хендл uniform-переменной
+
+        ---
+
+        :Description:
+        - Хендл создается один раз на имя и хранится в шейдере
+        - Имя кодируется в UTF-8 только при создании хендла
+        - Location запрашивается при первой установке значения
+
+        ---
+
+        :Args:
+        - name (str): Имя uniform-переменной
+
+        ---
+
+        :Returns:
+        - Uniform: Хендл с типизированными сеттерами
+
+        ---
+
+        :Example:
+        ```python
+        u_resolution = shader.uniform("u_resolution")
+        u_resolution.set_vec2(800, 600)
+        ```
+        """
+        uniform = self.__uniforms.get(name)
+        if uniform is None:
+            uniform = Uniform(self, name)
+            self.__uniforms[name] = uniform
+        return uniform
+
+    def set_uniforms(self, values: dict[str, Any]) -> None:
+        """
+        #### Устанавливает несколько uniform-переменных одним нативным вызовом
+
+        ---
+
+        :Description:
+        - Числа, векторы и цвета упаковываются в общий буфер и передаются за один вызов,
+          программа шейдера привязывается один раз на весь пакет
+        - Текстуры и переменные без прямого доступа устанавливаются по отдельности
+
+        ---
+
+        :Args:
+        - values (dict[str, Any]): Словарь имя -> значение (типы как у set_uniform)
+
+        ---
+
+        :Example:
+        ```python
+        shader.set_uniforms({
+            "u_time": timer,
+            "u_resolution": Vec2f(800, 600),
+            "u_tint": Color(255, 200, 200),
+        })
+        ```
+        """
+        count = len(values)
+        if count > self.__batch_capacity:
+            self.__batch_capacity = count
+            self.__batch_locations = (ctypes.c_int * count)()
+            self.__batch_kinds = (ctypes.c_int * count)()
+            self.__batch_values = (ctypes.c_float * (count * 4))()
+
+        locations = self.__batch_locations
+        kinds = self.__batch_kinds
+        packed_values = self.__batch_values
+
+        packed = 0
+        for name, value in values.items():
+            uniform = self.__uniforms.get(name)
+            if uniform is None:
+                uniform = self.uniform(name)
+
+            packer = _UNIFORM_PACKERS.get(type(value))
+            location = uniform.get_location()
+            if packer is None or location == UNIFORM_LOCATION_UNSUPPORTED:
+                uniform.set(value)
+                continue
+            if location < 0:
+                continue
+
+            kind, x, y, z, w = packer(value)
+            locations[packed] = location
+            kinds[packed] = kind
+            offset = packed * 4
+            packed_values[offset] = x
+            packed_values[offset + 1] = y
+            packed_values[offset + 2] = z
+            packed_values[offset + 3] = w
+            packed += 1
+
+        if packed:
+            LIB_MOON._Shader_SetUniformsAt(self.__ptr, locations, kinds, packed_values, packed)
+
+
+class ShaderManager:
+    """
+    #### Кэш скомпилированных шейдеров с горячей перезагрузкой
+
+    ---
+
+    :Description:
+    - Шейдеры кэшируются по хешу содержимого исходников: одинаковый код
+      компилируется один раз, повторные запросы возвращают готовый объект
+    - В режиме разработки (hot reload) отслеживает время изменения файлов
+      и перекомпилирует только изменившиеся шейдеры между кадрами
+    - При перезагрузке объект Shader сохраняется, поэтому ссылки на него,
+      RenderStates и хендлы Uniform остаются действительными
+    - Если новый исходник не компилируется, продолжает работать старая версия
+    - Если одинаковое содержимое загружено из разных файлов, шейдер общий, пока
+      файлы совпадают; после изменения одного из них его путь получает
+      отдельный Shader, а общий объект остается у остальных путей
+
+    ---
+
+    :Note:
+    - Кэшированный шейдер общий: значения uniform тоже общие для всех,
+      кто его получил. Эффекты с собственными настройками ядра/параметров
+      должны создавать отдельный Shader
+
+    ---
+
+    :Example:
+    ```python
+    manager = get_shader_manager()
+    manager.set_hot_reload(True)
+    outline = manager.load_fragment_file("shaders/outline/base_outline.frag")
+
+    while window.update(events):   # окно вызывает manager.poll() каждый кадр
+        ...
+    ```
+    """
+
+    __slots__ = ('__by_hash', '__watched', '__hot_reload', '__poll_interval', '__last_poll')
+
+    def __init__(self):
+        # Хеш исходников -> скомпилированный шейдер
+        self.__by_hash: dict[str, Shader] = {}
+
+        # Отслеживаемые файлы: (путь вершинного (или None), путь фрагментного) ->
+        #                      [шейдер, время изменения вершинного, время изменения фрагментного, хеш]
+        self.__watched: dict[tuple[str | None, str], list] = {}
+
+        self.__hot_reload: bool = False
+        self.__poll_interval: float = 0.5
+        self.__last_poll: float = 0.0
+
+    @staticmethod
+    def hash_sources(vertex: str, fragment: str) -> str:
+        """
+        #### Вычисляет ключ кэша по содержимому исходников
+        """
+        digest = hashlib.sha1()
+        digest.update(vertex.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(fragment.encode('utf-8'))
+        return digest.hexdigest()
+
+    @staticmethod
+    def __read(path: str) -> str:
+        with open(path, 'r', encoding='utf-8') as file:
+            return file.read()
+
+    @staticmethod
+    def __mtime(path: str | None) -> float:
+        if path is None:
+            return 0.0
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return 0.0
+
+    def load_sources(self, vertex: str, fragment: str) -> "Shader | None":
+        """
+        #### Возвращает шейдер из строк, компилируя его только при первом запросе
+
+        ---
+
+        :Args:
+        - vertex (str): Исходный код вершинного шейдера
+        - fragment (str): Исходный код фрагментного шейдера
+
+        ---
+
+        :Returns:
+        - Shader | None: Скомпилированный шейдер или None при ошибке компиляции
+        """
+        key = self.hash_sources(vertex, fragment)
+        shader = self.__by_hash.get(key)
+        if shader is None:
+            shader = Shader.LoadFromSources(vertex, fragment)
+            if shader is None:
+                return None
+            self.__by_hash[key] = shader
+        return shader
+
+    def load_files(self, vertex_path: str, fragment_path: str) -> "Shader | None":
+        """
+        #### Возвращает шейдер из файлов (вершинный и фрагментный)
+
+        ---
+
+        :Description:
+        - Файлы читаются, но компиляция выполняется только для нового содержимого
+        - Файлы ставятся на отслеживание для горячей перезагрузки
+
+        ---
+
+        :Returns:
+        - Shader | None: Скомпилированный шейдер или None при ошибке
+        """
+        return self.__load_paths(vertex_path, fragment_path)
+
+    def load_fragment_file(self, path: str) -> "Shader | None":
+        """
+        #### Возвращает шейдер из фрагментного файла и стандартного вершинного шейдера
+
+        ---
+
+        :Returns:
+        - Shader | None: Скомпилированный шейдер или None при ошибке
+        """
+        return self.__load_paths(None, path)
+
+    def __load_paths(self, vertex_path: str | None, fragment_path: str) -> "Shader | None":
+        try:
+            vertex = self.__read(vertex_path) if vertex_path is not None else BASE_VERTEX_SOURCE
+            fragment = self.__read(fragment_path)
+        except OSError as error:
+            LOGGER.error("%s", error)
+            return None
+
+        key = self.hash_sources(vertex, fragment)
+        paths = (vertex_path, fragment_path)
+        entry = self.__watched.get(paths)
+        if entry is not None and entry[3] == key:
+            # Путь мог получить собственный шейдер при горячей перезагрузке
+            return entry[0]
+
+        shader = self.load_sources(vertex, fragment)
+        if shader is not None:
+            self.__watched[paths] = [shader, self.__mtime(vertex_path), self.__mtime(fragment_path), key]
+        return shader
+
+    def set_hot_reload(self, value: bool = True, poll_interval: float = 0.5) -> "ShaderManager":
+        """
+        #### Включает режим горячей перезагрузки (для разработки)
+
+        ---
+
+        :Args:
+        - value (bool): Включить/выключить отслеживание файлов
+        - poll_interval (float): Минимальный интервал между проверками файлов в секундах
+
+        ---
+
+        :Returns:
+        - ShaderManager: Возвращает self для цепочки вызовов
+        """
+        self.__hot_reload = value
+        self.__poll_interval = max(0.0, poll_interval)
+        return self
+
+    def is_hot_reload_enabled(self) -> bool:
+        return self.__hot_reload
+
+    def poll(self) -> int:
+        """
+        #### Проверяет отслеживаемые файлы и перекомпилирует измененные
+
+        ---
+
+        :Description:
+        - Вызывается между кадрами (окно делает это автоматически)
+        - Ничего не делает, если горячая перезагрузка выключена
+          или интервал проверки еще не истек
+
+        ---
+
+        :Returns:
+        - int: Количество перезагруженных шейдеров
+        """
+        if not self.__hot_reload:
+            return 0
+        now = time.monotonic()
+        if now - self.__last_poll < self.__poll_interval:
+            return 0
+        self.__last_poll = now
+
+        reloaded = 0
+        for (vertex_path, fragment_path), entry in self.__watched.items():
+            shader, vertex_mtime, fragment_mtime, old_key = entry
+            new_vertex_mtime = self.__mtime(vertex_path)
+            new_fragment_mtime = self.__mtime(fragment_path)
+            if new_vertex_mtime == vertex_mtime and new_fragment_mtime == fragment_mtime:
+                continue
+            entry[1] = new_vertex_mtime
+            entry[2] = new_fragment_mtime
+
+            try:
+                vertex = self.__read(vertex_path) if vertex_path is not None else BASE_VERTEX_SOURCE
+                fragment = self.__read(fragment_path)
+            except OSError:
+                continue
+
+            new_key = self.hash_sources(vertex, fragment)
+            if new_key == old_key:
+                continue
+
+            # Пробная компиляция: sf::Shader теряет старую программу при неудачной загрузке
+            compiled = Shader.LoadFromSources(vertex, fragment)
+            if compiled is None:
+                LOGGER.warning("Hot reload failed, keeping previous version: %s", fragment_path)
+                continue
+
+            if any(other is not entry and other[0] is shader for other in self.__watched.values()):
+                # Шейдер общий с другими файлами: этот путь получает отдельный объект,
+                # чтобы изменение не затронуло пользователей других файлов
+                entry[0] = self.__by_hash.setdefault(new_key, compiled)
+                entry[3] = new_key
+                reloaded += 1
+                LOGGER.info("Shader reloaded as a separate instance: %s", fragment_path)
+                continue
+
+            shader._set_source(Shader.SOURCE_TYPE.VERTEX, vertex)
+            shader._set_source(Shader.SOURCE_TYPE.FRAGMENT, fragment)
+            if not shader._load_from_source():
+                continue
+
+            if self.__by_hash.get(old_key) is shader:
+                del self.__by_hash[old_key]
+            self.__by_hash.setdefault(new_key, shader)
+            entry[3] = new_key
+            reloaded += 1
+            LOGGER.info("Shader reloaded: %s", fragment_path)
+        return reloaded
+
+    def get_cached_count(self) -> int:
+        """
+        #### Возвращает количество скомпилированных шейдеров в кэше
+        """
+        return len(self.__by_hash)
+
+    def clear(self) -> None:
+        """
+        #### Очищает кэш и список отслеживаемых файлов
+
+        ---
+
+        :Note:
+        - Уже выданные объекты Shader продолжают работать
+        """
+        self.__by_hash.clear()
+        self.__watched.clear()
+
+
+SHADER_MANAGER: Final[ShaderManager] = ShaderManager()
+
+
+def get_shader_manager() -> ShaderManager:
+    """
+    #### Возвращает общий менеджер шейдеров
+
+    ---
+
+    :Returns:
+    - ShaderManager: Глобальный экземпляр, который опрашивается окном каждый кадр
+    """
+    return SHADER_MANAGER
@@ -101,15 +101,12 @@ from Moon.python.Rendering.Shapes.Proxys import *            # pyright: ignore
 
 from Moon.python.Vectors import Vec2f, Vec2i, Vec2T
 
-from Moon.python.utils import find_library
+from Moon.python.utils import get_native_library
 
 
 
-# Загружаем DLL библиотеку
-try:
-    LIB_MOON: Final[ctypes.CDLL] = ctypes.CDLL(find_library())
-except Exception as e:
-    raise ImportError(f"Failed to load PySGL library: {e}")
+# Общий дескриптор нативной библиотеки (загружается при первом вызове нативной функции)
+LIB_MOON = get_native_library()
 
 # =====================================================================================
 # ТИПЫ УКАЗАТЕЛЕЙ ДЛЯ НАТИВНЫХ ОБЪЕКТОВ C++
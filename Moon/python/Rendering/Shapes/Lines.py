@@ -6,14 +6,11 @@ from Moon.python.Colors import *
 from Moon.python.Vectors import Vec2f, Vec2T, Vec2TT
 from Moon.python.Rendering.Vertexes import Vertex2d, VertexList, VertexListTypes, NativeVertex2dPtr
 
-from Moon.python.utils import find_library
+from Moon.python.utils import get_native_library
 
 
-# Загружаем DLL библиотеку
-try:
-    LIB_MOON: Final[ctypes.CDLL] = ctypes.CDLL(find_library())
-except Exception as e:
-    raise ImportError(f"Failed to load PySGL library: {e}")
+# Общий дескриптор нативной библиотеки (загружается при первом вызове нативной функции)
+LIB_MOON = get_native_library()
 
 @final
 class PolylineShape:
@@ -1147,36 +1144,39 @@ class WidelineShape:
         - Требует установки обеих точек (start и end)
         - Очищает существующий список вершин перед генерацией
         """
+        start, end = self.__start_point, self.__end_point
         # Вычисляем нормализованный вектор направления линии
-        normal = (self.__end_point - self.__start_point).normalize_at()
-        # Создаем перпендикулярный вектор для толщины
-        dummy_ = normal.rotate(90) * self.__radius
+        normal = Vec2f(end.x - start.x, end.y - start.y).normalize_at()
+        # Создаем перпендикулярный вектор для толщины (поворот на 90 градусов, на месте)
+        dummy_ = normal.set(normal.y, -normal.x)
+        dummy_ *= self.__radius
+        # Вершина переиспользуется: нативный конструктор копирует координаты
+        point = Vec2f(0, 0)
         # Очищаем существующие вершины
         self.__vertex_list.clear()
 
         if not self.__rounded:
             # Генерация прямоугольных концов - 4 вершины
-            self.__vertex_list.auto_append(Vertex2d.FromPosition(self.__start_point + dummy_))
-            self.__vertex_list.auto_append(Vertex2d.FromPosition(self.__end_point + dummy_))
-            dummy_.rotate_at(180)
-            self.__vertex_list.auto_append(Vertex2d.FromPosition(self.__end_point + dummy_))
-            self.__vertex_list.auto_append(Vertex2d.FromPosition(self.__start_point + dummy_))
+            self.__vertex_list.auto_append(Vertex2d.FromPosition(point.set(start.x + dummy_.x, start.y + dummy_.y)))
+            self.__vertex_list.auto_append(Vertex2d.FromPosition(point.set(end.x + dummy_.x, end.y + dummy_.y)))
+            self.__vertex_list.auto_append(Vertex2d.FromPosition(point.set(end.x - dummy_.x, end.y - dummy_.y)))
+            self.__vertex_list.auto_append(Vertex2d.FromPosition(point.set(start.x - dummy_.x, start.y - dummy_.y)))
             self.__vertex_list.set_color(self.__color)
         else:
             # Генерация закругленных концов
-            approximation_angle = 180 / self.__approximation
+            # Синус и косинус шага считаются один раз для всех вершин
+            cos, sin = Vec2f.rotation_factors(180 / self.__approximation)
             # Вершины для начального закругления
             for i in range(self.__approximation + 1):
-                if i != 0: dummy_.rotate_at(approximation_angle)
-                self.__vertex_list.auto_append(Vertex2d.FromPosition(self.__start_point + dummy_))
+                if i != 0: dummy_.rotate_at_factors(cos, sin)
+                self.__vertex_list.auto_append(Vertex2d.FromPosition(point.set(start.x + dummy_.x, start.y + dummy_.y)))
 
             # Вершины для конечного закругления
             for i in range(self.__approximation + 1):
-                if i != 0: dummy_.rotate_at(approximation_angle)
-                self.__vertex_list.auto_append(Vertex2d.FromPosition(self.__end_point + dummy_))
-            
-            self.__vertex_list.set_color(self.__color)
+                if i != 0: dummy_.rotate_at_factors(cos, sin)
+                self.__vertex_list.auto_append(Vertex2d.FromPosition(point.set(end.x + dummy_.x, end.y + dummy_.y)))
 
+            self.__vertex_list.set_color(self.__color)
 
     def get_ptr(self) -> ctypes.c_void_p:
         """
@@ -6,14 +6,11 @@ from Moon.python.Colors import *
 from Moon.python.Vectors import Vec2f, Vec2T
 from Moon.python.Rendering.Vertexes import Vertex2d, VertexList, VertexListTypes, NativeVertex2dPtr
 
-from Moon.python.utils import find_library
+from Moon.python.utils import get_native_library
 
 
-# Загружаем DLL библиотеку
-try:
-    LIB_MOON: Final[ctypes.CDLL] = ctypes.CDLL(find_library())
-except Exception as e:
-    raise ImportError(f"Failed to load PySGL library: {e}")
+# Общий дескриптор нативной библиотеки (загружается при первом вызове нативной функции)
+LIB_MOON = get_native_library()
 
 
 @final
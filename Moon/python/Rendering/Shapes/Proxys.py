@@ -96,7 +96,7 @@ from Moon.python.Types import *
 from Moon.python.Colors import *
 from Moon.python.Vectors import Vec2f
 
-from Moon.python.utils import find_library
+from Moon.python.utils import get_native_library
 
 # =====================================================================================
 # ТИПЫ УКАЗАТЕЛЕЙ ДЛЯ НАТИВНЫХ ОБЪЕКТОВ C++
@@ -112,11 +112,8 @@ CirclePtr: Final[type[ctypes.c_void_p]] = ctypes.c_void_p
 # ЗАГРУЗКА НАТИВНОЙ БИБЛИОТЕКИ
 # =====================================================================================
 
-# Загружаем DLL библиотеку
-try:
-    LIB_MOON: Final[ctypes.CDLL] = ctypes.CDLL(find_library())
-except Exception as e:
-    raise ImportError(f"Failed to load PySGL library: {e}")
+# Общий дескриптор нативной библиотеки (загружается при первом вызове нативной функции)
+LIB_MOON = get_native_library()
 
 # =====================================================================================
 # ОПРЕДЕЛЕНИЕ СИГНАТУР ФУНКЦИЙ ДЛЯ ПРЯМОУГОЛЬНИКОВ
@@ -1,4 +1,7 @@
 import time
+import bisect
+import itertools
+from typing import Any, Final
 
 from Moon.python.Rendering.Drawable import *
 from Moon.python.Rendering.RenderStates import RenderStates
@@ -9,14 +12,17 @@ from Moon.python.Views import ViewPtr
 from Moon.python.Types import *
 from Moon.python.Colors import *
 
-from Moon.python.utils import find_library
+from Moon.python.utils import get_native_library
 import ctypes
 
-# Загружаем DLL библиотеку
+# NumPy необязателен: нужен только для прямого доступа к пикселям Image
 try:
-    LIB_MOON = ctypes.CDLL(find_library())   # pyright: ignore
-except Exception as e:
-    raise ImportError(f"Failed to load PySGL library: {e}")
+    import numpy as np
+except ImportError:
+    np = None
+
+# Общий дескриптор нативной библиотеки (загружается при первом вызове нативной функции)
+LIB_MOON = get_native_library()
 
 
 RenderTexturePtr =      ctypes.c_void_p
@@ -244,12 +250,247 @@ class RenderTexture2D(object):
         texture.load_from_ptr(texture_ptr)
         return texture
 
+    def _adopt_ptr(self, ptr: RenderTexturePtr, size: Vec2i) -> None:
+        """
+        #### Привязывает объект к уже созданной нативной рендер-текстуре (для пулов).
+        """
+        self.__ptr = ptr
+        self.__size = size
+
+
+# ////////////////////////////////////////////////////////////////////////////
+# Максимальное число свободных рендер-текстур в пуле по умолчанию
+# ////////////////////////////////////////////////////////////////////////////
+DEFAULT_RENDER_TEXTURE_POOL_CAPACITY: Final[int] = 16
+
+
+class PooledRenderTexture2D(RenderTexture2D):
+    """
+    #### Рендер-текстура, выданная пулом RenderTexturePool
+
+    ---
+
+    :Description:
+    - Ведет себя как обычная RenderTexture2D
+    - При вызове `release()` или удалении сборщиком мусора нативная цель
+      возвращается в пул, а не уничтожается
+    - После `release()` объект использовать нельзя: цель может быть выдана другому владельцу
+    """
+
+    def __init__(self, pool: "RenderTexturePool", key: tuple[int, int, bool], ptr: RenderTexturePtr):
+        # Объект создается только через RenderTexturePool.acquire; нативная цель уже создана пулом
+        self._adopt_ptr(ptr, Vec2i(key[0], key[1]))
+        self.__pool: RenderTexturePool = pool
+        self.__key: tuple[int, int, bool] = key
+        self.__released: bool = False
+
+    def __del__(self):
+        self.release()
+
+    def get_key(self) -> tuple[int, int, bool]:
+        """
+        #### Возвращает ключ пула (ширина, высота, сглаживание)
+        """
+        return self.__key
+
+    def is_released(self) -> bool:
+        return self.__released
+
+    def release(self) -> None:
+        """
+        #### Возвращает цель в пул (повторный вызов ничего не делает)
+        """
+        if self.__released:
+            return
+        self.__released = True
+        self.__pool._recycle(self.__key, self.get_ptr())
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
+
+
+class RenderTexturePool:
+    """
+    #### Пул рендер-текстур по размеру и режиму сглаживания
+
+    ---
+
+    :Description:
+    - `acquire()` выдает очищенную цель (ширина, высота, сглаживание), по возможности
+      переиспользуя ранее освобожденную вместо создания нового FBO и текстуры
+    - Цель возвращается в пул вызовом `release()`, выходом из `with` или сборщиком мусора
+    - Свободных целей хранится не больше `capacity`; лишние уничтожаются сразу
+
+    ---
+
+    :Example:
+    ```python
+    pool = get_render_texture_pool()
+    with pool.acquire(256, 256) as bake:
+        bake.draw(tilemap)
+        bake.display()
+        minimap.update_from_image(Image.CopyFromRenderTexture(bake))
+    ```
+    """
+
+    __slots__ = ('__free', '__free_count', '__leased', '__capacity', '__hits', '__misses')
+
+    def __init__(self, capacity: int = DEFAULT_RENDER_TEXTURE_POOL_CAPACITY):
+        """
+        #### Создает пул
+
+        ---
+
+        :Args:
+            capacity (int): Максимальное число свободных целей, хранимых пулом.
+        """
+        self.__free: dict[tuple[int, int, bool], list[RenderTexturePtr]] = {}
+        self.__free_count: int = 0
+        self.__leased: dict[tuple[int, int, bool], int] = {}
+        self.__capacity: int = max(0, int(capacity))
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    def acquire(self, width: int, height: int, smooth: bool = False,
+                clear_color: Color | None = COLOR_TRANSPARENT) -> PooledRenderTexture2D:
+        """
+        #### Выдает рендер-текстуру заданного размера
+
+        ---
+
+        :Args:
+            width (int): Ширина в пикселях.
+            height (int): Высота в пикселях.
+            smooth (bool): Сглаживание текстуры цели.
+            clear_color (Color | None): Цвет очистки перед выдачей. None - не очищать.
+        :Returns:
+            PooledRenderTexture2D: Цель, возвращаемая в пул при освобождении.
+        """
+        key = (max(1, int(width)), max(1, int(height)), bool(smooth))
+        free = self.__free.get(key)
+
+        if free:
+            self.__hits += 1
+            self.__free_count -= 1
+            ptr = free.pop()
+        else:
+            self.__misses += 1
+            ptr = LIB_MOON._RenderTexture_Init()
+            LIB_MOON._RenderTexture_Create(ptr, key[0], key[1])
+            LIB_MOON._RenderTexture_SetSmooth(ptr, key[2])
+
+        self.__leased[key] = self.__leased.get(key, 0) + 1
+
+        target = PooledRenderTexture2D(self, key, ptr)
+        if clear_color is not None:
+            target.clear(clear_color)
+        return target
+
+    def _recycle(self, key: tuple[int, int, bool], ptr: RenderTexturePtr) -> None:
+        """
+        #### Принимает освобожденную цель (вызывается из PooledRenderTexture2D)
+        """
+        self.__leased[key] -= 1
+        if self.__free_count >= self.__capacity:
+            LIB_MOON._RenderTexture_Delete(ptr)
+            return
+        # Владелец мог изменить сглаживание: восстанавливаем режим ключа
+        LIB_MOON._RenderTexture_SetSmooth(ptr, key[2])
+        self.__free.setdefault(key, []).append(ptr)
+        self.__free_count += 1
+
+    def set_capacity(self, capacity: int) -> Self:
+        """
+        #### Устанавливает максимальное число свободных целей (лишние уничтожаются)
+        """
+        self.__capacity = max(0, int(capacity))
+        for free in self.__free.values():
+            while free and self.__free_count > self.__capacity:
+                LIB_MOON._RenderTexture_Delete(free.pop())
+                self.__free_count -= 1
+        return self
+
+    def get_capacity(self) -> int:
+        return self.__capacity
+
+    def clear(self) -> Self:
+        """
+        #### Уничтожает все свободные цели пула (выданные цели не затрагиваются)
+        """
+        for free in self.__free.values():
+            for ptr in free:
+                LIB_MOON._RenderTexture_Delete(ptr)
+        self.__free.clear()
+        self.__free_count = 0
+        return self
+
+    def get_free_count(self) -> int:
+        return self.__free_count
+
+    def get_leased_count(self) -> int:
+        return sum(self.__leased.values())
+
+    def get_free_bytes(self) -> int:
+        """
+        #### Возвращает объем видеопамяти свободных целей (ширина × высота × 4)
+        """
+        return sum(w * h * 4 * len(free) for (w, h, _), free in self.__free.items())
+
+    def get_leased_bytes(self) -> int:
+        """
+        #### Возвращает объем видеопамяти выданных целей (ширина × высота × 4)
+        """
+        return sum(w * h * 4 * count for (w, h, _), count in self.__leased.items())
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        #### Возвращает статистику пула
+
+        ---
+
+        :Returns:
+            dict[str, int]: hits, misses, free, leased, free_bytes, leased_bytes, bytes
+        """
+        free_bytes = self.get_free_bytes()
+        leased_bytes = self.get_leased_bytes()
+        return {
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "free": self.__free_count,
+            "leased": self.get_leased_count(),
+            "free_bytes": free_bytes,
+            "leased_bytes": leased_bytes,
+            "bytes": free_bytes + leased_bytes,
+        }
+
+
+# Общий пул рендер-текстур
+RENDER_TEXTURE_POOL: Final[RenderTexturePool] = RenderTexturePool()
+
+
+def get_render_texture_pool() -> RenderTexturePool:
+    """
+    #### Возвращает общий пул рендер-текстур
+    """
+    return RENDER_TEXTURE_POOL
+
 
 LIB_MOON._Texture_Init.argtypes = []
 LIB_MOON._Texture_Init.restype = TexturePtr
 
 LIB_MOON._Texture_LoadFromFile.argtypes = [TexturePtr, ctypes.c_char_p]
 LIB_MOON._Texture_LoadFromFile.restype = ctypes.c_bool
+LIB_MOON._Texture_LoadFromImage.argtypes = [TexturePtr, ctypes.c_void_p]
+LIB_MOON._Texture_LoadFromImage.restype = ctypes.c_bool
+LIB_MOON._Texture_Create.argtypes = [TexturePtr, ctypes.c_int, ctypes.c_int]
+LIB_MOON._Texture_Create.restype = ctypes.c_bool
+LIB_MOON._Texture_UpdateFromImage.argtypes = [TexturePtr, ctypes.c_void_p, ctypes.c_int, ctypes.c_int]
+LIB_MOON._Texture_UpdateFromImage.restype = None
+LIB_MOON._Texture_UpdateFromPixels.argtypes = [TexturePtr, ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int]
+LIB_MOON._Texture_UpdateFromPixels.restype = None
 
 LIB_MOON._Texture_LoadFromFileWithBoundRect.argtypes = [TexturePtr, ctypes.c_char_p,
                                                          ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int]
@@ -451,6 +692,96 @@ class Texture2D(object):
                                                     rect_pos.x, rect_pos.y, rect_size.x, rect_size.y)
         return result, self
 
+    def load_from_image(self, image: "Image") -> bool:
+        """
+        #### Загружает текстуру из уже декодированного изображения.
+
+        ---
+
+        :Description:
+        - Выполняет только загрузку пикселей в видеопамять, без чтения и декодирования файла
+        - Должен вызываться из потока рендеринга (нужен OpenGL-контекст)
+
+        ---
+
+        :Args:
+            image (Image): Изображение в оперативной памяти.
+        :Returns:
+            bool: True, если загрузка прошла успешно.
+        """
+        return LIB_MOON._Texture_LoadFromImage(self.__ptr, image.get_ptr())
+
+    def create(self, width: int, height: int) -> bool:
+        """
+        #### Создает пустую текстуру заданного размера.
+
+        ---
+
+        :Args:
+            width (int): Ширина в пикселях.
+            height (int): Высота в пикселях.
+        :Returns:
+            bool: True, если текстура создана.
+        """
+        return LIB_MOON._Texture_Create(self.__ptr, int(width), int(height))
+
+    def __check_region(self, x: int, y: int, width: int, height: int) -> None:
+        size_x = LIB_MOON._Texture_GetSizeX(self.__ptr)
+        size_y = LIB_MOON._Texture_GetSizeY(self.__ptr)
+        if x < 0 or y < 0 or x + width > size_x or y + height > size_y:
+            raise ValueError(f"Region ({x}, {y}, {width}, {height}) is out of texture bounds ({size_x}, {size_y})")
+
+    def update_from_image(self, image: "Image", position: Vec2i | None = None) -> Self:
+        """
+        #### Загружает изображение в область текстуры без ее пересоздания.
+
+        ---
+
+        :Args:
+            image (Image): Изображение-источник (целиком помещается в текстуру).
+            position (Vec2i | None): Левый верхний угол области в текстуре. По умолчанию (0, 0).
+        :Returns:
+            Self: self (для цепочек вызовов).
+        :Raises:
+            ValueError: Если изображение выходит за границы текстуры.
+        """
+        x, y = (position.x, position.y) if position is not None else (0, 0)
+        size = image.get_size()
+        self.__check_region(x, y, size.x, size.y)
+        LIB_MOON._Texture_UpdateFromImage(self.__ptr, image.get_ptr(), x, y)
+        return self
+
+    def update_region(self, pixels: Any, position: Vec2i | None = None) -> Self:
+        """
+        #### Загружает массив пикселей в прямоугольную область текстуры одним вызовом.
+
+        ---
+
+        :Description:
+        - Массив формы (высота, ширина, 4) с типом uint8 (RGBA) передается без копирования,
+          если он уже непрерывный; иначе создается непрерывная копия
+        - Image передается в `update_from_image`
+
+        ---
+
+        :Args:
+            pixels (numpy.ndarray | Image): Пиксели области.
+            position (Vec2i | None): Левый верхний угол области в текстуре. По умолчанию (0, 0).
+        :Returns:
+            Self: self (для цепочек вызовов).
+        :Raises:
+            ValueError: Если массив имеет неверную форму или выходит за границы текстуры.
+        """
+        if isinstance(pixels, Image):
+            return self.update_from_image(pixels, position)
+
+        pixels = _as_rgba_array(pixels)
+        height, width = pixels.shape[0], pixels.shape[1]
+        x, y = (position.x, position.y) if position is not None else (0, 0)
+        self.__check_region(x, y, width, height)
+        LIB_MOON._Texture_UpdateFromPixels(self.__ptr, pixels.ctypes.data, width, height, x, y)
+        return self
+
     def load_from_ptr(self, ptr: TexturePtr) -> bool:
         """
         #### Загружает/подключает текстуру по существующему указателю.
@@ -752,38 +1083,341 @@ class Sprite2D(object):
         return self.__ptr
 
 type FrameTime = float
+type FrameRect = tuple[int, int, int, int]
+
+# Минимальная длительность кадра: нулевая длительность заменяется ею,
+# чтобы длительность клипа не была нулевой (секунды)
+MIN_FRAME_TIME: Final[float] = 1e-6
+
+
+class AnimationClock:
+    """
+    #### Общие часы анимаций
+
+    ---
+
+    :Description:
+    - Время читается один раз за кадр (`tick()`), а не каждым спрайтом
+    - Глобальный экземпляр ANIMATION_CLOCK продвигается окном в `Window.update()`
+    - Поддерживает паузу и масштаб времени (замедление/ускорение всех анимаций)
+    """
+
+    __slots__ = ('__time', '__last_tick', '__scale', '__paused')
+
+    def __init__(self):
+        self.__time: float = 0.0
+        self.__last_tick: float | None = None
+        self.__scale: float = 1.0
+        self.__paused: bool = False
+
+    def tick(self) -> float:
+        """
+        #### Продвигает часы на реальное время, прошедшее с прошлого вызова
+
+        ---
+
+        :Returns:
+            float: Продвижение часов в секундах (с учетом масштаба и паузы).
+        """
+        now = time.perf_counter()
+        last = self.__last_tick
+        self.__last_tick = now
+        if last is None:
+            return 0.0
+        return self.advance(now - last)
+
+    def advance(self, dt: float) -> float:
+        """
+        #### Продвигает часы на заданное время
+
+        ---
+
+        :Args:
+            dt (float): Прошедшее время в секундах.
+        :Returns:
+            float: Продвижение часов в секундах (с учетом масштаба и паузы).
+        """
+        if self.__paused:
+            return 0.0
+        dt *= self.__scale
+        self.__time += dt
+        return dt
+
+    def get_time(self) -> float:
+        """
+        #### Возвращает текущее время часов в секундах
+        """
+        return self.__time
+
+    def set_scale(self, scale: float) -> Self:
+        """
+        #### Устанавливает масштаб времени (1.0 - обычная скорость)
+        """
+        self.__scale = scale
+        return self
+
+    def get_scale(self) -> float:
+        return self.__scale
+
+    def set_paused(self, paused: bool) -> Self:
+        """
+        #### Ставит часы на паузу или снимает с нее
+        """
+        self.__paused = paused
+        return self
+
+    def is_paused(self) -> bool:
+        return self.__paused
+
+
+# Глобальные часы анимаций, продвигаемые окном один раз за кадр
+ANIMATION_CLOCK: Final[AnimationClock] = AnimationClock()
+
+
+class AnimationClip:
+    """
+    #### Таблица кадров анимации
+
+    ---
+
+    :Description:
+    - Прямоугольники кадров и моменты их окончания вычисляются один раз при создании
+    - Поддерживает полосы, сетки (спрайт-листы) и произвольные прямоугольники
+    - Каждый кадр может иметь собственную длительность
+    - Один клип может использоваться любым количеством спрайтов
+
+    ---
+
+    :Example:
+    ```python
+    run = AnimationClip.Grid(Vec2i(64, 64), columns=8, rows=2, frame_time=0.08)
+    attack = AnimationClip.Strip(Vec2i(64, 64), 6, [0.05, 0.05, 0.1, 0.2, 0.05, 0.05], offset=Vec2i(0, 128))
+    ```
+    """
+
+    __slots__ = ('__rects', '__durations', '__ends', '__total', '__uniform_time')
+
+    @classmethod
+    def Strip(cls, frame_size: Vec2i, frames_count: int, frame_time: FrameTime | list[FrameTime],
+              offset: Vec2i | None = None) -> "AnimationClip":
+        """
+        #### Создает клип из горизонтальной полосы кадров
+
+        ---
+
+        :Args:
+            frame_size (Vec2i): Размер одного кадра в пикселях.
+            frames_count (int): Количество кадров.
+            frame_time (float | list[float]): Длительность кадра или список длительностей.
+            offset (Vec2i | None): Позиция первого кадра в текстуре.
+        """
+        return cls.Grid(frame_size, frames_count, 1, frame_time, offset=offset)
+
+    @classmethod
+    def Grid(cls, frame_size: Vec2i, columns: int, rows: int, frame_time: FrameTime | list[FrameTime],
+             count: int | None = None, offset: Vec2i | None = None, spacing: Vec2i | None = None) -> "AnimationClip":
+        """
+        #### Создает клип из сетки кадров (спрайт-листа)
+
+        ---
+
+        :Description:
+        - Кадры идут слева направо, сверху вниз
+
+        ---
+
+        :Args:
+            frame_size (Vec2i): Размер одного кадра в пикселях.
+            columns (int): Количество столбцов.
+            rows (int): Количество строк.
+            frame_time (float | list[float]): Длительность кадра или список длительностей.
+            count (int | None): Количество кадров, если последняя строка заполнена не полностью.
+            offset (Vec2i | None): Позиция первого кадра в текстуре.
+            spacing (Vec2i | None): Промежуток между кадрами в пикселях.
+        """
+        ox, oy = (offset.x, offset.y) if offset is not None else (0, 0)
+        sx, sy = (spacing.x, spacing.y) if spacing is not None else (0, 0)
+        w, h = frame_size.x, frame_size.y
+        total = columns * rows if count is None else min(count, columns * rows)
+
+        rects = [
+            (ox + (i % columns) * (w + sx), oy + (i // columns) * (h + sy), w, h)
+            for i in range(total)
+        ]
+        return cls(rects, frame_time)
+
+    def __init__(self, rects: list[FrameRect], durations: FrameTime | list[FrameTime]):
+        """
+        #### Создает клип из готовых прямоугольников кадров
+
+        ---
+
+        :Args:
+            rects (list[tuple[int, int, int, int]]): Прямоугольники кадров (x, y, ширина, высота).
+            durations (float | list[float]): Длительность всех кадров или каждого кадра отдельно.
+                Нулевая длительность заменяется на MIN_FRAME_TIME.
+
+        :Raises:
+            ValueError: Нет кадров, число длительностей не совпадает с числом кадров
+                или длительность отрицательна.
+        """
+        if not rects:
+            raise ValueError("AnimationClip requires at least one frame")
+        if isinstance(durations, (int, float)):
+            durations = [float(durations)] * len(rects)
+        if len(durations) != len(rects):
+            raise ValueError("AnimationClip durations count must match frames count")
+        for duration in durations:
+            # not (>= 0) также отсекает NaN
+            if not duration >= 0:
+                raise ValueError(f"AnimationClip frame duration must be non-negative, got {duration}")
+        durations = [max(float(duration), MIN_FRAME_TIME) for duration in durations]
+
+        self.__rects: tuple[FrameRect, ...] = tuple(tuple(rect) for rect in rects)
+        self.__durations: tuple[float, ...] = tuple(durations)
+
+        # Моменты окончания кадров для поиска кадра бинарным поиском
+        self.__ends: list[float] = list(itertools.accumulate(self.__durations))
+        self.__total: float = self.__ends[-1]
+
+        # Для одинаковых длительностей кадр вычисляется делением, без поиска
+        first = self.__durations[0]
+        self.__uniform_time: float = first if all(d == first for d in self.__durations) else 0.0
+
+    def get_frames_count(self) -> int:
+        return len(self.__rects)
+
+    def get_rect(self, index: int) -> FrameRect:
+        """
+        #### Возвращает прямоугольник кадра (x, y, ширина, высота)
+        """
+        return self.__rects[index]
+
+    def get_rects(self) -> tuple[FrameRect, ...]:
+        return self.__rects
+
+    def get_duration(self, index: int) -> float:
+        return self.__durations[index]
+
+    def get_total_duration(self) -> float:
+        """
+        #### Возвращает длительность всего клипа в секундах
+        """
+        return self.__total
+
+    def frame_at(self, elapsed: float) -> int:
+        """
+        #### Возвращает индекс кадра для времени от начала клипа
+
+        ---
+
+        :Args:
+            elapsed (float): Время в секундах в диапазоне [0, длительность клипа).
+        """
+        if self.__uniform_time > 0.0:
+            index = int(elapsed / self.__uniform_time)
+        else:
+            index = bisect.bisect_right(self.__ends, elapsed)
+        last = len(self.__rects) - 1
+        return index if index < last else last
+
 
 class AnimatedSprite2D(Sprite2D):
+    """
+    #### Анимированный спрайт на основе таблицы кадров
+
+    ---
+
+    :Description:
+    - Кадры берутся из AnimationClip (полоса, сетка или произвольные прямоугольники)
+    - Без аргумента `update()` использует общие часы ANIMATION_CLOCK, которые
+      окно продвигает один раз за кадр
+    - Нативный texture rect обновляется только при смене кадра
+    - Для сотен спрайтов используйте AnimationSystem.update(dt)
+    """
 
-    __slots__ = ("__frames_count", "__frame_time", "__texture_size", "__ptr", "__is_started",
-                '__flip_vector', '__size', '__current_frame_index', '__last_time', '__cycle')
+    __slots__ = ('__sprite_ptr', '__clip', '__texture_size', '__current_frame_index',
+                 '__elapsed', '__last_clock_time', '__is_started', '__cycle', '__speed')
 
-    def __init__(self, texture_size: Vec2i, frames_count: int, frame_time: FrameTime):
+    def __init__(self, texture_size: Vec2i | None = None, frames_count: int = 1, frame_time: FrameTime = 0.1,
+                 clip: AnimationClip | None = None):
+        """
+        #### Создает анимированный спрайт
+
+        ---
+
+        :Args:
+            texture_size (Vec2i | None): Размер кадра для горизонтальной полосы.
+            frames_count (int): Количество кадров в полосе.
+            frame_time (float): Длительность кадра в секундах.
+            clip (AnimationClip | None): Готовый клип (имеет приоритет над параметрами полосы).
+        """
         super().__init__()
-        self.__frames_count = frames_count
-        self.__frame_time = frame_time
-        self.__texture_size = texture_size
-        self.set_texture_rect(Vec2i.zero(), self.__texture_size)
+        self.__sprite_ptr = self.get_ptr()
+
+        if clip is None:
+            if texture_size is None:
+                raise ValueError("AnimatedSprite2D requires texture_size or clip")
+            clip = AnimationClip.Strip(texture_size, frames_count, frame_time)
 
-        self.__current_frame_index = 0
-        self.__last_time = 0
+        self.__current_frame_index = -1
+        self.__elapsed = 0.0
+        self.__last_clock_time = ANIMATION_CLOCK.get_time()
 
         self.__cycle = True
         self.__is_started = False
+        self.__speed = 1.0
+
+        self.__clip: AnimationClip = clip
+        self.__texture_size = Vec2i(clip.get_rect(0)[2], clip.get_rect(0)[3])
+        self.__show_frame(0)
+
+    def __show_frame(self, index: int) -> None:
+        # Единственное место, где вызывается нативная установка texture rect
+        if index != self.__current_frame_index:
+            self.__current_frame_index = index
+            LIB_MOON._Sprite_SetTextureRect(self.__sprite_ptr, *self.__clip.get_rect(index))
+
+    def set_clip(self, clip: AnimationClip, restart: bool = True) -> Self:
+        """
+        #### Устанавливает клип анимации
+
+        ---
+
+        :Args:
+            clip (AnimationClip): Новый клип.
+            restart (bool): Начать клип с первого кадра.
+        """
+        if clip is self.__clip and not restart:
+            return self
+        self.__clip = clip
+        self.__texture_size = Vec2i(clip.get_rect(0)[2], clip.get_rect(0)[3])
+        self.__current_frame_index = -1
+        if restart:
+            self.__elapsed = 0.0
+        else:
+            self.__elapsed %= clip.get_total_duration()
+        self.__show_frame(clip.frame_at(self.__elapsed))
+        return self
+
+    def get_clip(self) -> AnimationClip:
+        return self.__clip
 
     def start(self):
         """
         #### Запускает анимацию (без сброса индекса кадра).
         """
+        self.__last_clock_time = ANIMATION_CLOCK.get_time()
         self.__is_started = True
 
     def restart(self):
         """
         #### Перезапускает анимацию: сбрасывает индекс кадра и время.
         """
-        self.__current_frame_index = 0
-        self.__last_time = time.time()
+        self.__elapsed = 0.0
+        self.__last_clock_time = ANIMATION_CLOCK.get_time()
         self.__is_started = True
+        self.__show_frame(0)
 
     def stop(self):
         """
@@ -791,11 +1425,40 @@ class AnimatedSprite2D(Sprite2D):
         """
         self.__is_started = False
 
+    def is_started(self) -> bool:
+        return self.__is_started
+
+    def set_cycle(self, value: bool) -> Self:
+        """
+        #### Включает/выключает зацикливание (без него анимация останавливается на последнем кадре).
+        """
+        self.__cycle = value
+        return self
+
+    def get_cycle(self) -> bool:
+        return self.__cycle
+
+    def set_speed(self, speed: float) -> Self:
+        """
+        #### Устанавливает множитель скорости воспроизведения.
+        """
+        self.__speed = speed
+        return self
+
+    def get_speed(self) -> float:
+        return self.__speed
+
     def get_frames_count(self) -> int:
         """
         #### Возвращает количество кадров в анимации.
         """
-        return self.__frames_count
+        return self.__clip.get_frames_count()
+
+    def get_current_frame(self) -> int:
+        """
+        #### Возвращает индекс текущего кадра.
+        """
+        return self.__current_frame_index
 
     def get_texture_size(self) -> Vec2i:
         """
@@ -805,31 +1468,122 @@ class AnimatedSprite2D(Sprite2D):
 
     def get_frame_time(self) -> FrameTime:
         """
-        #### Возвращает время отображения одного кадра (в секундах).
+        #### Возвращает время отображения текущего кадра (в секундах).
         """
-        return self.__frame_time
+        return self.__clip.get_duration(self.__current_frame_index)
 
-    def update(self):
+    def advance(self, dt: float) -> None:
         """
-        #### Обновляет состояние анимированного спрайта — переключает кадры в зависимости от времени.
+        #### Продвигает анимацию на dt секунд.
         """
-        at_time = time.time()
-        delta = at_time - self.__last_time
-        if self.__is_started:
-            if delta >= self.__frame_time:
-                self.__current_frame_index += 1
-                self.__last_time = at_time
-        if self.__current_frame_index >= self.__frames_count:
+        if not self.__is_started:
+            return
+        clip = self.__clip
+        elapsed = self.__elapsed + dt * self.__speed
+        total = clip.get_total_duration()
+        if elapsed >= total:
             if self.__cycle:
-                self.__current_frame_index = 0
+                elapsed %= total
             else:
-                self.__current_frame_index -= 1
+                self.__elapsed = total
+                self.__show_frame(clip.get_frames_count() - 1)
                 self.stop()
-        super().set_texture_rect(Vec2i(self.__current_frame_index * self.__texture_size.x, 0), self.__texture_size)
+                return
+        self.__elapsed = elapsed
+        self.__show_frame(clip.frame_at(elapsed))
+
+    def update(self, dt: float | None = None):
+        """
+        #### Обновляет состояние анимированного спрайта — переключает кадры в зависимости от времени.
+
+        ---
+
+        :Args:
+            dt (float | None): Прошедшее время в секундах. None - время общих часов ANIMATION_CLOCK.
+        """
+        if dt is None:
+            now = ANIMATION_CLOCK.get_time()
+            dt = now - self.__last_clock_time
+            self.__last_clock_time = now
+        self.advance(dt)
 
     def get_ptr(self) -> SpritePtr:
         return super().get_ptr()
 
+
+class AnimationSystem:
+    """
+    #### Пакетное обновление анимированных спрайтов
+
+    ---
+
+    :Description:
+    - Один вызов `update(dt)` продвигает все зарегистрированные спрайты
+    - Остановленные спрайты пропускаются без обращений к нативной библиотеке
+
+    ---
+
+    :Example:
+    ```python
+    animations = AnimationSystem()
+    for enemy in enemies:
+        animations.add(enemy.sprite)
+
+    while window.update(events):
+        animations.update()     # шаг общих часов за прошедший кадр
+    ```
+    """
+
+    __slots__ = ('__sprites', '__clock_time')
+
+    def __init__(self):
+        self.__sprites: list[AnimatedSprite2D] = []
+        self.__clock_time: float = ANIMATION_CLOCK.get_time()
+
+    def add(self, sprite: AnimatedSprite2D) -> Self:
+        """
+        #### Регистрирует спрайт в системе
+        """
+        self.__sprites.append(sprite)
+        return self
+
+    def remove(self, sprite: AnimatedSprite2D) -> Self:
+        """
+        #### Удаляет спрайт из системы
+        """
+        self.__sprites.remove(sprite)
+        return self
+
+    def clear(self) -> Self:
+        self.__sprites.clear()
+        return self
+
+    def get_sprites(self) -> list[AnimatedSprite2D]:
+        return self.__sprites
+
+    def get_count(self) -> int:
+        return len(self.__sprites)
+
+    def update(self, dt: float | None = None) -> None:
+        """
+        #### Продвигает все зарегистрированные спрайты
+
+        ---
+
+        :Args:
+            dt (float | None): Прошедшее время в секундах. None - время общих часов ANIMATION_CLOCK
+            с прошлого вызова.
+        """
+        if dt is None:
+            now = ANIMATION_CLOCK.get_time()
+            dt = now - self.__clock_time
+            self.__clock_time = now
+        if dt <= 0.0:
+            return
+        for sprite in self.__sprites:
+            if sprite.is_started():
+                sprite.advance(dt)
+
 ImagePtr = ctypes.c_void_p
 LIB_MOON._Image_TextureCopyToImage.argtypes = [TexturePtr]
 LIB_MOON._Image_TextureCopyToImage.restype = ImagePtr
@@ -846,6 +1600,60 @@ LIB_MOON._Image_Save.restype = ctypes.c_bool
 LIB_MOON._Image_Init.argtypes = []
 LIB_MOON._Image_Init.restype = ImagePtr
 
+LIB_MOON._Image_LoadFromFile.argtypes = [ImagePtr, ctypes.c_char_p]
+LIB_MOON._Image_LoadFromFile.restype = ctypes.c_bool
+
+LIB_MOON._Image_GetSizeX.argtypes = [ImagePtr]
+LIB_MOON._Image_GetSizeX.restype = ctypes.c_int
+
+LIB_MOON._Image_GetSizeY.argtypes = [ImagePtr]
+LIB_MOON._Image_GetSizeY.restype = ctypes.c_int
+
+LIB_MOON._Image_Create.argtypes = [ImagePtr, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int]
+LIB_MOON._Image_Create.restype = None
+
+LIB_MOON._Image_CreateFromPixels.argtypes = [ImagePtr, ctypes.c_int, ctypes.c_int, ctypes.c_void_p]
+LIB_MOON._Image_CreateFromPixels.restype = None
+
+LIB_MOON._Image_GetPixelsPtr.argtypes = [ImagePtr]
+LIB_MOON._Image_GetPixelsPtr.restype = ctypes.c_void_p
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("NumPy is required for pixel access: pip install numpy")
+
+
+def _as_rgba_array(pixels: Any) -> Any:
+    """
+    #### Приводит массив пикселей к непрерывному массиву uint8 формы (высота, ширина, 4).
+
+    ---
+
+    :Description:
+    - (высота, ширина) - оттенки серого, альфа = 255
+    - (высота, ширина, 3) - RGB, альфа = 255
+    - (высота, ширина, 4) - RGBA, без копирования, если массив уже uint8 и непрерывный
+    """
+    _require_numpy()
+    pixels = np.asarray(pixels)
+    if pixels.dtype != np.uint8:
+        raise ValueError(f"Pixel array must have dtype uint8, got {pixels.dtype}")
+
+    if pixels.ndim == 2:
+        rgba = np.empty((*pixels.shape, 4), dtype=np.uint8)
+        rgba[..., :3] = pixels[..., None]
+        rgba[..., 3] = 255
+        return rgba
+    if pixels.ndim == 3 and pixels.shape[2] == 3:
+        rgba = np.empty((pixels.shape[0], pixels.shape[1], 4), dtype=np.uint8)
+        rgba[..., :3] = pixels
+        rgba[..., 3] = 255
+        return rgba
+    if pixels.ndim == 3 and pixels.shape[2] == 4:
+        return np.ascontiguousarray(pixels)
+    raise ValueError(f"Pixel array must have shape (h, w), (h, w, 3) or (h, w, 4), got {pixels.shape}")
+
 class Image:
     @classmethod
     def CopyFromTexture(cls, texture: Texture2D) -> "Image":
@@ -881,12 +1689,44 @@ class Image:
         img.set_ptr(ptr)
         return img
 
+    @classmethod
+    def FromArray(cls, pixels: Any) -> "Image":
+        """
+        #### Создаёт объект Image из массива NumPy.
+
+        ---
+
+        :Args:
+            pixels (numpy.ndarray): Массив uint8 формы (h, w, 4), (h, w, 3) или (h, w).
+        :Returns:
+            Image: Новое изображение с копией пикселей.
+        :Example:
+        ```python
+        y, x = np.mgrid[-1:1:256j, -1:1:256j]
+        falloff = np.clip(1 - np.hypot(x, y), 0, 1)
+        pixels = np.zeros((256, 256, 4), dtype=np.uint8)
+        pixels[..., :3] = 255
+        pixels[..., 3] = (falloff ** 2 * 255).astype(np.uint8)
+        light = Image.FromArray(pixels)
+        ```
+        """
+        pixels = _as_rgba_array(pixels)
+        img = Image()
+        LIB_MOON._Image_CreateFromPixels(img.get_ptr(), pixels.shape[1], pixels.shape[0], pixels.ctypes.data)
+        return img
+
     def __init__(self):
         """
         #### Инициализация объекта Image и выделение нативного ресурса.
         """
         self.__ptr = LIB_MOON._Image_Init()
 
+    def __del__(self):
+        # Освобождаем нативный буфер пикселей
+        if self.__ptr:
+            LIB_MOON._Image_Delete(self.__ptr)
+            self.__ptr = None
+
     def get_ptr(self) -> ImagePtr:
         """
         #### Возвращает нативный указатель Image.
@@ -921,5 +1761,87 @@ class Image:
         :Returns:
             bool: True при успешном сохранении, иначе False.
         """
-        print(self.__ptr)
         return LIB_MOON._Image_Save(self.__ptr, file_path.encode('utf-8'))
+
+    def create(self, width: int, height: int, color: Color = COLOR_TRANSPARENT) -> Self:
+        """
+        #### Пересоздаёт изображение заданного размера, залитое цветом.
+
+        ---
+
+        :Args:
+            width (int): Ширина в пикселях.
+            height (int): Высота в пикселях.
+            color (Color): Цвет заливки. По умолчанию прозрачный.
+        :Returns:
+            Self: self (для цепочек вызовов).
+        """
+        LIB_MOON._Image_Create(self.__ptr, int(width), int(height), color.r, color.g, color.b, color.a)
+        return self
+
+    def as_array(self) -> Any:
+        """
+        #### Возвращает пиксели изображения как массив NumPy без копирования.
+
+        ---
+
+        :Description:
+        - Массив uint8 формы (высота, ширина, 4), RGBA
+        - Изменения массива сразу меняют изображение (и наоборот)
+        - Массив удерживает объект Image, но становится недействительным после
+          `create`, `load_from_file` или других операций, меняющих размер изображения
+
+        ---
+
+        :Returns:
+            numpy.ndarray: Представление внутреннего буфера пикселей.
+        """
+        _require_numpy()
+        size = self.get_size()
+        count = size.x * size.y * 4
+        if count == 0:
+            return np.zeros((size.y, size.x, 4), dtype=np.uint8)
+
+        buffer = (ctypes.c_uint8 * count).from_address(LIB_MOON._Image_GetPixelsPtr(self.__ptr))
+        # Буфер удерживает изображение, а массив удерживает буфер
+        buffer._owner = self
+        return np.ctypeslib.as_array(buffer).reshape(size.y, size.x, 4)
+
+    def to_array(self) -> Any:
+        """
+        #### Возвращает копию пикселей изображения как массив NumPy формы (высота, ширина, 4).
+        """
+        return self.as_array().copy()
+
+    def load_from_file(self, file_path: str) -> bool:
+        """
+        #### Загружает и декодирует изображение из файла (PNG, JPG, BMP, TGA...).
+
+        ---
+
+        :Description:
+        - Работает только с оперативной памятью и не требует OpenGL-контекста,
+          поэтому может вызываться из фоновых потоков
+
+        ---
+
+        :Args:
+            file_path (str): Путь к файлу изображения.
+        :Returns:
+            bool: True при успешной загрузке, иначе False.
+        """
+        return LIB_MOON._Image_LoadFromFile(self.__ptr, file_path.encode('utf-8'))
+
+    def get_size(self) -> Vec2i:
+        """
+        #### Возвращает размер изображения.
+
+        ---
+
+        :Returns:
+            Vec2i: Размер изображения (ширина, высота) в пикселях.
+        """
+        return Vec2i(
+            LIB_MOON._Image_GetSizeX(self.__ptr),
+            LIB_MOON._Image_GetSizeY(self.__ptr)
+        )
@@ -74,7 +74,7 @@ import os
 import sys
 import ctypes
 from colorama import Fore
-from typing import Any, Self
+from typing import Any, Final, Self
 from enum import Enum
 
 
@@ -83,7 +83,15 @@ from Moon.python.Vectors import Vec2f
 from Moon.python.Types import OriginTypes
 
 
-from Moon.python.utils import find_library, LibraryLoadError
+from Moon.python.utils import get_native_library, LibraryLoadError
+from Moon.python.Log import get_logger
+
+# Логгер поиска и загрузки шрифтов
+LOGGER = get_logger("FontLoader")
+
+# Максимум строк в кэше измерений шрифта (при переполнении кэш очищается) == +
+FONT_MEASURE_CACHE_LIMIT: Final[int] = 4096                                 #
+# ========================================================================= +
 
 ##################################################################
 #                   `C / C++` Bindings                           #
@@ -91,11 +99,8 @@ from Moon.python.utils import find_library, LibraryLoadError
 #   из нативной DLL библиотеки PySGL, используемых через ctypes. #
 ##################################################################
 
-# Загружаем DLL библиотеку
-try:
-    LIB_MOON = ctypes.CDLL(find_library())
-except Exception as e:
-    raise ImportError(f"Failed to load PySGL library: {e}")
+# Общий дескриптор нативной библиотеки (загружается при первом вызове нативной функции)
+LIB_MOON = get_native_library()
 
 
 LIB_MOON.loadSystemFont.argtypes = [ctypes.c_char_p]
@@ -130,6 +135,13 @@ LIB_MOON.setFont.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
 LIB_MOON.setFont.restype = None
 LIB_MOON.setTextScale.argtypes = [ctypes.c_void_p, ctypes.c_float, ctypes.c_float]
 LIB_MOON.setTextScale.restype = None
+LIB_MOON.getFontTextAdvance.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_bool, ctypes.c_float]
+LIB_MOON.getFontTextAdvance.restype = ctypes.c_double
+LIB_MOON.getFontGlyphMetrics.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_bool, ctypes.c_float,
+                                          ctypes.POINTER(ctypes.c_float), ctypes.c_int]
+LIB_MOON.getFontGlyphMetrics.restype = ctypes.c_int
+LIB_MOON.getFontLineSpacing.argtypes = [ctypes.c_void_p, ctypes.c_int]
+LIB_MOON.getFontLineSpacing.restype = ctypes.c_float
 
 
 class FontLoadError(Exception):
@@ -199,7 +211,7 @@ class Font:
                         file_ext = os.path.splitext(file)[1].lower()
                         if file_ext in ['.ttf', '.otf', '.ttc']:
                             full_path = os.path.join(root, file)
-                            print(f"[ {Fore.MAGENTA}FontLoader{Fore.RESET} ] [ {Fore.GREEN}debug{Fore.RESET} ] Found font: '{full_path}'")
+                            LOGGER.debug("Found font: '%s'", full_path)
                             return full_path
             return None
 
@@ -251,33 +263,33 @@ class Font:
             # Удаляем дубликаты
             expanded_directories = list(set(expanded_directories))
 
-            print(f"[ {Fore.MAGENTA}FontLoader{Fore.RESET} ] [ {Fore.BLUE}info{Fore.RESET} ] Searching for font '{name}' in {len(expanded_directories)} directories...")
+            LOGGER.debug("Searching for font '%s' in %d directories...", name, len(expanded_directories))
 
             # Рекурсивный поиск в каждой директории
             for directory in expanded_directories:
                 if os.path.exists(directory):
-                    print(f"[ {Fore.MAGENTA}FontLoader{Fore.RESET} ] [ {Fore.CYAN}search{Fore.RESET} ] Scanning: {directory}")
+                    LOGGER.debug("Scanning: %s", directory)
                     font_path = find_font_recursive(directory, name)
                     if font_path:
-                        print(f"[ {Fore.MAGENTA}FontLoader{Fore.RESET} ] [ {Fore.GREEN}success{Fore.RESET} ] Font found: '{font_path}'")
+                        LOGGER.info("Font found: '%s'", font_path)
                         return Font(font_path)
 
             # Если шрифт не найден, попробуем найти похожие варианты
-            print(f"[ {Fore.MAGENTA}FontLoader{Fore.RESET} ] [ {Fore.YELLOW}warn{Fore.RESET} ] Font '{name}' not found, searching for alternatives...")
+            LOGGER.warning("Font '%s' not found, searching for alternatives...", name)
 
             # Поиск шрифтов с похожими именами
-            alternative_found = False
+            alternatives = []
             for directory in expanded_directories:
                 if os.path.exists(directory):
                     for root, dirs, files in os.walk(directory):
                         for file in files:
                             if name.lower() in file.lower() and os.path.splitext(file)[1].lower() in ['.ttf', '.otf', '.ttc']:
                                 full_path = os.path.join(root, file)
-                                print(f"[ {Fore.MAGENTA}FontLoader{Fore.RESET} ] [ {Fore.YELLOW}alternative{Fore.RESET} ] Similar font found: '{full_path}'")
-                                alternative_found = True
+                                LOGGER.debug("Similar font found: '%s'", full_path)
+                                alternatives.append(full_path)
 
-            if alternative_found:
-                raise FileNotFoundError(f"[ {Fore.MAGENTA}FontLoader{Fore.RESET} ] [ {Fore.RED}error{Fore.RESET} ] Exact font '{name}' not found, but similar fonts exist. See warnings above.")
+            if alternatives:
+                raise FileNotFoundError(f"[ {Fore.MAGENTA}FontLoader{Fore.RESET} ] [ {Fore.RED}error{Fore.RESET} ] Exact font '{name}' not found, but similar fonts exist: {alternatives}")
             else:
                 raise FileNotFoundError(f"[ {Fore.MAGENTA}FontLoader{Fore.RESET} ] [ {Fore.RED}error{Fore.RESET} ] Font '{name}' not found in any system directories.")
 
@@ -300,6 +312,10 @@ class Font:
         if self.__font_ptr is None:
             raise FailedUnicodeCharacterSet()
 
+        # Кэш измерений: (строка, размер, жирный, интервал) -> ширина
+        self.__advance_cache: dict[tuple[str, int, bool, float], float] = {}
+        self.__line_spacing_cache: dict[int, float] = {}
+
     def get_ptr(self):
         """
         #### Возвращает указатель на нативный объект шрифта
@@ -322,6 +338,109 @@ class Font:
         """
         return self.__font_path
 
+    def measure_text(self, text: str, size: int, bold: bool = False, letter_spacing: float = 1.0) -> float:
+        """
+        #### Измеряет ширину строки без создания текстового объекта
+
+        ---
+
+        :Description:
+        - Суммирует продвижение глифов и кернинг так же, как это делает sf::Text
+        - Результат кэшируется, повторные измерения не обращаются к нативной библиотеке;
+          кэш ограничен FONT_MEASURE_CACHE_LIMIT строками и очищается при переполнении
+        - Используется системой разметки RichText для переноса строк
+
+        ---
+
+        :Args:
+        - text (str): Измеряемая строка (без переводов строк)
+        - size (int): Размер шрифта в пикселях
+        - bold (bool): Использовать жирное начертание
+        - letter_spacing (float): Коэффициент межбуквенного интервала (1.0 = обычный)
+
+        ---
+
+        :Returns:
+        - float: Ширина строки в пикселях
+
+        ---
+
+        :Example:
+        ```python
+        width = font.measure_text("Hello", 24)
+        ```
+        """
+        key = (text, size, bold, letter_spacing)
+        advance = self.__advance_cache.get(key)
+        if advance is None:
+            if len(self.__advance_cache) >= FONT_MEASURE_CACHE_LIMIT:
+                self.__advance_cache.clear()
+            advance = LIB_MOON.getFontTextAdvance(self.__font_ptr, text.encode('utf-8'), int(size), bold, letter_spacing)
+            self.__advance_cache[key] = advance
+        return advance
+
+    def measure_glyphs(self, text: str, size: int, bold: bool = False,
+                       letter_spacing: float = 1.0) -> tuple[list[float], list[float]]:
+        """
+        #### Измеряет каждый символ строки одним нативным вызовом
+
+        ---
+
+        :Description:
+        - Возвращает продвижение каждого символа (с межбуквенным интервалом)
+          и кернинг с предыдущим символом
+        - Ширина подстроки text[begin:end] = sum(advances[begin:end]) + sum(kernings[begin + 1:end])
+        - Результат не кэшируется (используется для разбиения длинных слов)
+
+        ---
+
+        :Args:
+        - text (str): Измеряемая строка (без переводов строк)
+        - size (int): Размер шрифта в пикселях
+        - bold (bool): Использовать жирное начертание
+        - letter_spacing (float): Коэффициент межбуквенного интервала (1.0 = обычный)
+
+        ---
+
+        :Returns:
+        - tuple[list[float], list[float]]: (продвижения, кернинги), по элементу на символ
+        """
+        buffer = (ctypes.c_float * (len(text) * 2))()
+        count = LIB_MOON.getFontGlyphMetrics(self.__font_ptr, text.encode('utf-8'), int(size), bold,
+                                             letter_spacing, buffer, len(text))
+        return list(buffer[1:count * 2:2]), list(buffer[0:count * 2:2])
+
+    def get_line_spacing(self, size: int) -> float:
+        """
+        #### Возвращает межстрочный интервал шрифта
+
+        ---
+
+        :Args:
+        - size (int): Размер шрифта в пикселях
+
+        ---
+
+        :Returns:
+        - float: Расстояние между базовыми линиями соседних строк в пикселях
+        """
+        spacing = self.__line_spacing_cache.get(size)
+        if spacing is None:
+            spacing = LIB_MOON.getFontLineSpacing(self.__font_ptr, int(size))
+            self.__line_spacing_cache[size] = spacing
+        return spacing
+
+    def clear_measure_cache(self) -> None:
+        """
+        #### Очищает кэш измерений строк
+
+        ---
+
+        :Description:
+        - Полезно после вывода больших объемов уникального текста
+        """
+        self.__advance_cache.clear()
+
 
 def get_system_font_names() -> list[str]:
     """
@@ -383,16 +502,16 @@ def init_system_fonts():
     global ARRAY_OF_SYSTEM_FONTS
     ARRAY_OF_SYSTEM_FONTS = []
     detected_fonts = get_system_font_names()
-    print(f"[ {Fore.MAGENTA}FontLoader{Fore.RESET} ] Detected {Fore.CYAN}{len(detected_fonts)}{Fore.RESET} fonts")
+    LOGGER.info("Detected %d fonts", len(detected_fonts))
     for i, name in enumerate(detected_fonts):
-        print(f"[ {Fore.MAGENTA}FontLoader{Fore.RESET} ] Loading font '{name}'")
+        LOGGER.debug("Loading font '%s'", name)
         try:
             font = Font.SystemFont(name)
             if font is not None:
                 ARRAY_OF_SYSTEM_FONTS.append(font)
         except:
-            print(f"[ {Fore.MAGENTA}FontLoader{Fore.RESET} ] [ {Fore.RED}error{Fore.RESET} ] Font '{name}' has not been loaded.")
-    print(f"[ {Fore.MAGENTA}FontLoader{Fore.RESET} ] [ {Fore.BLACK}note{Fore.RESET} ] Loaded {Fore.CYAN}{len(ARRAY_OF_SYSTEM_FONTS)}/{len(detected_fonts)}{Fore.RESET} fonts.")
+            LOGGER.error("Font '%s' has not been loaded.", name)
+    LOGGER.info("Loaded %d/%d fonts.", len(ARRAY_OF_SYSTEM_FONTS), len(detected_fonts))
 
 def clear_system_fonts_cache():
     """
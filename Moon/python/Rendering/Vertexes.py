@@ -78,15 +78,12 @@ from csv import QUOTE_ALL
 import ctypes
 from enum import Enum
 from typing import Self
-from Moon.python.utils import find_library
+from Moon.python.utils import get_native_library
 from Moon.python.Vectors import Vec2f, Vec2i, Vec2T
 from Moon.python.Colors import *
 
-# Загружаем DLL библиотеку
-try:
-    LIB_MOON = ctypes.CDLL(find_library())
-except Exception as e:
-    raise ImportError(f"Failed to load PySGL library: {e}")
+# Общий дескриптор нативной библиотеки (загружается при первом вызове нативной функции)
+LIB_MOON = get_native_library()
 
 VertexPtr = ctypes.c_void_p
 VertexArrayPtr = ctypes.c_void_p
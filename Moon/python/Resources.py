@@ -0,0 +1,497 @@
+"""
+#### *Модуль управления ресурсами в Moon*
+
+---
+
+##### Версия: 1.0.0
+
+*Автор: Павлов Иван (Pavlov Ivan)*
+
+*Лицензия: MIT*
+##### Реализованно на 90%
+
+---
+
+✓ Общие ресурсы по пути к файлу:
+  - Texture2D, SoundBuffer и Font загружаются один раз на путь
+  - Повторные запросы возвращают хендл на уже загруженный объект
+  - Подсчет ссылок через хендлы ResourceHandle
+
+✓ Учет памяти:
+  - Текстуры: ширина × высота × 4 байта
+  - Звуковые буферы: количество сэмплов × 2 байта
+  - Шрифты: размер файла
+
+✓ Вытеснение:
+  - Ресурсы без ссылок остаются в кэше и переиспользуются при повторной загрузке
+  - Если их суммарный объем превышает бюджет, удаляются давно не используемые (LRU)
+
+✓ Панель памяти в отладочной информации окна (window.set_view_info())
+
+---
+
+:Requires:
+
+• Python 3.12+
+
+• Moon.python.Rendering.Sprites (Texture2D)
+
+• Moon.python.Audio (SoundBuffer)
+
+• Moon.python.Rendering.Text (Font)
+
+---
+
+== Лицензия MIT ==================================================
+
+[MIT License]
+Copyright (c) 2025 Pavlov Ivan
+
+Данная лицензия разрешает лицам, получившим копию данного программного обеспечения
+и сопутствующей документации (в дальнейшем именуемыми «Программное Обеспечение»),
+безвозмездно использовать Программное Обеспечение без ограничений, включая неограниченное
+право на использование, копирование, изменение, слияние, публикацию, распространение,
+сублицензирование и/или продажу копий Программного Обеспечения, а также лицам, которым
+предоставляется данное Программное Обеспечение, при соблюдении следующих условий:
+
+[ Уведомление об авторском праве и данные условия должны быть включены во все копии ]
+[                 или значительные части Программного Обеспечения.                  ]
+
+ПРОГРАММНОЕ ОБЕСПЕЧЕНИЕ ПРЕДОСТАВЛЯЕТСЯ «КАК ЕСТЬ», БЕЗ КАКИХ-ЛИБО ГАРАНТИЙ, ЯВНО
+ВЫРАЖЕННЫХ ИЛИ ПОДРАЗУМЕВАЕМЫХ, ВКЛЮЧАЯ, НО НЕ ОГРАНИЧИВАЯСЬ ГАРАНТИЯМИ ТОВАРНОЙ
+ПРИГОДНОСТИ, СООТВЕТСТВИЯ ПО ЕГО КОНКРЕТНОМУ НАЗНАЧЕНИЮ И ОТСУТСТВИЯ НАРУШЕНИЙ ПРАВ.
+НИ В КАКОМ СЛУЧАЕ АВТОРЫ ИЛИ ПРАВООБЛАДАТЕЛИ НЕ НЕСУТ ОТВЕТСТВЕННОСТИ ПО ИСКАМ О
+ВОЗМЕЩЕНИИ УЩЕРБА, УБЫТКОВ ИЛИ ДРУГИХ ТРЕБОВАНИЙ ПО ДЕЙСТВУЮЩЕМУ ПРАВУ ИЛИ ИНОМУ,
+ВОЗНИКШИМ ИЗ, ИМЕЮЩИМ ПРИЧИНОЙ ИЛИ СВЯЗАННЫМ С ПРОГРАММНЫМ ОБЕСПЕЧЕНИЕМ ИЛИ
+ИСПОЛЬЗОВАНИЕМ ПРОГРАММНОГО ОБЕСПЕЧЕНИЯ ИЛИ ИНЫМИ ДЕЙСТВИЯМИ С ПРОГРАММНЫМ ОБЕСПЕЧЕНИЕМ.
+"""
+
+import os
+from collections import OrderedDict
+from colorama import Fore
+from typing import Any, Callable, Final, Self
+
+from Moon.python.Audio import SoundBuffer
+from Moon.python.Rendering.Text import Font
+from Moon.python.Rendering.Sprites import Texture2D
+
+
+# ////////////////////////////////////////////////////////////////////////////
+# Типы ресурсов
+# ////////////////////////////////////////////////////////////////////////////
+RESOURCE_TEXTURE: Final[str] = "texture"
+RESOURCE_SOUND_BUFFER: Final[str] = "sound_buffer"
+RESOURCE_FONT: Final[str] = "font"
+
+RESOURCE_KINDS: Final[tuple[str, ...]] = (RESOURCE_TEXTURE, RESOURCE_SOUND_BUFFER, RESOURCE_FONT)
+
+# ////////////////////////////////////////////////////////////////////////////
+# Бюджет памяти для ресурсов без ссылок по умолчанию (байты)
+# ////////////////////////////////////////////////////////////////////////////
+DEFAULT_UNUSED_BUDGET: Final[int] = 256 * 1024 * 1024
+
+
+def format_bytes(size: int) -> str:
+    """
+    #### Форматирует размер в байтах в читаемую строку (B, KB, MB, GB)
+    """
+    value = float(size)
+    for unit in ("B", "KB", "MB"):
+        if value < 1024.0:
+            return f"{value:.0f}{unit}" if unit == "B" else f"{value:.1f}{unit}"
+        value /= 1024.0
+    return f"{value:.2f}GB"
+
+
+class _ResourceEntry:
+    # Запись кэша: один загруженный ресурс и число выданных на него хендлов
+    __slots__ = ('key', 'kind', 'path', 'resource', 'refs', 'size')
+
+    def __init__(self, key: tuple[str, str], kind: str, path: str, resource: Any, size: int):
+        self.key = key
+        self.kind = kind
+        self.path = path
+        self.resource = resource
+        self.refs = 0
+        self.size = size
+
+
+class ResourceHandle:
+    """
+    #### Хендл общего ресурса
+
+    ---
+
+    :Description:
+    - Пока существует хотя бы один неосвобожденный хендл, ресурс не вытесняется
+    - Ссылка освобождается вызовом `release()` или автоматически при удалении хендла
+    - Все хендлы одного пути указывают на один объект: изменение его состояния
+      (например, set_smooth у текстуры) видно всем владельцам
+    """
+
+    __slots__ = ('__manager', '__entry', '__released')
+
+    def __init__(self, manager: "Resources", entry: _ResourceEntry):
+        self.__manager: Resources = manager
+        self.__entry: _ResourceEntry = entry
+        self.__released: bool = False
+        entry.refs += 1
+
+    def __del__(self):
+        self.release()
+
+    def get(self) -> Any:
+        """
+        #### Возвращает ресурс (Texture2D, SoundBuffer или Font)
+
+        ---
+
+        :Note:
+        - Храните хендл, пока используется ресурс или нативные объекты, ссылающиеся
+          на него (спрайт со связанной текстурой, звук с буфером, текст со шрифтом).
+          После release() ресурс может быть вытеснен и удален, а нативный объект
+          останется с висячим указателем
+        """
+        return self.__entry.resource
+
+    def get_path(self) -> str:
+        """
+        #### Возвращает путь к файлу ресурса
+        """
+        return self.__entry.path
+
+    def get_kind(self) -> str:
+        """
+        #### Возвращает тип ресурса (RESOURCE_*)
+        """
+        return self.__entry.kind
+
+    def get_size_bytes(self) -> int:
+        """
+        #### Возвращает оценку занимаемой ресурсом памяти в байтах
+        """
+        return self.__entry.size
+
+    def get_ref_count(self) -> int:
+        """
+        #### Возвращает количество активных хендлов на этот ресурс
+        """
+        return self.__entry.refs
+
+    def is_released(self) -> bool:
+        """
+        #### Проверяет, освобожден ли хендл
+        """
+        return self.__released
+
+    def share(self) -> "ResourceHandle":
+        """
+        #### Создает еще один хендл на тот же ресурс (увеличивает счетчик ссылок)
+        """
+        if self.__released:
+            raise RuntimeError(f"[ {Fore.MAGENTA}Resources{Fore.RESET} ] [ {Fore.RED}error{Fore.RESET} ] Handle for '{self.__entry.path}' is already released")
+        return ResourceHandle(self.__manager, self.__entry)
+
+    def release(self) -> None:
+        """
+        #### Освобождает ссылку на ресурс
+
+        ---
+
+        :Note:
+        - Повторный вызов ничего не делает
+        - После освобождения ресурс остается в кэше, пока не будет вытеснен
+        """
+        if self.__released:
+            return
+        self.__released = True
+        self.__manager._release(self.__entry)
+
+
+class Resources:
+    """
+    #### Менеджер общих ресурсов с подсчетом ссылок
+
+    ---
+
+    :Description:
+    - Текстуры, звуковые буферы и шрифты загружаются один раз на путь к файлу
+    - Каждая загрузка возвращает ResourceHandle и увеличивает счетчик ссылок
+    - Ресурсы без ссылок хранятся в LRU-кэше в пределах бюджета памяти
+      и переиспользуются без повторного чтения файла
+
+    ---
+
+    :Note:
+    - Шрифты учитываются по размеру файла; нативный объект шрифта
+      освобождается библиотекой только при завершении программы
+
+    ---
+
+    :Example:
+    ```python
+    resources = get_resources()
+    player = resources.load_texture("assets/player.png")
+    enemy = resources.load_texture("assets/player.png")   # тот же Texture2D
+
+    # Спрайт хранит только нативный указатель на текстуру: хендл должен жить,
+    # пока живет спрайт, иначе вытесненная текстура оставит указатель висячим
+    sprite = BaseSprite().link_texture(player.get(), True)
+    ...
+    del sprite
+    player.release()   # Только после того, как спрайт больше не рисуется
+    ```
+    """
+
+    __slots__ = ('__entries', '__unused', '__unused_bytes', '__bytes_by_kind', '__budget',
+                 '__hits', '__misses', '__evictions')
+
+    def __init__(self, budget: int = DEFAULT_UNUSED_BUDGET):
+        """
+        #### Создает менеджер ресурсов
+
+        ---
+
+        :Args:
+        - budget (int): Максимальный объем ресурсов без ссылок в байтах
+        """
+        # (тип, нормализованный путь) -> запись
+        self.__entries: dict[tuple[str, str], _ResourceEntry] = {}
+        # Записи без ссылок в порядке освобождения (первая - самая давно неиспользуемая)
+        self.__unused: OrderedDict[tuple[str, str], _ResourceEntry] = OrderedDict()
+        self.__unused_bytes: int = 0
+        self.__bytes_by_kind: dict[str, int] = {kind: 0 for kind in RESOURCE_KINDS}
+        self.__budget: int = max(0, int(budget))
+
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__evictions: int = 0
+
+    @staticmethod
+    def __load_texture(path: str) -> tuple[Texture2D, int]:
+        texture = Texture2D()
+        result, _ = texture.load_from_file(path)
+        if not result:
+            raise FileNotFoundError(f"[ {Fore.MAGENTA}Resources{Fore.RESET} ] [ {Fore.RED}error{Fore.RESET} ] Failed to load texture: '{path}'")
+        size = texture.get_size()
+        return texture, size.x * size.y * 4
+
+    @staticmethod
+    def __load_sound_buffer(path: str) -> tuple[SoundBuffer, int]:
+        buffer = SoundBuffer(path)
+        samples = buffer.get_sample_count()
+        if samples == 0:
+            raise FileNotFoundError(f"[ {Fore.MAGENTA}Resources{Fore.RESET} ] [ {Fore.RED}error{Fore.RESET} ] Failed to load sound buffer: '{path}'")
+        return buffer, samples * 2
+
+    @staticmethod
+    def __load_font(path: str) -> tuple[Font, int]:
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"[ {Fore.MAGENTA}Resources{Fore.RESET} ] [ {Fore.RED}error{Fore.RESET} ] Font file not found: '{path}'")
+        return Font(path), os.path.getsize(path)
+
+    def __acquire(self, kind: str, path: str, loader: Callable[[str], tuple[Any, int]]) -> ResourceHandle:
+        key = (kind, os.path.normcase(os.path.abspath(path)))
+        entry = self.__entries.get(key)
+
+        if entry is not None:
+            self.__hits += 1
+            if entry.refs == 0:
+                del self.__unused[key]
+                self.__unused_bytes -= entry.size
+            return ResourceHandle(self, entry)
+
+        self.__misses += 1
+        resource, size = loader(path)
+        entry = _ResourceEntry(key, kind, path, resource, size)
+        self.__entries[key] = entry
+        self.__bytes_by_kind[kind] += size
+        return ResourceHandle(self, entry)
+
+    def _release(self, entry: _ResourceEntry) -> None:
+        """
+        #### Уменьшает счетчик ссылок записи (вызывается из ResourceHandle)
+        """
+        entry.refs -= 1
+        if entry.refs > 0 or self.__entries.get(entry.key) is not entry:
+            return
+        self.__unused[entry.key] = entry
+        self.__unused_bytes += entry.size
+        self.__evict(self.__budget)
+
+    def __evict(self, budget: int) -> None:
+        # Удаляем самые давно освобожденные ресурсы, пока не уложимся в бюджет
+        while self.__unused_bytes > budget and self.__unused:
+            key, entry = self.__unused.popitem(last=False)
+            del self.__entries[key]
+            self.__unused_bytes -= entry.size
+            self.__bytes_by_kind[entry.kind] -= entry.size
+            self.__evictions += 1
+
+    def load_texture(self, path: str) -> ResourceHandle:
+        """
+        #### Возвращает хендл общей текстуры для файла
+
+        ---
+
+        :Args:
+        - path (str): Путь к файлу изображения
+
+        :Returns:
+        - ResourceHandle: Хендл, `get()` которого возвращает Texture2D
+
+        :Raises:
+        - FileNotFoundError: Если текстуру не удалось загрузить
+        """
+        return self.__acquire(RESOURCE_TEXTURE, path, self.__load_texture)
+
+    def load_sound_buffer(self, path: str) -> ResourceHandle:
+        """
+        #### Возвращает хендл общего звукового буфера для файла
+
+        ---
+
+        :Args:
+        - path (str): Путь к аудиофайлу
+
+        :Returns:
+        - ResourceHandle: Хендл, `get()` которого возвращает SoundBuffer
+
+        :Raises:
+        - FileNotFoundError: Если буфер не удалось загрузить
+        """
+        return self.__acquire(RESOURCE_SOUND_BUFFER, path, self.__load_sound_buffer)
+
+    def load_font(self, path: str) -> ResourceHandle:
+        """
+        #### Возвращает хендл общего шрифта для файла
+
+        ---
+
+        :Args:
+        - path (str): Путь к файлу шрифта (TTF/OTF)
+
+        :Returns:
+        - ResourceHandle: Хендл, `get()` которого возвращает Font
+
+        :Raises:
+        - FileNotFoundError: Если файл шрифта не существует
+        """
+        return self.__acquire(RESOURCE_FONT, path, self.__load_font)
+
+    def set_budget(self, budget: int) -> Self:
+        """
+        #### Устанавливает бюджет памяти для ресурсов без ссылок
+
+        ---
+
+        :Args:
+        - budget (int): Максимальный объем в байтах. Лишнее вытесняется сразу
+        """
+        self.__budget = max(0, int(budget))
+        self.__evict(self.__budget)
+        return self
+
+    def get_budget(self) -> int:
+        """
+        #### Возвращает бюджет памяти для ресурсов без ссылок (байты)
+        """
+        return self.__budget
+
+    def collect(self) -> int:
+        """
+        #### Удаляет все ресурсы без ссылок независимо от бюджета
+
+        ---
+
+        :Returns:
+        - int: Количество удаленных ресурсов
+        """
+        before = self.__evictions
+        self.__evict(0)
+        return self.__evictions - before
+
+    def is_loaded(self, path: str, kind: str = RESOURCE_TEXTURE) -> bool:
+        """
+        #### Проверяет, находится ли ресурс в кэше
+        """
+        return (kind, os.path.normcase(os.path.abspath(path))) in self.__entries
+
+    def get_count(self) -> int:
+        """
+        #### Возвращает количество загруженных ресурсов
+        """
+        return len(self.__entries)
+
+    def get_unused_count(self) -> int:
+        """
+        #### Возвращает количество ресурсов без ссылок
+        """
+        return len(self.__unused)
+
+    def get_memory_usage(self, kind: str | None = None) -> int:
+        """
+        #### Возвращает объем памяти ресурсов в байтах
+
+        ---
+
+        :Args:
+        - kind (str | None): Тип ресурса (RESOURCE_*) или None для суммы по всем типам
+        """
+        if kind is None:
+            return sum(self.__bytes_by_kind.values())
+        return self.__bytes_by_kind[kind]
+
+    def get_unused_memory(self) -> int:
+        """
+        #### Возвращает объем памяти ресурсов без ссылок в байтах
+        """
+        return self.__unused_bytes
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        #### Возвращает сводную статистику менеджера
+
+        ---
+
+        :Returns:
+        - dict[str, int]: count, unused, hits, misses, evictions, total_bytes,
+          unused_bytes, budget и объем по каждому типу (`<тип>_bytes`)
+        """
+        stats = {
+            "count": len(self.__entries),
+            "unused": len(self.__unused),
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "evictions": self.__evictions,
+            "total_bytes": self.get_memory_usage(),
+            "unused_bytes": self.__unused_bytes,
+            "budget": self.__budget,
+        }
+        for kind, size in self.__bytes_by_kind.items():
+            stats[f"{kind}_bytes"] = size
+        return stats
+
+    def get_dashboard_lines(self) -> list[str]:
+        """
+        #### Возвращает строки панели памяти для отладочной информации окна
+        """
+        return [
+            f"Resources: {len(self.__entries)} ({len(self.__unused)} unused)  {format_bytes(self.get_memory_usage())}",
+            f"tex {format_bytes(self.__bytes_by_kind[RESOURCE_TEXTURE])}  "
+            f"snd {format_bytes(self.__bytes_by_kind[RESOURCE_SOUND_BUFFER])}  "
+            f"font {format_bytes(self.__bytes_by_kind[RESOURCE_FONT])}",
+            f"LRU {format_bytes(self.__unused_bytes)} / {format_bytes(self.__budget)}  "
+            f"hit {self.__hits} miss {self.__misses} evict {self.__evictions}",
+        ]
+
+
+# Глобальный менеджер ресурсов (отображается в window.view_info())
+RESOURCES: Final[Resources] = Resources()
+
+
+def get_resources() -> Resources:
+    """
+    #### Возвращает глобальный менеджер ресурсов
+    """
+    return RESOURCES
@@ -1,6 +1,6 @@
-from Moon.python.utils import find_library
+from Moon.python.utils import get_native_library
+from Moon.python.Log import get_logger
 import platform
-from colorama import Fore
 import ctypes
 import psutil
 import os
@@ -30,11 +30,10 @@ def get_resource_path(base_dir: str, filename: str, foldername: str):
     path = os.path.join(base_dir, foldername, filename)
     return path
 
-# Загружаем DLL библиотеку
-try:
-    LIB_MOON = ctypes.CDLL(find_library())
-except Exception as e:
-    raise ImportError(f"Failed to load PySGL library: {e}")
+# Общий дескриптор нативной библиотеки (загружается при первом вызове нативной функции)
+LIB_MOON = get_native_library()
+
+LOGGER = get_logger("MoonCore")
 
 LIB_MOON._Glsl_GetVersion.argtypes = []
 LIB_MOON._Glsl_GetVersion.restype = ctypes.c_char_p
@@ -46,21 +45,21 @@ LIB_MOON._Glsl_GetRenderer.restype = ctypes.c_char_p
 def get_gpu_version() -> str | None:
     core_message = LIB_MOON._Glsl_GetVersion().decode()
     if core_message == 'noinit':
-        print(f'[ {Fore.CYAN}MoonCore{Fore.RESET} ] [ {Fore.YELLOW}warning{Fore.RESET} ] The window context is not initialized, so it is not possible to get the version')
+        LOGGER.warning("The window context is not initialized, so it is not possible to get the version")
         return None
     return core_message
 
 def get_gpu_vendor() -> str | None:
     core_message = LIB_MOON._Glsl_GetVendor().decode()
     if core_message == 'noinit':
-        print(f'[ {Fore.CYAN}MoonCore{Fore.RESET} ] [ {Fore.YELLOW}warning{Fore.RESET} ] The window context is not initialized, so it is not possible to get the vendor')
+        LOGGER.warning("The window context is not initialized, so it is not possible to get the vendor")
         return None
     return core_message
 
 def get_gpu_renderer() -> str | None:
     core_message = LIB_MOON._Glsl_GetRenderer().decode()
     if core_message == 'noinit':
-        print(f'[ {Fore.CYAN}MoonCore{Fore.RESET} ] [ {Fore.YELLOW}warning{Fore.RESET} ] The window context is not initialized, so it is not possible to get the renderer')
+        LOGGER.warning("The window context is not initialized, so it is not possible to get the renderer")
         return None
     return core_message
 
@@ -38,6 +38,8 @@
 
 • Clock - высокоточный таймер на C++ (через DLL)
 
+• FramePacer - точное ограничение частоты кадров (сон + спин до дедлайна)
+
 • Timer - простой интервальный таймер
 
 • Глобальный менеджер таймеров (TIMER_BUFFER)
@@ -89,17 +91,16 @@ Copyright (c) 2025 Pavlov Ivan
 import os
 import ctypes
 
-from time import time
-from typing import Generator, Final
+from bisect import bisect_right
+from time import time, perf_counter, sleep
+from typing import Callable, Generator, Final, Self
 
-from Moon.python.utils import find_library, LibraryLoadError
+from Moon.python.utils import get_native_library, LibraryLoadError
 from Moon.python.Types import OptionalIdentifier, Identifier, FunctionOrMethod
+from Moon.python.Log import get_logger
 
-# Загружаем DLL библиотеку
-try:
-    LIB_MOON = ctypes.CDLL(find_library())
-except Exception as e:
-    raise ImportError(f"Failed to load Moon library: {e}")
+# Общий дескриптор нативной библиотеки (загружается при первом вызове нативной функции)
+LIB_MOON = get_native_library()
 
 
 LIB_MOON.createClock.argtypes = [] 
@@ -145,6 +146,212 @@ class Clock:
         return LIB_MOON.getClockElapsedTime(self.__clock_ptr)
 
 
+# ////////////////////////////////////////////////////////////////////////////
+# Параметры FramePacer по умолчанию (секунды)
+# SPIN_THRESHOLD - за сколько до дедлайна прекращается сон и начинается спин
+# MISS_TOLERANCE - опоздание, после которого кадр считается пропустившим дедлайн
+# ////////////////////////////////////////////////////////////////////////////
+DEFAULT_PACER_SPIN_THRESHOLD: Final[float] = 0.0015
+DEFAULT_PACER_MISS_TOLERANCE: Final[float] = 0.001
+
+# Границы корзин гистограммы ошибки пейсинга (миллисекунды опоздания)
+PACING_HISTOGRAM_EDGES: Final[tuple[float, ...]] = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0)
+
+PACER_LOGGER = get_logger("FramePacer")
+
+
+class FramePacer:
+    """
+    Точное ограничение частоты кадров без вертикальной синхронизации.
+
+    Дедлайн каждого кадра считается по монотонным часам (perf_counter) от
+    предыдущего дедлайна, а не от момента вызова, поэтому ошибки не накапливаются.
+    До дедлайна поток спит крупными шагами (time.sleep), а последние
+    spin_threshold секунд крутится в цикле с уступкой процессора (sleep(0)).
+
+    Для каждого кадра запоминается ошибка пейсинга - насколько кадр был выпущен
+    позже дедлайна - и строится гистограмма. Кадры, пришедшие к ожиданию уже
+    после дедлайна (тяжелая логика/рендер), считаются пропущенными.
+
+    Пример:
+        pacer = FramePacer(144)
+        while running:
+            update(); render()
+            pacer.wait()
+            window.display()
+    """
+
+    __slots__ = ('__fps', '__period', '__spin_threshold', '__miss_tolerance', '__deadline',
+                 '__histogram', '__frames', '__missed', '__error_sum', '__max_error', '__last_error',
+                 '__on_missed')
+
+    def __init__(self, fps: float = 60, spin_threshold: float = DEFAULT_PACER_SPIN_THRESHOLD,
+                 miss_tolerance: float = DEFAULT_PACER_MISS_TOLERANCE):
+        """
+        Аргументы:
+            fps (float): Целевая частота кадров (0 или меньше - без ограничения)
+            spin_threshold (float): Длительность спин-хвоста перед дедлайном в секундах
+            miss_tolerance (float): Допустимое опоздание кадра в секундах
+        """
+        self.__fps: float = 0
+        self.__period: float = 0.0
+        self.__spin_threshold = max(0.0, spin_threshold)
+        self.__miss_tolerance = max(0.0, miss_tolerance)
+        self.__deadline: float | None = None
+        self.__on_missed: Callable[[float], None] | None = None
+        self.__histogram: list[int] = [0] * (len(PACING_HISTOGRAM_EDGES) + 1)
+        self.__frames = 0
+        self.__missed = 0
+        self.__error_sum = 0.0
+        self.__max_error = 0.0
+        self.__last_error = 0.0
+        self.set_fps(fps)
+
+    def set_fps(self, fps: float) -> Self:
+        """
+        Устанавливает целевую частоту кадров и сбрасывает дедлайн.
+
+        Аргументы:
+            fps (float): Кадров в секунду (0 или меньше - без ограничения)
+        """
+        self.__fps = fps if fps > 0 else 0
+        self.__period = 1.0 / fps if fps > 0 else 0.0
+        self.__deadline = None
+        return self
+
+    def get_fps(self) -> float:
+        return self.__fps
+
+    def get_period(self) -> float:
+        """
+        Возвращает длительность кадра в секундах (0.0 - без ограничения).
+        """
+        return self.__period
+
+    def set_spin_threshold(self, seconds: float) -> Self:
+        """
+        Устанавливает длительность спин-хвоста. Больше - точнее, но дороже по CPU.
+        """
+        self.__spin_threshold = max(0.0, seconds)
+        return self
+
+    def get_spin_threshold(self) -> float:
+        return self.__spin_threshold
+
+    def set_miss_tolerance(self, seconds: float) -> Self:
+        self.__miss_tolerance = max(0.0, seconds)
+        return self
+
+    def get_miss_tolerance(self) -> float:
+        return self.__miss_tolerance
+
+    def set_on_missed(self, callback: Callable[[float], None] | None) -> Self:
+        """
+        Устанавливает обработчик пропущенного дедлайна.
+
+        Аргументы:
+            callback (Callable[[float], None] | None): Получает опоздание кадра в секундах
+        """
+        self.__on_missed = callback
+        return self
+
+    def reset(self) -> Self:
+        """
+        Сбрасывает дедлайн: следующий wait() начнет отсчет заново (после пауз, загрузок и т.п.).
+        """
+        self.__deadline = None
+        return self
+
+    def wait(self) -> float:
+        """
+        Ждет дедлайна текущего кадра и назначает следующий.
+
+        Возвращает:
+            float: Ошибка пейсинга в секундах (насколько кадр выпущен позже дедлайна)
+        """
+        period = self.__period
+        if period <= 0.0:
+            return 0.0
+
+        now = perf_counter()
+        deadline = self.__deadline
+        if deadline is None:
+            # Первый кадр после запуска или reset(): отсчет от текущего момента
+            self.__deadline = now + period
+            return 0.0
+
+        remaining = deadline - now
+        if remaining > self.__spin_threshold:
+            sleep(remaining - self.__spin_threshold)
+        while perf_counter() < deadline:
+            sleep(0)
+
+        end = perf_counter()
+        error = end - deadline
+        self.__record(error)
+
+        # Следующий дедлайн отсчитывается от текущего, чтобы не копить дрейф;
+        # если отстали больше чем на кадр - пересинхронизируемся, а не догоняем пачкой кадров
+        next_deadline = deadline + period
+        if next_deadline <= end:
+            next_deadline = end + period
+        self.__deadline = next_deadline
+        return error
+
+    def __record(self, error: float) -> None:
+        self.__frames += 1
+        self.__last_error = error
+        self.__error_sum += error
+        if error > self.__max_error:
+            self.__max_error = error
+        self.__histogram[bisect_right(PACING_HISTOGRAM_EDGES, error * 1000.0)] += 1
+
+        if error > self.__miss_tolerance:
+            self.__missed += 1
+            PACER_LOGGER.debug("Missed frame deadline by %.2fms (%d/%d)", error * 1000.0, self.__missed, self.__frames)
+            if self.__on_missed is not None:
+                self.__on_missed(error)
+
+    def reset_stats(self) -> Self:
+        """
+        Обнуляет счетчики кадров, пропусков и гистограмму.
+        """
+        self.__histogram = [0] * (len(PACING_HISTOGRAM_EDGES) + 1)
+        self.__frames = 0
+        self.__missed = 0
+        self.__error_sum = 0.0
+        self.__max_error = 0.0
+        self.__last_error = 0.0
+        return self
+
+    def get_frame_count(self) -> int:
+        return self.__frames
+
+    def get_missed_count(self) -> int:
+        return self.__missed
+
+    def get_last_error(self) -> float:
+        return self.__last_error
+
+    def get_mean_error(self) -> float:
+        return self.__error_sum / self.__frames if self.__frames else 0.0
+
+    def get_max_error(self) -> float:
+        return self.__max_error
+
+    def get_histogram(self) -> list[tuple[str, int]]:
+        """
+        Возвращает гистограмму ошибки пейсинга.
+
+        Возвращает:
+            list[tuple[str, int]]: Пары (подпись корзины в мс, количество кадров),
+            например ("<0.5ms", 120), (">=8ms", 2)
+        """
+        labels = [f"<{edge:g}ms" for edge in PACING_HISTOGRAM_EDGES]
+        labels.append(f">={PACING_HISTOGRAM_EDGES[-1]:g}ms")
+        return list(zip(labels, self.__histogram))
+
+
 class Timer:
     """
     Простой таймер на основе системного времени.
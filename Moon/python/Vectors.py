@@ -17,12 +17,18 @@
   - Нормализация и вычисление длины
   - Поворот и работа с углами
   - Преобразование типов
+  - Операции на месте без промежуточных объектов (set, add_scaled, lerp_to, rotate_about)
 
 ✓ Двумерные целочисленные векторы (Vector2i):
   - Все основные математические операции
   - Преобразование в Vector2f
   - Оптимизированная работа с целыми числами
 
+✓ Пакетные векторы (Vec2Array):
+  - N векторов в одном массиве NumPy (N, 2)
+  - Операции Vec2f над всей популяцией одним вызовом
+  - Элементы - Vec2fView, связанные с массивом
+
 ✓ Утилиты для работы с векторами:
   - Проверка параллельности и перпендикулярности
   - Вычисление углов между векторами
@@ -38,6 +44,8 @@
 
 • typing.Self для type hints
 
+• NumPy (опционально, только для Vec2Array)
+
 ---
 
 == Лицензия MIT ==================================================
@@ -71,6 +79,11 @@ from random import uniform
 from typing import Iterator, Sequence
 from Moon.python.Types import Number
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class Vec2f:
     """
@@ -90,6 +103,8 @@ class Vec2f:
     - Нормализация и работа с длиной вектора
     - Поворот на произвольный угол
     - Преобразование в целочисленный вектор
+    - Операции на месте для горячих циклов: set, add_scaled, lerp_to, rotate_about,
+      rotate_at_factors - не создают промежуточных векторов
     """
 
     __slots__ = ("x", "y")
@@ -656,6 +671,176 @@ class Vec2f:
         y = self.x * sin + self.y * cos
         return Vec2f(x, y)
 
+    # ////////////////////////////////////////////////////////////////////////
+    # Операции на месте без промежуточных векторов
+    # Предназначены для кода, выполняемого каждый кадр: каждая операция меняет
+    # только self и не создает новых Vec2f
+    # ////////////////////////////////////////////////////////////////////////
+
+    def set(self, x: Number, y: Number) -> Self:
+        """
+        #### Устанавливает обе координаты
+
+        ---
+
+        :Args:
+        - x (float | int): Новая X координата
+        - y (float | int): Новая Y координата
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+
+        ---
+
+        :Example:
+        ```python
+        center.set(*view.get_center())  # Вместо center = Vec2f(*view.get_center())
+        ```
+        """
+        self.x = float(x)
+        self.y = float(y)
+        return self
+
+    def add_scaled(self, other: "Vec2T", k: Number) -> Self:
+        """
+        #### Прибавляет вектор, умноженный на число: self += other * k
+
+        ---
+
+        :Args:
+        - other (Vec2T): Прибавляемый вектор
+        - k (float | int): Множитель
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+
+        ---
+
+        :Example:
+        ```python
+        position.add_scaled(speed, delta)  # Вместо position += speed * delta
+        ```
+        """
+        self.x += other.x * k
+        self.y += other.y * k
+        return self
+
+    def lerp_to(self, target: "Vec2T", t: Number) -> Self:
+        """
+        #### Сдвигает вектор к цели на долю t: self += (target - self) * t
+
+        ---
+
+        :Args:
+        - target (Vec2T): Целевой вектор
+        - t (float | int): Доля пути (0 - на месте, 1 - в цели)
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+
+        ---
+
+        :Example:
+        ```python
+        camera_center.lerp_to(player.position, 0.1 * delta)
+        ```
+        """
+        self.x += (target.x - self.x) * t
+        self.y += (target.y - self.y) * t
+        return self
+
+    @staticmethod
+    def rotation_factors(angle: float | int) -> tuple[float, float]:
+        """
+        #### Вычисляет (cos, sin) поворота для rotate_at_factors
+
+        ---
+
+        :Description:
+        - Знак угла такой же, как у rotate_at: rotate_at_factors(*rotation_factors(a))
+          дает тот же результат, что rotate_at(a)
+        - Позволяет посчитать тригонометрию один раз и повернуть много векторов
+
+        ---
+
+        :Args:
+        - angle (float | int): Угол поворота в градусах
+
+        ---
+
+        :Returns:
+        - tuple[float, float]: Косинус и синус поворота
+        """
+        angle = -math.radians(angle)
+        return math.cos(angle), math.sin(angle)
+
+    def rotate_at_factors(self, cos: float, sin: float) -> Self:
+        """
+        #### Поворачивает вектор на месте по заранее вычисленным cos и sin
+
+        ---
+
+        :Args:
+        - cos (float): Косинус поворота (из rotation_factors)
+        - sin (float): Синус поворота (из rotation_factors)
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+
+        ---
+
+        :Example:
+        ```python
+        cos, sin = Vec2f.rotation_factors(step_angle)
+        for _ in range(segments):
+            offset.rotate_at_factors(cos, sin)
+        ```
+        """
+        x = self.x
+        self.x = x * cos - self.y * sin
+        self.y = x * sin + self.y * cos
+        return self
+
+    def rotate_about(self, pivot: "Vec2T", angle: float | int) -> Self:
+        """
+        #### Поворачивает точку на месте вокруг опорной точки
+
+        ---
+
+        :Args:
+        - pivot (Vec2T): Центр поворота
+        - angle (float | int): Угол поворота в градусах (знак как у rotate_at)
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+
+        ---
+
+        :Example:
+        ```python
+        point = Vec2f(2, 1)
+        point.rotate_about(Vec2f(1, 1), 90)  # point теперь (1, 0)
+        ```
+        """
+        angle = -math.radians(angle)
+        cos = math.cos(angle)
+        sin = math.sin(angle)
+        dx = self.x - pivot.x
+        dy = self.y - pivot.y
+        self.x = pivot.x + dx * cos - dy * sin
+        self.y = pivot.y + dx * sin + dy * cos
+        return self
+
     def get_angle(self) -> float:
         """
         #### Возвращает угол вектора в градусах
@@ -834,12 +1019,14 @@ class Vec2f:
         return self
 
     def __imul__(self, scalar: "Number | Vec2T") -> Self:
-        if isinstance(scalar, Vec2TT):
-            self.x *= scalar.x
-            self.y *= scalar.y
-        else:
+        # Умножение на число - самый частый случай, проверяем его без isinstance
+        cls = scalar.__class__
+        if cls is float or cls is int or not isinstance(scalar, Vec2TT):
             self.x *= scalar
             self.y *= scalar
+        else:
+            self.x *= scalar.x
+            self.y *= scalar.y
         return self
 
     def __itruediv__(self, scalar: "Number | Vec2T") -> Self:
@@ -1308,6 +1495,442 @@ type Vec2T = Vec2f | Vec2i              #
 Vec2TT: tuple[Vec2f, Vec2i] = (Vec2f, Vec2i)   #
 # ================================================= +
 
+
+# ////////////////////////////////////////////////////////////////////////////
+# Пакетные векторы (Vec2Array)
+# ////////////////////////////////////////////////////////////////////////////
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("NumPy is required for Vec2Array: pip install numpy")
+
+
+class Vec2fView(Vec2f):
+    """
+    #### Vec2f, читающий и записывающий строку массива Vec2Array
+
+    ---
+
+    :Description:
+    - Возвращается из Vec2Array[i] и при итерации
+    - Является Vec2f: подходит везде, где ожидается вектор
+    - Операции на месте (+=, scale, rotate_at, normalize_at, ...) изменяют массив
+    - Операции, возвращающие новый вектор (+, rotate, normalize, ...), возвращают обычный Vec2f
+    """
+
+    __slots__ = ("__row",)
+
+    def __init__(self, row) -> None:
+        # row - строка массива (N, 2), представление numpy, а не копия
+        self.__row = row
+
+    @property
+    def x(self) -> float:
+        return float(self.__row[0])
+
+    @x.setter
+    def x(self, value: Number) -> None:
+        self.__row[0] = value
+
+    @property
+    def y(self) -> float:
+        return float(self.__row[1])
+
+    @y.setter
+    def y(self, value: Number) -> None:
+        self.__row[1] = value
+
+    def __repr__(self) -> str:
+        return f"Vec2fView({self.x}, {self.y})"
+
+
+class Vec2Array:
+    """
+    #### Массив двумерных векторов для пакетных вычислений
+
+    ---
+
+    :Description:
+    - Хранит N векторов в одном массиве NumPy формы (N, 2)
+    - Поддерживает операции Vec2f (сложение, масштаб, поворот, нормализация, длина,
+      скалярное и векторное произведение, угол, отражение) одним векторизованным вызовом
+    - Операнд может быть числом, Vec2f/Vec2i (для всех элементов), Vec2Array или массивом
+      формы (N,) (по числу на элемент) / (N, 2)
+    - Методы *_at и операторы +=, -=, *=, /= изменяют массив на месте без временных объектов Python
+    - arr[i] возвращает Vec2fView - Vec2f, связанный со строкой массива
+    - arr[срез] возвращает Vec2Array-представление тех же данных
+
+    ---
+
+    :Example:
+    ```python
+    positions = Vec2Array.zeros(10000)
+    velocities = Vec2Array.random(10000).scale(120)
+
+    # Кадр: одна операция на всю популяцию
+    positions.add_scaled(velocities, dt)
+    velocities.rotate_at(90 * dt)
+
+    sprite.set_position(positions[0])
+    ```
+    """
+
+    __slots__ = ("__data",)
+
+    @classmethod
+    def zeros(cls, count: int, dtype=None) -> "Vec2Array":
+        """
+        #### Создает массив из count нулевых векторов
+        """
+        _require_numpy()
+        return cls(np.zeros((count, 2), dtype=dtype or np.float64), copy=False)
+
+    @classmethod
+    def full(cls, count: int, vector: "Vec2T | Sequence[Number]", dtype=None) -> "Vec2Array":
+        """
+        #### Создает массив из count одинаковых векторов
+        """
+        _require_numpy()
+        data = np.empty((count, 2), dtype=dtype or np.float64)
+        data[:] = _vector_operand(vector)
+        return cls(data, copy=False)
+
+    @classmethod
+    def random(cls, count: int) -> "Vec2Array":
+        """
+        #### Создает массив единичных векторов со случайным направлением
+        """
+        _require_numpy()
+        angles = np.random.uniform(0.0, 2.0 * math.pi, count)
+        return cls(np.column_stack((np.cos(angles), np.sin(angles))), copy=False)
+
+    @classmethod
+    def from_vectors(cls, vectors: "Sequence[Vec2T] | Sequence[Sequence[Number]]") -> "Vec2Array":
+        """
+        #### Создает массив из последовательности Vec2f/Vec2i или пар чисел
+        """
+        _require_numpy()
+        data = np.empty((len(vectors), 2), dtype=np.float64)
+        for i, vector in enumerate(vectors):
+            if isinstance(vector, Vec2TT):
+                data[i, 0] = vector.x
+                data[i, 1] = vector.y
+            else:
+                data[i, 0] = vector[0]
+                data[i, 1] = vector[1]
+        return cls(data, copy=False)
+
+    def __init__(self, data=0, copy: bool = True) -> None:
+        """
+        #### Создает массив векторов
+
+        ---
+
+        :Args:
+        - data: Количество векторов (нули), массив формы (N, 2) или последовательность векторов
+        - copy (bool): Копировать ли переданный массив (False - работать с ним напрямую)
+        """
+        _require_numpy()
+        if isinstance(data, int):
+            self.__data = np.zeros((data, 2), dtype=np.float64)
+            return
+        if isinstance(data, Vec2Array):
+            data = data.__data
+        elif not isinstance(data, np.ndarray) and len(data) and isinstance(data[0], Vec2TT):
+            self.__data = Vec2Array.from_vectors(data).__data
+            return
+
+        dtype = None if isinstance(data, np.ndarray) else np.float64
+        array = np.array(data, dtype=dtype) if copy else np.asarray(data, dtype=dtype)
+        if array.ndim == 1 and array.size == 0:
+            array = array.reshape(0, 2)
+        if array.ndim != 2 or array.shape[1] != 2:
+            raise ValueError(f"Vec2Array expects an array of shape (N, 2), got {array.shape}")
+        if not np.issubdtype(array.dtype, np.floating):
+            array = array.astype(np.float64)
+        self.__data = array
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Данные
+    # ////////////////////////////////////////////////////////////////////////
+
+    @property
+    def array(self):
+        """
+        #### Внутренний массив NumPy формы (N, 2) (без копирования)
+        """
+        return self.__data
+
+    @property
+    def x(self):
+        """
+        #### Столбец X (представление, запись изменяет массив)
+        """
+        return self.__data[:, 0]
+
+    @x.setter
+    def x(self, value) -> None:
+        self.__data[:, 0] = value
+
+    @property
+    def y(self):
+        """
+        #### Столбец Y (представление, запись изменяет массив)
+        """
+        return self.__data[:, 1]
+
+    @y.setter
+    def y(self, value) -> None:
+        self.__data[:, 1] = value
+
+    def copy(self) -> "Vec2Array":
+        return Vec2Array(self.__data.copy(), copy=False)
+
+    def to_list(self) -> list[Vec2f]:
+        """
+        #### Копирует векторы в список независимых Vec2f
+        """
+        return [Vec2f(x, y) for x, y in self.__data.tolist()]
+
+    def compress(self, mask) -> "Vec2Array":
+        """
+        #### Возвращает новый массив из элементов, для которых mask истинна (удаление частиц и т.п.)
+        """
+        return Vec2Array(self.__data[np.asarray(mask, dtype=bool)], copy=False)
+
+    def __len__(self) -> int:
+        return self.__data.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Vec2fView(self.__data[index])
+        return Vec2Array(self.__data[index], copy=False)
+
+    def __setitem__(self, index, value) -> None:
+        self.__data[index] = _vector_operand(value)
+
+    def __iter__(self) -> Iterator[Vec2fView]:
+        data = self.__data
+        for i in range(data.shape[0]):
+            yield Vec2fView(data[i])
+
+    def __repr__(self) -> str:
+        return f"Vec2Array(len={len(self)}, dtype={self.__data.dtype})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Vec2Array):
+            return self.__data.shape == other.__data.shape and bool(np.array_equal(self.__data, other.__data))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Арифметика
+    # ////////////////////////////////////////////////////////////////////////
+
+    def __add__(self, other) -> "Vec2Array":
+        return Vec2Array(self.__data + _vector_operand(other), copy=False)
+
+    __radd__ = __add__
+
+    def __sub__(self, other) -> "Vec2Array":
+        return Vec2Array(self.__data - _vector_operand(other), copy=False)
+
+    def __rsub__(self, other) -> "Vec2Array":
+        return Vec2Array(_vector_operand(other) - self.__data, copy=False)
+
+    def __mul__(self, other) -> "Vec2Array":
+        return Vec2Array(self.__data * _scalar_operand(other), copy=False)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other) -> "Vec2Array":
+        return Vec2Array(self.__data / _scalar_operand(other), copy=False)
+
+    def __neg__(self) -> "Vec2Array":
+        return Vec2Array(-self.__data, copy=False)
+
+    def __abs__(self) -> "Vec2Array":
+        return Vec2Array(np.abs(self.__data), copy=False)
+
+    def __iadd__(self, other) -> Self:
+        self.__data += _vector_operand(other)
+        return self
+
+    def __isub__(self, other) -> Self:
+        self.__data -= _vector_operand(other)
+        return self
+
+    def __imul__(self, other) -> Self:
+        self.__data *= _scalar_operand(other)
+        return self
+
+    def __itruediv__(self, other) -> Self:
+        self.__data /= _scalar_operand(other)
+        return self
+
+    def add_scaled(self, other, factor) -> Self:
+        """
+        #### self += other * factor на месте (например, positions.add_scaled(velocities, dt))
+
+        ---
+
+        :Args:
+        - other: Vec2Array, Vec2f или массив (N, 2)
+        - factor: Число или массив (N,) коэффициентов
+        """
+        if np.isscalar(factor):
+            self.__data += _vector_operand(other) * factor
+        else:
+            self.__data += _vector_operand(other) * _scalar_operand(factor)
+        return self
+
+    def scale(self, factor) -> Self:
+        """
+        #### Масштабирует все векторы на месте (число, Vec2f или массив (N,))
+        """
+        self.__data *= _scalar_operand(factor)
+        return self
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Длина, нормализация, поворот
+    # ////////////////////////////////////////////////////////////////////////
+
+    def get_length(self):
+        """
+        #### Длины всех векторов, массив формы (N,)
+        """
+        return np.hypot(self.__data[:, 0], self.__data[:, 1])
+
+    def get_length_squared(self):
+        """
+        #### Квадраты длин всех векторов, массив формы (N,)
+        """
+        data = self.__data
+        return np.einsum("ij,ij->i", data, data)
+
+    def normalize_at(self) -> Self:
+        """
+        #### Нормализует все векторы на месте (нулевые векторы не изменяются)
+        """
+        lengths = self.get_length()
+        lengths[lengths == 0.0] = 1.0
+        self.__data /= lengths[:, None]
+        return self
+
+    def normalize(self) -> "Vec2Array":
+        """
+        #### Возвращает нормализованную копию
+        """
+        return self.copy().normalize_at()
+
+    def set_length(self, length) -> Self:
+        """
+        #### Устанавливает длину всех векторов на месте (число или массив (N,))
+        """
+        self.normalize_at()
+        self.__data *= _scalar_operand(length)
+        return self
+
+    def rotate_at(self, angle) -> Self:
+        """
+        #### Поворачивает все векторы на месте
+
+        ---
+
+        :Args:
+        - angle: Угол в градусах (число или массив (N,)), направление как у Vec2f.rotate_at
+        """
+        radians = -np.radians(angle)
+        cos = np.cos(radians)
+        sin = np.sin(radians)
+        x = self.__data[:, 0].copy()
+        y = self.__data[:, 1]
+        self.__data[:, 0] = x * cos - y * sin
+        self.__data[:, 1] = x * sin + y * cos
+        return self
+
+    def rotate(self, angle) -> "Vec2Array":
+        """
+        #### Возвращает повернутую копию (угол в градусах, число или массив (N,))
+        """
+        return self.copy().rotate_at(angle)
+
+    def get_angle(self):
+        """
+        #### Углы всех векторов в градусах от 0 до 360 (как Vec2f.get_angle), массив (N,)
+        """
+        angles = -np.degrees(np.arctan2(self.__data[:, 1], self.__data[:, 0]))
+        angles[angles < 0] += 360.0
+        return angles
+
+    def set_angle(self, angle) -> Self:
+        """
+        #### Устанавливает угол всех векторов на месте, сохраняя длины
+        """
+        lengths = self.get_length()
+        radians = -np.radians(angle)
+        self.__data[:, 0] = np.cos(radians) * lengths
+        self.__data[:, 1] = np.sin(radians) * lengths
+        return self
+
+    # ////////////////////////////////////////////////////////////////////////
+    # Произведения и отражение
+    # ////////////////////////////////////////////////////////////////////////
+
+    def dot(self, other):
+        """
+        #### Скалярные произведения с Vec2f или Vec2Array, массив (N,)
+        """
+        other = _vector_operand(other)
+        data = self.__data
+        return data[:, 0] * other[..., 0] + data[:, 1] * other[..., 1]
+
+    def cross(self, other):
+        """
+        #### Векторные произведения (в 2D - скаляры) с Vec2f или Vec2Array, массив (N,)
+        """
+        other = _vector_operand(other)
+        data = self.__data
+        return data[:, 0] * other[..., 1] - data[:, 1] * other[..., 0]
+
+    def reflect_at(self, normal) -> Self:
+        """
+        #### Отражает все векторы относительно нормали на месте (Vec2f или Vec2Array нормалей)
+        """
+        normal = _vector_operand(normal)
+        self.__data -= (2.0 * self.dot(normal))[:, None] * normal
+        return self
+
+    def reflect(self, normal) -> "Vec2Array":
+        """
+        #### Возвращает копию, отраженную относительно нормали
+        """
+        return self.copy().reflect_at(normal)
+
+
+def _vector_operand(value):
+    # Приводит операнд к форме, совместимой с массивом (N, 2): Vec2f -> (2,), Vec2Array -> (N, 2)
+    if isinstance(value, Vec2Array):
+        return value.array
+    if isinstance(value, Vec2TT):
+        return np.array((value.x, value.y))
+    return np.asarray(value, dtype=np.float64)
+
+
+def _scalar_operand(value):
+    # Число или Vec2f - как есть/(2,); массив (N,) - столбец (N, 1) для поэлементного умножения
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, Vec2TT):
+        return np.array((value.x, value.y))
+    if isinstance(value, Vec2Array):
+        return value.array
+    array = np.asarray(value, dtype=np.float64)
+    if array.ndim == 1:
+        return array[:, None]
+    return array
+
 class Vec3f(object):
     def __init__(self, x: Number, y: Number, z: Number):
         self.__x = x
@@ -18,7 +18,7 @@
   - Настройка центра и области просмотра
 
 ✓ Комплексная система координат:
-  - Поддержка FloatRect для точного позиционирования
+  - FloatRect - значение на стороне Python, без нативной памяти и финализатора
   - Преобразование координат между системами
   - Гибкая система масштабирования и поворота
 
@@ -30,6 +30,7 @@
 ✓ Готовые интерфейсы:
   - FloatRect - класс прямоугольных областей
   - View - основной класс камеры/области просмотра
+  - ViewState - полное состояние View, читается одним вызовом
   - Контекстные менеджеры для временных изменений
 
 ---
@@ -71,20 +72,17 @@ Copyright (c) 2025 Pavlov Ivan
 import ctypes
 
 from contextlib import contextmanager
-from typing import Self, Optional, Final, final
+from typing import NamedTuple, Self, Optional, Final, final
 
-from Moon.python.utils import find_library, LibraryLoadError
+from Moon.python.utils import get_native_library, LibraryLoadError
 
 @final
 class ViewError(Exception):
     """Ошибка работы с View"""
     pass
 
-# Загружаем DLL библиотеку
-try:
-    LIB_MOON: Final[ctypes.CDLL] = ctypes.CDLL(find_library())
-except Exception as e:
-    raise ImportError(f"Failed to load Moon library: {e}")
+# Общий дескриптор нативной библиотеки (загружается при первом вызове нативной функции)
+LIB_MOON = get_native_library()
 
 ##################################################################
 #                   `C / C++` Bindings                           #
@@ -100,34 +98,9 @@ type FloatRectPtr = ctypes.c_void_p                    #
 type ViewPtr = ctypes.c_void_p   #
 # ============================== +
 
-# FloatRect функции
-LIB_MOON._FloatRect_Create.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
-LIB_MOON._FloatRect_Create.restype = ctypes.c_void_p
-
-LIB_MOON._FloatRect_Delete.argtypes = [ctypes.c_void_p]
-LIB_MOON._FloatRect_Delete.restype = None
-
-LIB_MOON._FloatRect_GetPositionX.argtypes = [ctypes.c_void_p]
-LIB_MOON._FloatRect_GetPositionX.restype = ctypes.c_float
-
-LIB_MOON._FloatRect_GetPositionY.argtypes = [ctypes.c_void_p]
-LIB_MOON._FloatRect_GetPositionY.restype = ctypes.c_float
-
-LIB_MOON._FloatRect_GetWidth.argtypes = [ctypes.c_void_p]
-LIB_MOON._FloatRect_GetWidth.restype = ctypes.c_float
-
-LIB_MOON._FloatRect_GetHeight.argtypes = [ctypes.c_void_p]
-LIB_MOON._FloatRect_GetHeight.restype = ctypes.c_float
-
-LIB_MOON._FloatRect_SetPosition.argtypes = [ctypes.c_void_p, ctypes.c_float, ctypes.c_float]
-LIB_MOON._FloatRect_SetPosition.restype = None
-
-LIB_MOON._FloatRect_SetSize.argtypes = [ctypes.c_void_p, ctypes.c_float, ctypes.c_float]
-LIB_MOON._FloatRect_SetSize.restype = None
-
 # View функции
-LIB_MOON._View_Create.argtypes = [ctypes.c_void_p]
-LIB_MOON._View_Create.restype = ctypes.c_void_p
+LIB_MOON._View_CreateFromRect.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+LIB_MOON._View_CreateFromRect.restype = ctypes.c_void_p
 
 LIB_MOON._View_Delete.argtypes = [ctypes.c_void_p]
 LIB_MOON._View_Delete.restype = None
@@ -156,8 +129,8 @@ LIB_MOON._View_GetHeight.restype = ctypes.c_float
 LIB_MOON._View_Rotate.argtypes = [ctypes.c_void_p, ctypes.c_float]
 LIB_MOON._View_Rotate.restype = None
 
-LIB_MOON._View_Reset.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
-LIB_MOON._View_Reset.restype = None
+LIB_MOON._View_ResetToRect.argtypes = [ctypes.c_void_p, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+LIB_MOON._View_ResetToRect.restype = None
 
 LIB_MOON._View_Move.argtypes = [ctypes.c_void_p, ctypes.c_float, ctypes.c_float]
 LIB_MOON._View_Move.restype = None
@@ -168,12 +141,19 @@ LIB_MOON._View_SetCenter.restype = None
 LIB_MOON._View_SetAngle.argtypes = [ctypes.c_void_p, ctypes.c_float]
 LIB_MOON._View_SetAngle.restype = None
 
-LIB_MOON._View_SetViewport.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
-LIB_MOON._View_SetViewport.restype = None
+LIB_MOON._View_SetViewportRect.argtypes = [ctypes.c_void_p, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+LIB_MOON._View_SetViewportRect.restype = None
 
 LIB_MOON._View_SetSize.argtypes = [ctypes.c_void_p, ctypes.c_float, ctypes.c_float]
 LIB_MOON._View_SetSize.restype = None
 
+LIB_MOON._View_SetTransform.argtypes = [ctypes.c_void_p, ctypes.c_float, ctypes.c_float,
+                                        ctypes.c_float, ctypes.c_float, ctypes.c_float]
+LIB_MOON._View_SetTransform.restype = None
+
+LIB_MOON._View_GetState.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_float)]
+LIB_MOON._View_GetState.restype = None
+
 LIB_MOON._View_Zoom.argtypes = [ctypes.c_void_p, ctypes.c_float]
 LIB_MOON._View_Zoom.restype = None
 
@@ -181,7 +161,7 @@ LIB_MOON._View_Zoom.restype = None
 @final
 class FloatRect:
     """
-    #### Класс прямоугольной области с плавающей точкой
+    #### Прямоугольная область с плавающей точкой (значение на стороне Python)
 
     ---
 
@@ -189,23 +169,27 @@ class FloatRect:
     - Представляет прямоугольную область в 2D пространстве
     - Соответствует sf::FloatRect в SFML
     - Используется для определения областей просмотра и позиционирования
+    - Хранится только в Python: создание не выделяет нативную память и не
+      требует финализатора; в нативный код передается по значению (4 числа)
+      только при вызове View
 
     ---
 
     :Features:
     - Точное позиционирование с плавающей точкой
-    - Валидация размеров и координат
-    - Автоматическое управление памятью
+    - Валидация размеров при создании и set_size()
+    - Проверки пересечения и попадания точки
     - Цепочка вызовов для удобства использования
 
     ---
 
     :Attributes:
-    - _ptr: Указатель на нативный объект FloatRect
-    - _is_valid: Флаг валидности объекта
+    - x, y: Левый верхний угол
+    - w, h: Ширина и высота
     """
 
-    @final
+    __slots__ = ("x", "y", "w", "h")
+
     def __init__(self, x: float, y: float, w: float, h: float) -> None:
         """
         #### Создает новый FloatRect с указанными параметрами
@@ -222,7 +206,6 @@ class FloatRect:
 
         :Raises:
         - ValueError: Если размеры отрицательные
-        - ViewError: Если не удалось создать объект
 
         ---
 
@@ -235,63 +218,11 @@ class FloatRect:
         if w < 0 or h < 0:
             raise ValueError(f"Размеры должны быть неотрицательными: w={w}, h={h}")
 
-        self._ptr = LIB_MOON._FloatRect_Create(float(x), float(y), float(w), float(h))
-        if not self._ptr:
-            raise ViewError("Не удалось создать FloatRect")
-        self._is_valid = True
-
-    @final
-    def _check_valid(self) -> None:
-        """
-        #### Проверяет валидность объекта
-
-        ---
-
-        :Raises:
-        - ViewError: Если объект был удален или поврежден
-        """
-        if not self._is_valid:
-            raise ViewError("FloatRect был удален")
-
-    @final
-    def get_ptr(self) -> FloatRectPtr:
-        """
-        #### Возвращает указатель на нативный объект
-
-        ---
-
-        :Returns:
-        - FloatRectPtr: Указатель для использования в нативном коде
-
-        ---
+        self.x = float(x)
+        self.y = float(y)
+        self.w = float(w)
+        self.h = float(h)
 
-        :Note:
-        - Для внутреннего использования в Moon
-        """
-        self._check_valid()
-        return self._ptr
-
-    @final
-    def __del__(self) -> None:
-        """
-        #### Освобождает ресурсы нативного объекта
-
-        ---
-
-        :Description:
-        - Автоматически вызывается при удалении объекта
-        - Освобождает нативные ресурсы
-        - Безопасно обрабатывает ошибки освобождения
-        """
-        if hasattr(self, '_is_valid') and self._is_valid and hasattr(self, '_ptr'):
-            try:
-                LIB_MOON._FloatRect_Delete(self._ptr)
-            except:
-                pass  # Игнорируем ошибки при удалении
-            finally:
-                self._is_valid = False
-
-    @final
     def get_position(self) -> tuple[float, float]:
         """
         #### Возвращает текущую позицию прямоугольника
@@ -309,13 +240,8 @@ class FloatRect:
         print(f"Позиция: ({x}, {y})")
         ```
         """
-        self._check_valid()
-        return (
-            LIB_MOON._FloatRect_GetPositionX(self._ptr),
-            LIB_MOON._FloatRect_GetPositionY(self._ptr),
-        )
+        return (self.x, self.y)
 
-    @final
     def get_size(self) -> tuple[float, float]:
         """
         #### Возвращает текущие размеры прямоугольника
@@ -333,13 +259,8 @@ class FloatRect:
         print(f"Размер: {width}x{height}")
         ```
         """
-        self._check_valid()
-        return (
-            LIB_MOON._FloatRect_GetWidth(self._ptr),
-            LIB_MOON._FloatRect_GetHeight(self._ptr),
-        )
+        return (self.w, self.h)
 
-    @final
     def set_position(self, x: Optional[float] = None, y: Optional[float] = None) -> Self:
         """
         #### Устанавливает новую позицию прямоугольника
@@ -366,18 +287,12 @@ class FloatRect:
         rect.set_position(50.0, 75.0)
         ```
         """
-        self._check_valid()
-        if x is None and y is None:
-            return self
-
-        current_x, current_y = self.get_position()
-        new_x = float(x) if x is not None else current_x
-        new_y = float(y) if y is not None else current_y
-
-        LIB_MOON._FloatRect_SetPosition(self._ptr, new_x, new_y)
+        if x is not None:
+            self.x = float(x)
+        if y is not None:
+            self.y = float(y)
         return self
 
-    @final
     def set_size(self, w: Optional[float] = None, h: Optional[float] = None) -> Self:
         """
         #### Устанавливает новые размеры прямоугольника
@@ -409,21 +324,53 @@ class FloatRect:
         rect.set_size(150.0, 100.0)
         ```
         """
-        self._check_valid()
-        if w is None and h is None:
-            return self
-
         if (w is not None and w < 0) or (h is not None and h < 0):
             raise ValueError(f"Размеры должны быть неотрицательными: w={w}, h={h}")
 
-        current_w, current_h = self.get_size()
-        new_w = float(w) if w is not None else current_w
-        new_h = float(h) if h is not None else current_h
-
-        LIB_MOON._FloatRect_SetSize(self._ptr, new_w, new_h)
+        if w is not None:
+            self.w = float(w)
+        if h is not None:
+            self.h = float(h)
         return self
 
-    @final
+    def as_tuple(self) -> tuple[float, float, float, float]:
+        """
+        #### Возвращает (x, y, w, h) - в таком виде прямоугольник передается в нативный код
+        """
+        return (self.x, self.y, self.w, self.h)
+
+    def copy(self) -> "FloatRect":
+        return FloatRect(self.x, self.y, self.w, self.h)
+
+    def contains(self, x: float, y: float) -> bool:
+        """
+        #### Проверяет, лежит ли точка внутри прямоугольника
+        """
+        return self.x <= x < self.x + self.w and self.y <= y < self.y + self.h
+
+    def intersects(self, other: "FloatRect") -> bool:
+        """
+        #### Проверяет пересечение с другим прямоугольником
+        """
+        return (self.x < other.x + other.w and other.x < self.x + self.w and
+                self.y < other.y + other.h and other.y < self.y + self.h)
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+        yield self.w
+        yield self.h
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FloatRect):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y and self.w == other.w and self.h == other.h
+
+    def __hash__(self) -> int:
+        # Хэш по значению, согласованный с __eq__: не изменяйте прямоугольник,
+        # пока он используется как ключ словаря или элемент множества
+        return hash((self.x, self.y, self.w, self.h))
+
     def __repr__(self) -> str:
         """
         #### Строковое представление для отладки
@@ -440,14 +387,37 @@ class FloatRect:
         print(rect)  # FloatRect(x=10.0, y=20.0, w=100.0, h=50.0)
         ```
         """
-        if not self._is_valid:
-            return "FloatRect(deleted)"
-        try:
-            x, y = self.get_position()
-            w, h = self.get_size()
-            return f"FloatRect(x={x}, y={y}, w={w}, h={h})"
-        except:
-            return "FloatRect(invalid)"
+        return f"FloatRect(x={self.x}, y={self.y}, w={self.w}, h={self.h})"
+
+
+class ViewState(NamedTuple):
+    """
+    #### Полное состояние View, прочитанное одним нативным вызовом
+
+    ---
+
+    :Fields:
+    - center_x, center_y: Центр области просмотра
+    - width, height: Размер области просмотра
+    - angle: Угол поворота в градусах
+    - viewport_x, viewport_y, viewport_w, viewport_h: Вьюпорт в долях окна (0-1)
+    """
+    center_x: float
+    center_y: float
+    width: float
+    height: float
+    angle: float
+    viewport_x: float
+    viewport_y: float
+    viewport_w: float
+    viewport_h: float
+
+    def get_viewport(self) -> FloatRect:
+        return FloatRect(self.viewport_x, self.viewport_y, self.viewport_w, self.viewport_h)
+
+
+# Количество чисел, которые записывает _View_GetState
+_VIEW_STATE_SIZE: Final[int] = len(ViewState._fields)
 
 
 @final
@@ -510,9 +480,10 @@ class View:
             raise TypeError("float_rect должен быть экземпляром FloatRect")
 
         self._float_rect = float_rect
-        self._ptr = LIB_MOON._View_Create(float_rect.get_ptr())
+        self._ptr = LIB_MOON._View_CreateFromRect(float_rect.x, float_rect.y, float_rect.w, float_rect.h)
         if not self._ptr:
             raise ViewError("Не удалось создать View")
+        self._state_buffer = (ctypes.c_float * _VIEW_STATE_SIZE)()
         self._is_valid = True
         self._owns_ptr = True
 
@@ -568,6 +539,7 @@ class View:
         view = cls.__new__(cls)
         view._float_rect = float_rect
         view._ptr = view_ptr
+        view._state_buffer = (ctypes.c_float * _VIEW_STATE_SIZE)()
         view._is_valid = True
         view._owns_ptr = False  # Не владеем указателем
         return view
@@ -742,7 +714,7 @@ class View:
             raise TypeError("viewport должен быть экземпляром FloatRect")
 
         self._check_valid()
-        LIB_MOON._View_SetViewport(self._ptr, viewport.get_ptr())
+        LIB_MOON._View_SetViewportRect(self._ptr, viewport.x, viewport.y, viewport.w, viewport.h)
         return self
 
     @final
@@ -772,6 +744,45 @@ class View:
         LIB_MOON._View_SetAngle(self._ptr, float(angle))
         return self
 
+    @final
+    def set_transform(self, center_x: float, center_y: float, width: float, height: float, angle: float) -> Self:
+        """
+        #### Устанавливает центр, размер и угол поворота за один нативный вызов
+
+        ---
+
+        :Description:
+        - Эквивалентно set_center() + set_size() + set_angle(), но пересекает
+          границу Python/C++ один раз
+        - Используется камерами, которые хранят состояние в Python и
+          передают в View только итоговое преобразование
+
+        ---
+
+        :Args:
+        - center_x (float): Координата X центра
+        - center_y (float): Координата Y центра
+        - width (float): Ширина области просмотра
+        - height (float): Высота области просмотра
+        - angle (float): Угол поворота в градусах
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+
+        ---
+
+        :Example:
+        ```python
+        view.set_transform(400.0, 300.0, 800.0, 600.0, 0.0)
+        ```
+        """
+        self._check_valid()
+        LIB_MOON._View_SetTransform(self._ptr, float(center_x), float(center_y),
+                                    float(width), float(height), float(angle))
+        return self
+
     @final
     def move(self, offset_x: float, offset_y: float) -> Self:
         """
@@ -800,6 +811,34 @@ class View:
         LIB_MOON._View_Move(self._ptr, float(offset_x), float(offset_y))
         return self
 
+    @final
+    def get_state(self) -> ViewState:
+        """
+        #### Возвращает центр, размер, угол и вьюпорт за один нативный вызов
+
+        ---
+
+        :Description:
+        - Заменяет get_center() + get_size() + get_angle() (5 вызовов через ctypes)
+        - Нативная функция записывает значения в буфер, созданный вместе с View
+
+        ---
+
+        :Returns:
+        - ViewState: Полное состояние области просмотра
+
+        ---
+
+        :Example:
+        ```python
+        state = view.get_state()
+        print(state.center_x, state.center_y, state.angle)
+        ```
+        """
+        self._check_valid()
+        LIB_MOON._View_GetState(self._ptr, self._state_buffer)
+        return ViewState._make(self._state_buffer)
+
     @final
     def get_center(self) -> tuple[float, float]:
         """
@@ -992,7 +1031,7 @@ class View:
             raise TypeError("rectangle должен быть экземпляром FloatRect")
 
         self._check_valid()
-        LIB_MOON._View_Reset(self._ptr, rectangle.get_ptr())
+        LIB_MOON._View_ResetToRect(self._ptr, rectangle.x, rectangle.y, rectangle.w, rectangle.h)
         self._float_rect = rectangle
         return self
 
@@ -1062,9 +1101,7 @@ class View:
         ```
         """
         # Сохраняем текущие параметры
-        old_center = self.get_center()
-        old_size = self.get_size()
-        old_angle = self.get_angle()
+        old = self.get_state()
 
         try:
             # Применяем временные параметры
@@ -1077,6 +1114,4 @@ class View:
             yield self
         finally:
             # Восстанавливаем старые параметры
-            self.set_center(*old_center)
-            self.set_size(*old_size)
-            self.set_angle(old_angle)
+            self.set_transform(old.center_x, old.center_y, old.width, old.height, old.angle)
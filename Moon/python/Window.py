@@ -88,7 +88,7 @@ from typing import overload, Final, final, Self, Any
 
 
 from Moon.python.Colors import *
-from Moon.python.Time import Clock
+from Moon.python.Time import Clock, FramePacer, DEFAULT_PACER_SPIN_THRESHOLD
 from Moon.python.Views import View
 from Moon.python.Types import TwoIntegerList
 from Moon.python.Vectors import Vec2i, Vec2f
@@ -96,24 +96,26 @@ from Moon.python.Inputs import MouseInterface, KeyBoardInterface, Mouse
 
 from Moon.python.Rendering.Text import *                                                                                # pyright: ignore [ reportGeneralTypeIssues ]
 from Moon.python.Rendering.Shapes.Rectangle import *                                                                    # pyright: ignore [ reportGeneralTypeIssues ]
-from Moon.python.Rendering.Shaders import Shader
+from Moon.python.Rendering.Shaders import Shader, SHADER_MANAGER
+from Moon.python.Rendering.AsyncTextures import TEXTURE_LOADER
+from Moon.python.Rendering.Sprites import ANIMATION_CLOCK
 from Moon.python.Rendering.Drawable import *                                                                            # pyright: ignore [ reportGeneralTypeIssues ]
 from Moon.python.Rendering.RenderStates import RenderStates
 
-from Moon.python.utils import find_library, find_module_installation_path
+from Moon.python.utils import get_native_library, find_module_installation_path
+from Moon.python.Log import get_logger
 
 from Moon.python.System import *   # pyright: ignore
 
 
-# Загружаем DLL библиотеку
+# Общий дескриптор нативной библиотеки (загружается при первом вызове нативной функции)
+LIB_MOON = get_native_library()
 
-try:
-    LIB_MOON: Final[ctypes.CDLL] = ctypes.CDLL(find_library())                                                          # pyright: ignore [ reportConstantRedefinition ]
-except Exception as e:
-    raise ImportError(f"Failed to load Moon library: {e}")
+# Логгеры окна (по умолчанию выключены, см. Moon.python.Log)
+MACHINE_LOGGER = get_logger("Machine")
+WINDOW_LOGGER = get_logger("WindowAPI")
 
-print(f"[ {Fore.LIGHTCYAN_EX}Machine{Fore.RESET} ] [ {Fore.GREEN}succes{Fore.RESET} ] Moon started on {Fore.BLACK}{sys.platform}{Fore.RESET} platfrom")
-print(f"[ {Fore.BLACK}Note{Fore.RESET} ] {Fore.BLACK}Supported platforms: win32(64), linux{Fore.RESET}")
+MACHINE_LOGGER.info("Moon started on %s platform (supported platforms: win32(64), linux)", sys.platform)
 
 # Индекс оконного атрибута отвечающего за скругления углов окна (Windows 11+) = +
 DWMWA_WINDOW_CORNER_PREFERENCE: Final[int] = 33                                 #
@@ -123,14 +125,9 @@ DWMWA_WINDOW_CORNER_PREFERENCE: Final[int] = 33
 # ! Не рекомендуется использовать вне предоставленного функционала фреймворка!                                  #
 if sys.platform == 'win32':                                                                                     #
     DWM_API: Final[ctypes.WinDLL] = ctypes.WinDLL("dwmapi")
-    print(f"[ {Fore.CYAN}WindowAPI{Fore.RESET} ] {Fore.YELLOW}'dwmapi.dll'{Fore.RESET} succes found")           #
+    WINDOW_LOGGER.debug("'dwmapi.dll' found")                                                                  #
 # ============================================================================================================= #
 
-if sys.platform == 'linux':
-    X_LIB = ctypes.CDLL(ctypes.util.find_library('X11'))      # pyright: ignore
-    X_RANDR = ctypes.CDLL(ctypes.util.find_library("Xrandr")) # pyright: ignore
-    print(f"[ {Fore.CYAN}LinuxAPI{Fore.RESET} ] {Fore.YELLOW}'X11.dll'{Fore.RESET}, {Fore.YELLOW}'Xrandr.dll'{Fore.RESET} succes found")
-
 
 def get_screen_resolution() -> TwoIntegerList:
     """
@@ -151,7 +148,8 @@ def get_screen_resolution() -> TwoIntegerList:
     if sys.platform == 'linux':
         """Безопасное получение разрешения через Xlib"""
         try:
-            # Загружаем библиотеку
+            # Загружаем библиотеку (ctypes.util импортируется только здесь - он тянет subprocess)
+            import ctypes.util
             xlib_path = ctypes.util.find_library('X11')  # pyright: ignore
             if not xlib_path:
                 return [0, 0]
@@ -186,7 +184,7 @@ def get_screen_resolution() -> TwoIntegerList:
             return (width, height)
 
         except Exception as e:
-            print(f"Ошибка Xlib: {e}")
+            WINDOW_LOGGER.warning("Xlib error: %s", e)
             return [0, 0]
 
     return [0, 0]
@@ -557,7 +555,6 @@ def get_max_displays_refresh_rate() -> int:
     """
     Упрощенная функция для получения информации о дисплеях.
     """
-    print()
     try:
         max_refresh_rate = 0
         i = 0
@@ -586,15 +583,13 @@ def get_max_displays_refresh_rate() -> int:
                 max_refresh_rate = settings.DisplayFrequency
 
         # Выводим информацию
-        print(f"[ {Fore.CYAN}WindowAPI{Fore.RESET} ] Use current screen: {Fore.BLACK}{current_width}x{current_height}{Fore.RESET} @ {Fore.BLACK}{current_refresh_rate}Hz{Fore.RESET}")
-        print(f'[ {Fore.BLACK}Note{Fore.RESET} ] {Fore.BLACK}Use `FPS_VSYNC_CONST` for screen max refresh rate{Fore.RESET}')
-        print()
+        WINDOW_LOGGER.info("Use current screen: %dx%d @ %dHz (use `FPS_VSYNC_CONST` for screen max refresh rate)",
+                           current_width, current_height, current_refresh_rate)
         return max_refresh_rate
 
     except Exception as e:
-        print(f"[ {Fore.CYAN}WindowAPI{Fore.RESET} ] [ {Fore.RED}ERROR{Fore.RESET} ] Failed to get display info: {e}")
-        print(f"[ {Fore.CYAN}WindowAPI{Fore.RESET} ] [ {Fore.YELLOW}WARNING{Fore.RESET} ] FPS will be capped at 60")
-        print()
+        WINDOW_LOGGER.error("Failed to get display info: %s", e)
+        WINDOW_LOGGER.warning("FPS will be capped at 60")
         return 60
 
 # Константа для обозначения неограниченного FPS (представляется большим числом) = +
@@ -1078,6 +1073,9 @@ class Window:
         self.__min_fps_in_fps_history: float = 0
         self.__max_fps_in_fps_history: float = 0
         LIB_MOON._Window_SetWaitFps(self.__window_ptr, int(self.__wait_fps))      # Устанавливаем ожидаемое количество fps
+
+        # Точный пейсер кадров (None - ограничение частоты выполняет нативный setFramerateLimit)
+        self.__frame_pacer: FramePacer | None = None
         # ////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 
 
@@ -1191,13 +1189,8 @@ class Window:
                     except:
                         raise RuntimeError("App Icon path not found")
 
-        if sys.platform == 'win32':
-            print(f'[ {Fore.CYAN}WindowAPI{Fore.RESET} ] [ {Fore.GREEN}succes{Fore.RESET} ] Window created')
-            print(f'    descriptor addr: {Fore.BLACK}{self.__window_descriptor}{Fore.RESET}')
-            print(f'    title: {Fore.YELLOW}"{self.__title}"{Fore.RESET}')
-            print(f"    size: {Fore.BLACK}{self.__width}x{self.__height}{Fore.RESET}")
-            print(f'    style: {Fore.BLACK}{self.__style}{Fore.RESET}')
-            print()
+        WINDOW_LOGGER.info('Window created (descriptor addr: %s, title: "%s", size: %dx%d, style: %s)',
+                           self.__window_descriptor, self.__title, self.__width, self.__height, self.__style)
 
         
 
@@ -2569,6 +2562,22 @@ class Window:
         self.__info_text.set_text(f"Active: {self.__active}")
         self.draw(self.__info_text)
 
+        # Панель памяти менеджера ресурсов (только если приложение его использует:
+        # окно не импортирует Resources само, чтобы не тянуть аудио-модуль при старте)
+        resources_module = sys.modules.get("Moon.python.Resources")
+        if resources_module is not None and resources_module.RESOURCES.get_count() > 0:
+            self.__info_text.set_size(14)
+            self.__info_text.set_color(self.__info_text_color_gray)
+            for i, line in enumerate(resources_module.RESOURCES.get_dashboard_lines()):
+                self.__info_text.set_text(line)
+                self.__info_text.set_position(10, 75 + 150 + i * 16)
+                self.draw(self.__info_text)
+            self.__info_text.set_size(18)
+
+        # Панель пейсинга кадров: пропуски дедлайнов и гистограмма опоздания кадров
+        if self.__frame_pacer is not None:
+            self.__draw_pacing_info(320, 100)
+
         # График фреймтайма
         graph_width = 300
         graph_height = 100
@@ -2875,8 +2884,11 @@ class Window:
         window.set_wait_fps(FPS_UNLIMIT_CONST)
         ```
         """
-        LIB_MOON._Window_SetWaitFps(self.__window_ptr, int(fps))
         self.__wait_fps = fps
+        if self.__frame_pacer is not None:
+            self.__frame_pacer.set_fps(fps if fps < FPS_UNLIMIT_CONST else 0)
+        else:
+            LIB_MOON._Window_SetWaitFps(self.__window_ptr, int(fps))
         return self
 
     @final
@@ -2905,6 +2917,80 @@ class Window:
         """
         return self.__wait_fps
 
+    @final
+    def set_frame_pacing(self, value: bool = True, spin_threshold: float = DEFAULT_PACER_SPIN_THRESHOLD) -> Self:
+        """
+        #### Включает точный пейсинг кадров вместо нативного ограничения FPS
+
+        ---
+
+        :Description:
+        - Дедлайн кадра считается по монотонным часам, окно спит до ~1.5 мс перед ним,
+          а остаток дожидается в спин-цикле с уступкой процессора
+        - Ожидание выполняется в display() непосредственно перед выводом кадра
+        - Частота берется из set_wait_fps(); нативный setFramerateLimit отключается
+        - Пропущенные дедлайны и гистограмма ошибки выводятся в view_info()
+        - Спин-хвост держит ядро CPU занятым ~spin_threshold секунд на кадр
+
+        ---
+
+        :Args:
+        - value (bool): True - включить пейсер, False - вернуть нативное ограничение
+        - spin_threshold (float): Длительность спин-хвоста в секундах
+
+        ---
+
+        :Returns:
+        - Self: Возвращает self для цепочки вызовов
+
+        ---
+
+        :Example:
+        ```python
+        # Стабильные 144 кадра без вертикальной синхронизации
+        window.set_vertical_sync(False).set_wait_fps(144).set_frame_pacing(True)
+        ```
+        """
+        if value:
+            fps = self.__wait_fps if self.__wait_fps < FPS_UNLIMIT_CONST else 0
+            if self.__frame_pacer is None:
+                self.__frame_pacer = FramePacer(fps, spin_threshold)
+            else:
+                self.__frame_pacer.set_fps(fps).set_spin_threshold(spin_threshold)
+            LIB_MOON._Window_SetWaitFps(self.__window_ptr, 0)
+        else:
+            self.__frame_pacer = None
+            LIB_MOON._Window_SetWaitFps(self.__window_ptr, int(self.__wait_fps))
+        return self
+
+    @final
+    def is_frame_pacing_enabled(self) -> bool:
+        """
+        #### Проверяет, включен ли точный пейсинг кадров
+        """
+        return self.__frame_pacer is not None
+
+    @final
+    def get_frame_pacer(self) -> FramePacer | None:
+        """
+        #### Возвращает пейсер кадров окна (статистика пропусков и гистограмма ошибки)
+
+        ---
+
+        :Returns:
+        - FramePacer | None: Пейсер или None, если пейсинг выключен
+
+        ---
+
+        :Example:
+        ```python
+        pacer = window.get_frame_pacer()
+        if pacer is not None:
+            print(pacer.get_missed_count(), pacer.get_histogram())
+        ```
+        """
+        return self.__frame_pacer
+
     @final
     def get_render_time(self, factor: float = 1) -> float:
         """
@@ -3163,8 +3249,52 @@ class Window:
         if self.__DYNAMIC_UPDATE:
             self.dynamic_resize()
 
+        # Общие часы анимаций продвигаются один раз за кадр
+        ANIMATION_CLOCK.tick()
+
+        # Горячая перезагрузка шейдеров между кадрами (только в режиме разработки)
+        if SHADER_MANAGER.is_hot_reload_enabled():
+            SHADER_MANAGER.poll()
+
+        # Загрузка в видеопамять текстур, декодированных фоновыми потоками (с бюджетом времени на кадр)
+        if TEXTURE_LOADER.has_pending_uploads():
+            TEXTURE_LOADER.upload()
+
         return True
 
+    def __draw_pacing_info(self, x: float, y: float) -> None:
+        """
+        #### Рисует статистику FramePacer в отладочной панели
+
+        ---
+        :Description:
+        - Частота, число пропущенных дедлайнов, среднее и максимальное опоздание
+        - Гистограмма ошибки пейсинга: по полосе на корзину, длина пропорциональна доле кадров
+        """
+        pacer = self.__frame_pacer
+        self.__info_text.set_size(14)
+        self.__info_text.set_color(self.__info_text_color_gray)
+        self.__info_text.set_text(f"Pacing: {pacer.get_fps():.0f}Hz  missed: {pacer.get_missed_count()}/{pacer.get_frame_count()}")
+        self.__info_text.set_position(x, y)
+        self.draw(self.__info_text)
+        self.__info_text.set_text(f"error avg: {pacer.get_mean_error()*1000:.2f}ms  max: {pacer.get_max_error()*1000:.2f}ms")
+        self.__info_text.set_position(x, y + 16)
+        self.draw(self.__info_text)
+
+        histogram = pacer.get_histogram()
+        peak = max(count for _, count in histogram) or 1
+        bar_width = 120
+        for i, (label, count) in enumerate(histogram):
+            row_y = y + 38 + i * 14
+            self.__info_text.set_text(label)
+            self.__info_text.set_position(x, row_y - 3)
+            self.draw(self.__info_text)
+            self.__info_bg.set_size(max(1, bar_width * count / peak), 10)
+            self.__info_bg.set_position(x + 55, row_y)
+            self.__info_bg.set_color(self.__fps_line_color_red if i >= len(histogram) - 3 else self.__fps_line_color_green)
+            self.draw(self.__info_bg)
+        self.__info_text.set_size(18)
+
     def __update_fps_history(self):
         """
         #### Обновляет историю значений FPS
@@ -3340,6 +3470,8 @@ class Window:
         window.display()
         ```
         """
+        if self.__frame_pacer is not None:
+            self.__frame_pacer.wait()
         LIB_MOON._Window_Display(self.__window_ptr)
 
     @final
@@ -1,5 +1,47 @@
-from colorama import Fore
+import importlib
+from typing import Any
+
+from Moon.python.Log import MOON_LOGGER
 
 __version__ = '0.1.3'
 
-print(f"Welcome to: <{Fore.BLUE}Moon{Fore.RESET} {__version__}> by {Fore.LIGHTMAGENTA_EX}Pavlov Ivan{Fore.RESET}.")
\ No newline at end of file
+MOON_LOGGER.info("Welcome to: <Moon %s> by Pavlov Ivan.", __version__)
+
+
+# Подмодули загружаются по первому обращению (PEP 562): `import Moon.python`
+# не импортирует окно, шейдеры, шрифты и нативную библиотеку
+_SUBMODULES: frozenset[str] = frozenset({
+    "Audio", "Colors", "Engine", "Inputs", "Log", "Math", "Microphone", "Rendering", "Resources",
+    "System", "Threader", "Time", "Types", "Vectors", "Views", "Window", "utils",
+})
+
+# Часто используемые имена: имя -> подмодуль, из которого оно берется при первом обращении
+# (имена, совпадающие с подмодулями, например Window, всегда означают подмодуль)
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "WindowEvents": "Window",
+    "Color": "Colors",
+    "Vec2f": "Vectors",
+    "Vec2i": "Vectors",
+    "Clock": "Time",
+    "View": "Views",
+    "Sound": "Audio",
+    "SoundBuffer": "Audio",
+    "Music": "Audio",
+    "get_resources": "Resources",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(f"{__name__}.{_LAZY_ATTRIBUTES[name]}"), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Кэшируем, чтобы следующие обращения не проходили через __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _SUBMODULES | set(_LAZY_ATTRIBUTES))
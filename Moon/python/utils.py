@@ -1,11 +1,17 @@
 import os
-import inspect
 import site
 import sys
-from typing import List
+import ctypes
+import threading
+from typing import Any
 from Moon import DLL_FOUND_PATH, DLL_LOCAL_FOUND_PATH, DLL_MODULE_FOUND_PATH
 from colorama import Fore
 
+from Moon.python.Log import get_logger
+
+# Логгер поиска и загрузки нативной библиотеки
+LOGGER = get_logger("LibLoader")
+
 def get_base_path():
     d = os.path.dirname(__file__)
     d = os.path.dirname(d)
@@ -21,9 +27,281 @@ class LibraryLoadError(Exception):
     pass
 
 
+class NativeFunction:
+    """
+    #### Отложенная ссылка на функцию нативной библиотеки
+
+    ---
+
+    :Description:
+    - Запоминает argtypes/restype/errcheck, объявленные при импорте модуля
+    - При первом вызове загружает библиотеку, получает настоящую функцию ctypes
+      и применяет к ней сохраненные объявления
+    """
+
+    __slots__ = ('__library', '__name', '__specs', '__function')
+
+    def __init__(self, library: "NativeLibrary", name: str):
+        self.__library = library
+        self.__name = name
+        self.__specs: dict[str, Any] = {}
+        self.__function: Any = None
+
+    def __get_spec(self, key: str) -> Any:
+        if self.__function is not None:
+            return getattr(self.__function, key)
+        return self.__specs.get(key)
+
+    def __set_spec(self, key: str, value: Any) -> None:
+        self.__specs[key] = value
+        if self.__function is not None:
+            setattr(self.__function, key, value)
+
+    @property
+    def argtypes(self) -> Any:
+        return self.__get_spec('argtypes')
+
+    @argtypes.setter
+    def argtypes(self, value: Any) -> None:
+        self.__set_spec('argtypes', value)
+
+    @property
+    def restype(self) -> Any:
+        return self.__get_spec('restype')
+
+    @restype.setter
+    def restype(self, value: Any) -> None:
+        self.__set_spec('restype', value)
+
+    @property
+    def errcheck(self) -> Any:
+        return self.__get_spec('errcheck')
+
+    @errcheck.setter
+    def errcheck(self, value: Any) -> None:
+        self.__set_spec('errcheck', value)
+
+    def resolve(self) -> Any:
+        """
+        #### Возвращает настоящую функцию ctypes (загружая библиотеку при необходимости)
+        """
+        if self.__function is None:
+            function = getattr(self.__library.load(), self.__name)
+            for key, value in self.__specs.items():
+                setattr(function, key, value)
+            self.__function = function
+            self.__library._bind(self.__name, function)
+        return self.__function
+
+    def __call__(self, *args: Any) -> Any:
+        function = self.__function
+        if function is None:
+            function = self.resolve()
+        return function(*args)
+
+    def __repr__(self) -> str:
+        return f"<NativeFunction {self.__name} {'resolved' if self.__function is not None else 'pending'}>"
+
+
+class NativeLibrary:
+    """
+    #### Общий лениво загружаемый дескриптор нативной библиотеки Moon
+
+    ---
+
+    :Description:
+    - Все модули Moon используют один экземпляр (get_native_library())
+    - Поиск и загрузка библиотеки происходят при первом вызове нативной функции,
+      а не при импорте модулей
+    - Объявления `LIB_MOON.<функция>.argtypes/restype` при импорте только запоминаются
+    - После первого вызова атрибут функции заменяется настоящей функцией ctypes,
+      поэтому последующие вызовы не проходят через обертку
+
+    ---
+
+    :Example:
+    ```python
+    LIB_MOON = get_native_library()
+    LIB_MOON._Clock_Create.restype = ctypes.c_void_p   # библиотека еще не загружена
+    ptr = LIB_MOON._Clock_Create()                       # загрузка и привязка здесь
+    ```
+    """
+
+    def __init__(self):
+        self.__handle: ctypes.CDLL | None = None
+        self.__path: str | None = None
+        self.__required: list[str] = []
+        self.__lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        # Вызывается только для еще не объявленных имен: любое такое имя - функция библиотеки
+        if name.startswith('__') and name.endswith('__'):
+            raise AttributeError(name)
+        function = NativeFunction(self, name)
+        self.__dict__[name] = function
+        return function
+
+    def _bind(self, name: str, function: Any) -> None:
+        """
+        #### Заменяет отложенную ссылку настоящей функцией ctypes
+        """
+        self.__dict__[name] = function
+
+    def require(self, *names: str) -> None:
+        """
+        #### Регистрирует функции, наличие которых проверяется при загрузке библиотеки
+        """
+        self.__required.extend(names)
+        if self.__handle is not None:
+            self.__check_required()
+
+    def __check_required(self) -> None:
+        for name in self.__required:
+            if not hasattr(self.__handle, name):
+                raise LibraryLoadError(f"Required function {name} not found in library")
+
+    def load(self) -> ctypes.CDLL:
+        """
+        #### Загружает библиотеку (один раз) и возвращает дескриптор ctypes
+
+        ---
+
+        :Raises:
+            LibraryLoadError: Если библиотеку не удалось найти или загрузить
+        """
+        if self.__handle is not None:
+            return self.__handle
+        with self.__lock:
+            if self.__handle is None:
+                path = find_library()
+                try:
+                    handle = ctypes.CDLL(path)
+                except OSError as e:
+                    raise LibraryLoadError(f"Failed to load Moon library: {e}")
+                self.__path = path
+                self.__handle = handle
+                self.__check_required()
+        return self.__handle
+
+    def is_loaded(self) -> bool:
+        """
+        #### Проверяет, загружена ли библиотека
+        """
+        return self.__handle is not None
+
+    def get_path(self) -> str | None:
+        """
+        #### Возвращает путь к загруженной библиотеке (None, если еще не загружена)
+        """
+        return self.__path
+
+
+LIB_MOON_LOADER: NativeLibrary = NativeLibrary()
+
+
+def get_native_library() -> NativeLibrary:
+    """
+    #### Возвращает общий лениво загружаемый дескриптор нативной библиотеки Moon
+    """
+    return LIB_MOON_LOADER
+
+
+# ////////////////////////////////////////////////////////////////////////////
+# Поиск нативной библиотеки
+# ////////////////////////////////////////////////////////////////////////////
+LIBRARY_PATH_ENV: str = "MOON_LIBRARY_PATH"         # Явный путь к библиотеке (имеет наивысший приоритет)
+LIBRARY_CACHE_ENV: str = "MOON_LIBRARY_CACHE"       # Путь к файлу кэша (пустая строка отключает кэш)
+
+if sys.platform == 'win32':
+    LIBRARY_FILE_NAMES: tuple[str, ...] = ('Moon.dll',)
+elif sys.platform == 'darwin':
+    LIBRARY_FILE_NAMES = ('libMoon.dylib', 'Moon.so')
+else:
+    LIBRARY_FILE_NAMES = ('Moon.so',)
+
+# Каталог пакета Moon, вычисленный от расположения этого файла (Moon/python/utils.py)
+PACKAGE_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Исторические пути (зависят от текущей директории), проверяются после каталогов пакета и кэша
+_LEGACY_LIBRARY_PATHS: list[str] = [DLL_FOUND_PATH, DLL_SYSTEM_PATH, DLL_LOCAL_FOUND_PATH, DLL_MODULE_FOUND_PATH]
+
+
+def get_library_cache_path() -> str | None:
+    """
+    #### Возвращает путь к файлу кэша найденной библиотеки (None - кэш отключен)
+    """
+    override = os.environ.get(LIBRARY_CACHE_ENV)
+    if override is not None:
+        return override or None
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'moon', 'library_path')
+
+
+def _read_cached_library_path() -> str | None:
+    cache_path = get_library_cache_path()
+    if cache_path is None:
+        return None
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as file:
+            package_dir, _, path = file.read().strip().partition('\n')
+    except OSError:
+        return None
+    # Кэш общий для всех установок: запись другой копии пакета (другой venv или checkout)
+    # игнорируется, чтобы не загрузить чужую, возможно несовместимую библиотеку
+    if package_dir != PACKAGE_DIR:
+        return None
+    # Кэш действителен, только пока файл библиотеки существует
+    return path if path and os.path.isfile(path) else None
+
+
+def _write_cached_library_path(path: str) -> None:
+    cache_path = get_library_cache_path()
+    if cache_path is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as file:
+            file.write(f"{PACKAGE_DIR}\n{path}")
+    except OSError:
+        # Кэш - только ускорение: нет прав на запись - просто ищем заново в следующий раз
+        pass
+
+
+def get_library_candidates() -> list[str]:
+    """
+    #### Возвращает пути, проверяемые при поиске библиотеки, в порядке приоритета
+
+    ---
+
+    :Description:
+    - Каталоги `libs` и `dlls` внутри пакета Moon (от `__file__`, не зависят от текущей директории)
+    - Исторические пути относительно текущей директории
+    """
+    candidates = [
+        os.path.join(PACKAGE_DIR, folder, name)
+        for folder in ('libs', 'dlls')
+        for name in LIBRARY_FILE_NAMES
+    ]
+    candidates += _LEGACY_LIBRARY_PATHS
+    return candidates
+
+
 def find_library() -> str:
     """
-    #### Поиск пути к нативной библиотеке BUILD.dll
+    #### Поиск пути к нативной библиотеке Moon
+
+    ---
+
+    :Description:
+    - Порядок: переменная окружения MOON_LIBRARY_PATH, каталоги пакета, файл кэша
+      (если он записан этой же копией пакета и путь из него еще существует),
+      исторические относительные пути
+    - Путь, найденный вне пакета, сохраняется в кэш вместе с каталогом пакета
+    - Рекурсивный обход каталогов не выполняется: для диагностики вызовите
+      `diagnose_library_location()`
 
     ---
 
@@ -35,50 +313,73 @@ def find_library() -> str:
     :Raises:
         LibraryLoadError: Если библиотека не найдена
     """
-    # Получаем информацию о вызывающем файле
-    caller_frame = inspect.stack()[1]
-    caller_filename = os.path.basename(caller_frame.filename)
+    override = os.environ.get(LIBRARY_PATH_ENV)
+    if override:
+        if os.path.isfile(override):
+            return os.path.abspath(override)
+        raise LibraryLoadError(f"{LIBRARY_PATH_ENV} points to a missing file: '{override}'")
+
+    candidates = get_library_candidates()
+    package_candidates = len(candidates) - len(_LEGACY_LIBRARY_PATHS)
+
+    # Библиотека, поставляемая вместе с пакетом, всегда важнее кэша
+    for lib_path in candidates[:package_candidates]:
+        if os.path.isfile(lib_path):
+            LOGGER.info("Library found at: '%s'", lib_path)
+            return lib_path
 
-    # Список возможных путей к библиотеке, в порядке приоритета
-    possible_paths: List[str] = [
-        DLL_FOUND_PATH,
-        DLL_SYSTEM_PATH,
-        DLL_LOCAL_FOUND_PATH,
-        DLL_MODULE_FOUND_PATH,
-    ]
+    cached = _read_cached_library_path()
+    if cached is not None:
+        return cached
 
-    # Поиск по указанным путям
-    for lib_path in possible_paths:
-        if os.path.exists(lib_path):
-            print(f"[ {Fore.CYAN}LibLoader{Fore.RESET} ] Library {Fore.BLUE}{caller_filename}{Fore.RESET} found at: {Fore.YELLOW}'{lib_path}'{Fore.RESET}")
-            return lib_path
+    for lib_path in candidates[package_candidates:]:
+        if os.path.isfile(lib_path):
+            found = os.path.abspath(lib_path)
+            _write_cached_library_path(found)
+            LOGGER.info("Library found at: '%s'", found)
+            return found
 
-    # Если не найдено по указанным путям, ищем в директории установки модуля
-    print(f"[ {Fore.YELLOW}warning{Fore.RESET} ] Library {Fore.BLUE}{caller_filename}{Fore.RESET} not found in standard paths, searching in module installation directory...")
+    raise LibraryLoadError(
+        f"Moon library not found in any of the expected locations: {candidates}\n"
+        f"Set {LIBRARY_PATH_ENV} to the library path, or call "
+        f"Moon.python.utils.diagnose_library_location() to search the module and current directories."
+    )
 
-    # Получаем путь к установленному модулю Moon
-    module_path = find_module_installation_path('Moon')
 
-    if module_path:
-        print(f"\t\tSearching in module path: {Fore.YELLOW}'{module_path}'{Fore.RESET}")
-        found_path = recursive_find_library(module_path, caller_filename)
-        if found_path:
-            return found_path
+def diagnose_library_location(search_cwd: bool = True) -> str | None:
+    """
+    #### Диагностический рекурсивный поиск библиотеки (медленный, вызывается только явно)
 
-    # Если не найдено в директории модуля, ищем рекурсивно от текущей директории
-    print(f"[ {Fore.YELLOW}warning{Fore.RESET} ] Library {Fore.BLUE}{caller_filename}{Fore.RESET} not found in module directory, starting recursive search from current directory...")
+    ---
 
-    start_dir = os.getcwd()
-    found_path = recursive_find_library(start_dir, caller_filename)
+    :Description:
+    - Ищет библиотеку в каталоге установленного модуля и (опционально) в текущей директории
+    - Печатает найденный путь и подсказку для MOON_LIBRARY_PATH, в кэш не записывает
 
-    if found_path:
-        return found_path
+    ---
 
-    # Если ни один из путей не сработал
-    raise LibraryLoadError(
-        f"Moon library (Moon.dll) not found in any of the expected locations: {possible_paths}\n"
-        f"Also not found in module installation directory or during recursive search from: {start_dir}"
-    )
+    :Args:
+        search_cwd (bool): Искать также в текущей директории.
+
+    :Returns:
+        str | None: Найденный путь или None
+    """
+    directories = []
+    module_path = find_module_installation_path('Moon')
+    if module_path:
+        directories.append(module_path)
+    if search_cwd:
+        directories.append(os.getcwd())
+
+    for directory in directories:
+        print(f"[ {Fore.CYAN}LibLoader{Fore.RESET} ] Searching recursively in: {Fore.YELLOW}'{directory}'{Fore.RESET}")
+        found_path = recursive_find_library(directory, 'diagnostics')
+        if found_path:
+            print(f"[ {Fore.CYAN}LibLoader{Fore.RESET} ] Set {LIBRARY_PATH_ENV}='{os.path.abspath(found_path)}' to use it")
+            return found_path
+
+    print(f"[ {Fore.YELLOW}warning{Fore.RESET} ] Moon library was not found in: {directories}")
+    return None
 
 
 def find_module_installation_path(module_name: str) -> str | None:
@@ -138,8 +439,6 @@ def recursive_find_library(start_dir: str, caller_filename: str, max_depth: int
     :param max_depth: Максимальная глубина рекурсии
     :return: Путь к найденной библиотеке
     """
-    from colorama import Fore
-
     # Ищем файлы с подходящими именами
     target_names = ['Moon.dll', 'Moon.so', 'libMoon.dylib']
 
@@ -153,7 +452,7 @@ def recursive_find_library(start_dir: str, caller_filename: str, max_depth: int
             for file in files:
                 if file in target_names:
                     found_path = os.path.join(root, file)
-                    print(f"[ {Fore.CYAN}LibLoader{Fore.RESET} ] Library found recursively at: {found_path}")
+                    LOGGER.debug("Library found recursively at: %s", found_path)
                     return found_path
 
         # Если на этой глубине не найдено, продолжаем поиск на следующей глубине
@@ -46,6 +46,11 @@ extern "C" {
     MOON_API int _SoundBuffer_GetSampleRate(SoundBufferPtr buffer) {
         return buffer->getSampleRate();
     }
+
+    // Общее количество 16-битных сэмплов во всех каналах
+    MOON_API unsigned long long _SoundBuffer_GetSampleCount(SoundBufferPtr buffer) {
+        return buffer->getSampleCount();
+    }
 }
 
 extern "C" {
@@ -104,17 +109,56 @@ extern "C" {
     MOON_API int _Sound_GetStatus(SoundPtr sound) {
         return sound->getStatus();
     }
+
+    // Источник без буфера - голос пула AudioMixer
+    MOON_API SoundPtr _Sound_CreateEmpty() {
+        return new sf::Sound();
+    }
+
+    MOON_API void _Sound_SetBuffer(SoundPtr sound, SoundBufferPtr buffer) {
+        sound->setBuffer(*buffer);
+    }
+
+    // Запуск голоса одним вызовом: буфер, параметры и позиция
+    MOON_API void _Sound_Start(SoundPtr sound, SoundBufferPtr buffer, float volume, float pitch, bool loop,
+                               bool relative, float x, float y, float z) {
+        sound->stop();
+        sound->setBuffer(*buffer);
+        sound->setVolume(volume);
+        sound->setPitch(pitch);
+        sound->setLoop(loop);
+        sound->setRelativeToListener(relative);
+        sound->setPosition(x, y, z);
+        sound->play();
+    }
+
+    // Статусы нескольких источников за один вызов (0 - Stopped, 1 - Paused, 2 - Playing)
+    MOON_API void _Sound_GetStatuses(SoundPtr* sounds, int count, int* out) {
+        for (int i = 0; i < count; i++) {
+            out[i] = sounds[i]->getStatus();
+        }
+    }
 }
 
 extern "C" {
     typedef sf::Music* MusicPtr;
 
+    // sf::Music открывает файл и читает его небольшими порциями в своем потоке.
+    // При ошибке открытия возвращается nullptr
     MOON_API MusicPtr _Music_Create(const char* path) {
         MusicPtr music = new sf::Music();
-        music->openFromFile(path);
+        if (!music->openFromFile(path)) {
+            cout << "Music: " << path << " error opening stream" << endl;
+            delete music;
+            return nullptr;
+        }
         return music;
     }
 
+    MOON_API void _Music_Destroy(MusicPtr music) {
+        delete music;
+    }
+
     MOON_API void _Music_Play(MusicPtr music) {
         music->play();
     }
@@ -142,4 +186,43 @@ extern "C" {
     MOON_API void _Music_SetAttenuation(MusicPtr music, float attenuation) {
         music->setAttenuation(attenuation);
     }
+
+    MOON_API int _Music_GetStatus(MusicPtr music) {
+        return music->getStatus();
+    }
+
+    MOON_API float _Music_GetDuration(MusicPtr music) {
+        return music->getDuration().asSeconds();
+    }
+
+    MOON_API float _Music_GetPlayingOffset(MusicPtr music) {
+        return music->getPlayingOffset().asSeconds();
+    }
+
+    MOON_API void _Music_SetPlayingOffset(MusicPtr music, float seconds) {
+        music->setPlayingOffset(sf::seconds(seconds));
+    }
+
+    // Участок [offset, offset + length), который повторяется при включенном цикле
+    MOON_API void _Music_SetLoopPoints(MusicPtr music, float offset, float length) {
+        music->setLoopPoints(sf::Music::TimeSpan(sf::seconds(offset), sf::seconds(length)));
+    }
+
+    MOON_API void _Music_GetLoopPoints(MusicPtr music, float* out) {
+        sf::Music::TimeSpan span = music->getLoopPoints();
+        out[0] = span.offset.asSeconds();
+        out[1] = span.length.asSeconds();
+    }
+
+    MOON_API void _Music_SetRelativeToListener(MusicPtr music, bool relative) {
+        music->setRelativeToListener(relative);
+    }
+
+    MOON_API int _Music_GetChannelsCount(MusicPtr music) {
+        return music->getChannelCount();
+    }
+
+    MOON_API int _Music_GetSampleRate(MusicPtr music) {
+        return music->getSampleRate();
+    }
 }
\ No newline at end of file
@@ -20,6 +20,9 @@
 #include "SFML/Graphics/Texture.hpp"
 
 #include "SFML/Graphics/Glsl.hpp"
+#include "SFML/Graphics/RenderTexture.hpp"
+#include "SFML/Window/Context.hpp"
+#include "SFML/Window/GlResource.hpp"
 #include "SFML/OpenGL.hpp"
 
 #include <cstddef>
@@ -112,6 +115,102 @@ extern "C" {
     }
 }
 
+// ================================================================================
+//                 ПРЯМОЙ ДОСТУП К UNIFORM ЧЕРЕЗ LOCATION
+// ================================================================================
+// sf::Shader ищет location по имени при каждом setUniform (std::string + map).
+// Для кэшированных uniform-хендлов Python получает location один раз, а затем
+// передает только число. Функции OpenGL 2.0 загружаются через sf::Context,
+// так как системные заголовки GL объявляют только OpenGL 1.1.
+// ================================================================================
+
+#ifndef APIENTRY
+    #define APIENTRY
+#endif
+
+#ifndef GL_CURRENT_PROGRAM
+    #define GL_CURRENT_PROGRAM 0x8B8D
+#endif
+
+typedef GLint (APIENTRY *MoonGlGetUniformLocation)(GLuint program, const char* name);
+typedef void  (APIENTRY *MoonGlUseProgram)(GLuint program);
+typedef void  (APIENTRY *MoonGlUniform1f)(GLint location, GLfloat x);
+typedef void  (APIENTRY *MoonGlUniform2f)(GLint location, GLfloat x, GLfloat y);
+typedef void  (APIENTRY *MoonGlUniform4f)(GLint location, GLfloat x, GLfloat y, GLfloat z, GLfloat w);
+typedef void  (APIENTRY *MoonGlUniform1i)(GLint location, GLint x);
+typedef void  (APIENTRY *MoonGlUniform2i)(GLint location, GLint x, GLint y);
+
+// Типы значений uniform (должны совпадать с UniformKind в Shaders.py)
+enum MoonUniformKind {
+    MOON_UNIFORM_FLOAT = 0,
+    MOON_UNIFORM_INT   = 1,
+    MOON_UNIFORM_BOOL  = 2,
+    MOON_UNIFORM_VEC2  = 3,
+    MOON_UNIFORM_IVEC2 = 4,
+    MOON_UNIFORM_COLOR = 5
+};
+
+// Значение location, когда прямой доступ к OpenGL недоступен
+static const int MOON_UNIFORM_LOCATION_UNSUPPORTED = -2;
+
+struct MoonUniformFunctions {
+    bool loaded = false;
+    bool available = false;
+    MoonGlGetUniformLocation getUniformLocation = nullptr;
+    MoonGlUseProgram useProgram = nullptr;
+    MoonGlUniform1f uniform1f = nullptr;
+    MoonGlUniform2f uniform2f = nullptr;
+    MoonGlUniform4f uniform4f = nullptr;
+    MoonGlUniform1i uniform1i = nullptr;
+    MoonGlUniform2i uniform2i = nullptr;
+};
+
+static MoonUniformFunctions g_uniform_functions;
+
+static const void* moonGetGlFunction(const char* name, const char* arb_name) {
+    const void* function = reinterpret_cast<const void*>(sf::Context::getFunction(name));
+    if (!function) function = reinterpret_cast<const void*>(sf::Context::getFunction(arb_name));
+    return function;
+}
+
+static bool moonLoadUniformFunctions() {
+    MoonUniformFunctions& gl = g_uniform_functions;
+    if (gl.loaded) return gl.available;
+
+    gl.getUniformLocation = (MoonGlGetUniformLocation)moonGetGlFunction("glGetUniformLocation", "glGetUniformLocationARB");
+    gl.useProgram = (MoonGlUseProgram)moonGetGlFunction("glUseProgram", "glUseProgramObjectARB");
+    gl.uniform1f = (MoonGlUniform1f)moonGetGlFunction("glUniform1f", "glUniform1fARB");
+    gl.uniform2f = (MoonGlUniform2f)moonGetGlFunction("glUniform2f", "glUniform2fARB");
+    gl.uniform4f = (MoonGlUniform4f)moonGetGlFunction("glUniform4f", "glUniform4fARB");
+    gl.uniform1i = (MoonGlUniform1i)moonGetGlFunction("glUniform1i", "glUniform1iARB");
+    gl.uniform2i = (MoonGlUniform2i)moonGetGlFunction("glUniform2i", "glUniform2iARB");
+
+    gl.available = gl.getUniformLocation && gl.useProgram && gl.uniform1f && gl.uniform2f &&
+                   gl.uniform4f && gl.uniform1i && gl.uniform2i;
+    // Если контекст еще не создан, повторим попытку при следующем вызове
+    gl.loaded = gl.available;
+    return gl.available;
+}
+
+static void moonApplyUniform(int location, int kind, const float* v) {
+    MoonUniformFunctions& gl = g_uniform_functions;
+    switch (kind) {
+        case MOON_UNIFORM_FLOAT: gl.uniform1f(location, v[0]); break;
+        case MOON_UNIFORM_INT:   gl.uniform1i(location, (GLint)v[0]); break;
+        case MOON_UNIFORM_BOOL:  gl.uniform1i(location, v[0] != 0.f); break;
+        case MOON_UNIFORM_VEC2:  gl.uniform2f(location, v[0], v[1]); break;
+        case MOON_UNIFORM_IVEC2: gl.uniform2i(location, (GLint)v[0], (GLint)v[1]); break;
+        case MOON_UNIFORM_COLOR: gl.uniform4f(location, v[0], v[1], v[2], v[3]); break;
+        default: break;
+    }
+}
+
+// Делает контекст OpenGL активным на время вызова (как sf::Shader::setUniform).
+// TransientContextLock - защищенный класс sf::GlResource, поэтому доступ через наследника
+struct MoonGlContextLock : sf::GlResource {
+    TransientContextLock lock;
+};
+
 // ================================================================================
 //                               ШЕЙДЕРЫ (SHADER)
 // ================================================================================
@@ -234,7 +333,70 @@ extern "C" {
 
     // Установка цветовой униформы (преобразование в нормализованные значения)
     MOON_API void _Shader_SetUniformColor(ShaderPtr shader, char* name, int r, int g, int b, int a) {
-        shader->setUniform(name, sf::Glsl::Vec4(r/256.0f, g/256.0f, b/256.0f, a/256.0f));
+        shader->setUniform(name, sf::Glsl::Vec4(r/255.0f, g/255.0f, b/255.0f, a/255.0f));
+    }
+
+    // Установка текстуры как униформы (по указателю, без копирования текстуры)
+    MOON_API void _Shader_SetUniformTexturePtr(ShaderPtr shader, char* name, sf::Texture* texture) {
+        shader->setUniform(name, *texture);
+    }
+
+    // Установка текстуры RenderTexture как униформы
+    MOON_API void _Shader_SetUniformRenderTexture(ShaderPtr shader, char* name, sf::RenderTexture* texture) {
+        shader->setUniform(name, texture->getTexture());
+    }
+
+    // Привязка uniform к текстуре рисуемого объекта (sf::Shader::CurrentTexture)
+    MOON_API void _Shader_SetUniformCurrentTexture(ShaderPtr shader, char* name) {
+        shader->setUniform(name, sf::Shader::CurrentTexture);
+    }
+
+    // ================================================================================
+    //                   UNIFORM ПО КЭШИРОВАННОМУ LOCATION
+    // ================================================================================
+
+    // Получение location uniform-переменной (-1 - не найдена, -2 - прямой доступ недоступен)
+    MOON_API int _Shader_GetUniformLocation(ShaderPtr shader, char* name) {
+        MoonGlContextLock context_lock;
+        if (!moonLoadUniformFunctions()) return MOON_UNIFORM_LOCATION_UNSUPPORTED;
+        GLuint program = shader->getNativeHandle();
+        if (!program) return MOON_UNIFORM_LOCATION_UNSUPPORTED;
+        return g_uniform_functions.getUniformLocation(program, name);
+    }
+
+    // Установка одной uniform по location (values - до 4 компонент)
+    MOON_API void _Shader_SetUniformAt(ShaderPtr shader, int location, int kind, float x, float y, float z, float w) {
+        if (location < 0) return;
+        MoonGlContextLock context_lock;
+        if (!moonLoadUniformFunctions()) return;
+
+        GLint previous = 0;
+        glGetIntegerv(GL_CURRENT_PROGRAM, &previous);
+        g_uniform_functions.useProgram(shader->getNativeHandle());
+
+        const float values[4] = {x, y, z, w};
+        moonApplyUniform(location, kind, values);
+
+        g_uniform_functions.useProgram((GLuint)previous);
+    }
+
+    // Пакетная установка uniform: программа привязывается один раз на весь пакет.
+    // values содержит по 4 компоненты на каждую uniform.
+    MOON_API void _Shader_SetUniformsAt(ShaderPtr shader, int* locations, int* kinds, float* values, size_t count) {
+        if (count == 0) return;
+        MoonGlContextLock context_lock;
+        if (!moonLoadUniformFunctions()) return;
+
+        GLint previous = 0;
+        glGetIntegerv(GL_CURRENT_PROGRAM, &previous);
+        g_uniform_functions.useProgram(shader->getNativeHandle());
+
+        for (size_t i = 0; i < count; ++i) {
+            if (locations[i] < 0) continue;
+            moonApplyUniform(locations[i], kinds[i], values + i * 4);
+        }
+
+        g_uniform_functions.useProgram((GLuint)previous);
     }
 
     // ================================================================================
@@ -204,6 +204,78 @@ extern "C" {
         return text->getGlobalBounds().height;
     }
 
+    // ==========================================================================================
+    // ФУНКЦИИ ДЛЯ ИЗМЕРЕНИЯ ГЛИФОВ ШРИФТА
+    // ==========================================================================================
+
+    /**
+     * @brief Вычисляет горизонтальное смещение пера для строки без создания sf::Text
+     * @param font Указатель на шрифт
+     * @param str Строка для измерения (в кодировке UTF-8)
+     * @param size Размер шрифта в пикселях
+     * @param bold Использовать жирное начертание глифов
+     * @param letterSpacing Коэффициент межбуквенного расстояния (как в sf::Text)
+     * @return Суммарная ширина строки с учетом кернинга
+     */
+    MOON_API double getFontTextAdvance(FontPtr font, const char* str, int size, bool bold, float letterSpacing) {
+        std::string std_str(str);
+        sf::String string = sf::String::fromUtf8(std_str.begin(), std_str.end());
+
+        // Межбуквенный интервал вычисляется так же, как внутри sf::Text::ensureGeometryUpdate
+        float whitespaceWidth = font->getGlyph(L' ', size, bold).advance;
+        float spacing = (whitespaceWidth / 3.f) * (letterSpacing - 1.f);
+
+        double advance = 0.0;
+        sf::Uint32 previous = 0;
+        for (std::size_t i = 0; i < string.getSize(); ++i) {
+            sf::Uint32 current = string[i];
+            advance += font->getKerning(previous, current, size);
+            advance += font->getGlyph(current, size, bold).advance + spacing;
+            previous = current;
+        }
+        return advance;
+    }
+
+    /**
+     * @brief Записывает метрики каждого символа строки за один вызов
+     * @param font Указатель на шрифт
+     * @param str Строка (в кодировке UTF-8)
+     * @param size Размер шрифта в пикселях
+     * @param bold Использовать жирное начертание глифов
+     * @param letterSpacing Коэффициент межбуквенного расстояния (как в sf::Text)
+     * @param out Массив пар (кернинг с предыдущим символом, продвижение с интервалом)
+     * @param capacity Максимум символов, помещающихся в out
+     * @return Количество записанных символов
+     */
+    MOON_API int getFontGlyphMetrics(FontPtr font, const char* str, int size, bool bold, float letterSpacing,
+                                     float* out, int capacity) {
+        std::string std_str(str);
+        sf::String string = sf::String::fromUtf8(std_str.begin(), std_str.end());
+
+        float whitespaceWidth = font->getGlyph(L' ', size, bold).advance;
+        float spacing = (whitespaceWidth / 3.f) * (letterSpacing - 1.f);
+
+        int count = 0;
+        sf::Uint32 previous = 0;
+        for (std::size_t i = 0; i < string.getSize() && count < capacity; ++i, ++count) {
+            sf::Uint32 current = string[i];
+            out[count * 2] = font->getKerning(previous, current, size);
+            out[count * 2 + 1] = font->getGlyph(current, size, bold).advance + spacing;
+            previous = current;
+        }
+        return count;
+    }
+
+    /**
+     * @brief Возвращает рекомендуемое расстояние между строками
+     * @param font Указатель на шрифт
+     * @param size Размер шрифта в пикселях
+     * @return Межстрочный интервал в пикселях
+     */
+    MOON_API float getFontLineSpacing(FontPtr font, int size) {
+        return font->getLineSpacing(size);
+    }
+
     // ==========================================================================================
     // ФУНКЦИИ ДЛЯ ИЗМЕНЕНИЯ СВОЙСТВ ТЕКСТА
     // ==========================================================================================
@@ -36,6 +36,27 @@
     #define MOON_API
 #endif
 
+// Растягивает текстуру на всю цель рендеринга в пиксельных координатах.
+// Текущий вид цели восстанавливается после отрисовки.
+static void moonDrawTextureStretched(sf::RenderTarget& target, const sf::Texture& texture,
+                                     sf::Shader* shader, bool blend) {
+    const sf::View previous = target.getView();
+    const sf::Vector2f size(target.getSize());
+    const sf::Vector2u texture_size = texture.getSize();
+    if (texture_size.x == 0 || texture_size.y == 0) return;
+
+    target.setView(sf::View(sf::FloatRect(0.f, 0.f, size.x, size.y)));
+
+    sf::Sprite sprite(texture);
+    sprite.setScale(size.x / texture_size.x, size.y / texture_size.y);
+
+    sf::RenderStates states(blend ? sf::BlendAlpha : sf::BlendNone);
+    states.shader = shader;
+    target.draw(sprite, states);
+
+    target.setView(previous);
+}
+
 // ================================================================================
 //                         RENDER TEXTURE (ОФФСКРИННЫЙ РЕНДЕРИНГ)
 // ================================================================================
@@ -129,6 +150,13 @@ extern "C" {
         return new sf::Texture(texture->getTexture());
     }
 
+    // Отрисовка содержимого другой RenderTexture на всю площадь цели (проход постобработки).
+    // shader может быть nullptr; при blend == false пиксели цели перезаписываются.
+    MOON_API void
+    _RenderTexture_DrawRenderTexture(RenderTexturePtr target, RenderTexturePtr source, sf::Shader* shader, bool blend) {
+        moonDrawTextureStretched(*target, source->getTexture(), shader, blend);
+    }
+
     // Удаление объекта RenderTexture и освобождение памяти
     MOON_API void
     _RenderTexture_Delete(RenderTexturePtr texture) {
@@ -198,6 +226,21 @@ extern "C" {
         texture->swap(*texture2);
     }
 
+    // Создание пустой текстуры заданного размера
+    MOON_API bool _Texture_Create(TexturePtr texture, int width, int height) {
+        return texture->create(width, height);
+    }
+
+    // Загрузка изображения в область текстуры (без пересоздания текстуры)
+    MOON_API void _Texture_UpdateFromImage(TexturePtr texture, ImagePtr image, int x, int y) {
+        texture->update(*image, x, y);
+    }
+
+    // Загрузка сырых RGBA-пикселей в область текстуры
+    MOON_API void _Texture_UpdateFromPixels(TexturePtr texture, const sf::Uint8* pixels, int width, int height, int x, int y) {
+        texture->update(pixels, width, height, x, y);
+    }
+
     // Создание текстуры из области существующей текстуры
     MOON_API TexturePtr _Texture_SubTexture(TexturePtr texture, int x, int y, int w, int h) {
         // Создаем спрайт для отрисовки части текстуры
@@ -392,6 +435,38 @@ extern "C" {
     MOON_API bool _Image_Save(ImagePtr image, char* file_name) {
         return image->saveToFile(file_name);
     }
+
+    MOON_API void _Image_Create(ImagePtr image, int width, int height, int r, int g, int b, int a) {
+        image->create(width, height, sf::Color(r, g, b, a));
+    }
+
+    // Копирует width * height * 4 байт RGBA во внутренний буфер изображения
+    MOON_API void _Image_CreateFromPixels(ImagePtr image, int width, int height, const sf::Uint8* pixels) {
+        image->create(width, height, pixels);
+    }
+
+    // Указатель на внутренний буфер RGBA (действителен до пересоздания или удаления изображения)
+    MOON_API sf::Uint8* _Image_GetPixelsPtr(ImagePtr image) {
+        return const_cast<sf::Uint8*>(image->getPixelsPtr());
+    }
+
+    // Декодирование не требует OpenGL-контекста, поэтому безопасно вызывается из фоновых потоков
+    MOON_API bool _Image_LoadFromFile(ImagePtr image, char* file_name) {
+        return image->loadFromFile(file_name);
+    }
+
+    MOON_API int _Image_GetSizeX(ImagePtr image) {
+        return image->getSize().x;
+    }
+
+    MOON_API int _Image_GetSizeY(ImagePtr image) {
+        return image->getSize().y;
+    }
+
+    // Загрузка в видеопамять: вызывать только из потока рендеринга
+    MOON_API bool _Texture_LoadFromImage(TexturePtr texture, ImagePtr image) {
+        return texture->loadFromImage(*image);
+    }
 }
 
 // ================================================================================
@@ -108,6 +108,11 @@ extern "C" {
         return view;
     }
 
+    // Создание нового вида по прямоугольнику, переданному по значению
+    MOON_API ViewPtr _View_CreateFromRect(float left, float top, float width, float height) {
+        return new sf::View(sf::FloatRect(left, top, width, height));
+    }
+
     // Удаление вида и освобождение памяти
     MOON_API void _View_Delete(ViewPtr view) {
         delete view;
@@ -152,6 +157,23 @@ extern "C" {
         return view->getSize().y;
     }
 
+    // Получение всего состояния вида за один вызов
+    // out: center_x, center_y, width, height, angle, viewport_left, viewport_top, viewport_width, viewport_height
+    MOON_API void _View_GetState(ViewPtr view, float* out) {
+        const sf::Vector2f& center = view->getCenter();
+        const sf::Vector2f& size = view->getSize();
+        const sf::FloatRect& viewport = view->getViewport();
+        out[0] = center.x;
+        out[1] = center.y;
+        out[2] = size.x;
+        out[3] = size.y;
+        out[4] = view->getRotation();
+        out[5] = viewport.left;
+        out[6] = viewport.top;
+        out[7] = viewport.width;
+        out[8] = viewport.height;
+    }
+
     // ================================================================================
     //                   ПРЕОБРАЗОВАНИЯ И ОПЕРАЦИИ ВИДА
     // ================================================================================
@@ -180,6 +202,11 @@ extern "C" {
         view->reset(*rect);
     }
 
+    // Сброс вида по прямоугольнику, переданному по значению
+    MOON_API void _View_ResetToRect(ViewPtr view, float left, float top, float width, float height) {
+        view->reset(sf::FloatRect(left, top, width, height));
+    }
+
     // Установка центра вида
     MOON_API void _View_SetCenter(ViewPtr view, float x, float y) {
         view->setCenter(x, y);
@@ -195,10 +222,22 @@ extern "C" {
         view->setViewport(*rect);
     }
 
+    // Установка области просмотра по прямоугольнику, переданному по значению
+    MOON_API void _View_SetViewportRect(ViewPtr view, float left, float top, float width, float height) {
+        view->setViewport(sf::FloatRect(left, top, width, height));
+    }
+
     // Установка размера вида
     MOON_API void _View_SetSize(ViewPtr view, float w, float h) {
         view->setSize(w, h);
     }
+
+    // Установка центра, размера и угла поворота вида за один вызов
+    MOON_API void _View_SetTransform(ViewPtr view, float center_x, float center_y, float w, float h, float angle) {
+        view->setCenter(center_x, center_y);
+        view->setSize(w, h);
+        view->setRotation(angle);
+    }
 }
 
 // ================================================================================
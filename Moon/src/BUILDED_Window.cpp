@@ -17,6 +17,8 @@
 
 
 #include <SFML/Graphics/RenderWindow.hpp>
+#include <SFML/Graphics/RenderTexture.hpp>
+#include <SFML/Graphics/Sprite.hpp>
 #include <SFML/Graphics/RenderTarget.hpp>
 #include <SFML/Graphics/RenderStates.hpp>
 #include <SFML/Graphics/Shader.hpp>
@@ -63,6 +65,11 @@ typedef sf::Shader* ShaderPtr;
 #define CONST_CONTEX_SETTINGS_PTR const ContextSettingsPtr contextSettings
 #define CONST_COLOR_RGBA const int r, const int g, const int b, const int a
 #define CONST_WINDOW_PTR const WindowPtr window
+// Растягивает текстуру на всю цель рендеринга (определена в BUILDED_Textures.cpp;
+// все BUILDED_*.cpp собираются в один Moon.cpp, поэтому здесь только объявление)
+static void moonDrawTextureStretched(sf::RenderTarget& target, const sf::Texture& texture,
+                                     sf::Shader* shader, bool blend);
+
 // ================================================================================
 //                        НАСТРОЙКИ КОНТЕКСТА OPENGL
 // ================================================================================
@@ -295,6 +302,11 @@ extern "C" {
         window->draw(*drawable, shader);
     }
 
+    // Отрисовка содержимого RenderTexture на всю площадь окна (вывод цепочки постобработки)
+    MOON_API void _Window_DrawRenderTexture(CONST_WINDOW_PTR, sf::RenderTexture* source, ShaderPtr shader, bool blend) {
+        moonDrawTextureStretched(*window, source->getTexture(), shader, blend);
+    }
+
     // ================================================================================
     //                      УПРАВЛЕНИЕ ВИДОМ (VIEW/КАМЕРОЙ)
     // ================================================================================